@@ -1,406 +1,684 @@
 import numpy as np
-import sympy as sp
-import matplotlib.pyplot as plt
-from matplotlib.ticker import StrMethodFormatter
 from constructores.Node import Node
 from constructores.Element import Element
 from constructores.Support import Support
-from constructores.PointLoad import PointLoad
-from constructores.DistributedLoad import DistributedLoad
-from constructores.TriangularLoad import TriangularLoad
-
-
-fig, ax = plt.subplots()
-# no mostrar ejes
-ax.yaxis.set_visible(False)
-ax.spines["left"].set_visible(False)
-ax.spines["top"].set_visible(False)
-ax.spines["right"].set_visible(False)
-# ajustar tamaño de ticks
-ax.tick_params(axis="x", labelsize=8)
-ax.tick_params(axis="y", labelsize=8)
+from constructores.LoadTable import LoadTable, POINT, DISTRIBUTED, TRIANGULAR, TRAPEZOIDAL, MOMENT
+from constructores.NodeTable import NodeTable, SUPPORT, POINT_LOAD, DISTRIBUTED_LOAD_L, DISTRIBUTED_LOAD_R, TRIANGULAR_LOAD_MIN, TRIANGULAR_LOAD_MAX, TRAPEZOIDAL_LOAD_MIN, TRAPEZOIDAL_LOAD_MAX, MOMENT_LOAD, ROLE_NAMES
+from constructores.BeamResult import BeamResult
+from analisis.polinomios import element_coefficients, add_contribution, insert_node, remove_node
+from analisis.registro import LOAD_TYPES, load_groups, point_group, couple_group, resultants
+from analisis.muestreo import sample_elements, sample_counts, linspace_elements, integer_stations, valid_sampling
+from analisis.influencia import influence_lines
+from analisis.carga_movil import moving_load_envelope, exact_envelope
+from analisis.combinaciones import case_names, case_results, combination_matrix
+from analisis.simbolico import signature, node_values, compiled_diagrams, evaluate_compiled, ordered_nodes
+from analisis.rigidez import stiffness_reactions
+
+
+# matplotlib y sympy se importan solo al dibujar o al usar symbolic=True (el cálculo numérico no los necesita)
+# crear figura de la viga (rows > 1: paneles apilados con eje x compartido, devuelve un array de ejes)
+def new_figure(rows=1):
+    import matplotlib.pyplot as plt
+    if rows == 1:
+        fig, ax = plt.subplots()
+    else:
+        fig, ax = plt.subplots(rows, 1, sharex=True, figsize=(6.4, 2.4 * rows))
+        fig.subplots_adjust(top=0.95, bottom=0.05, hspace=0.35)
+    for panel in np.atleast_1d(ax):
+        # no mostrar ejes
+        panel.yaxis.set_visible(False)
+        panel.spines["left"].set_visible(False)
+        panel.spines["top"].set_visible(False)
+        panel.spines["right"].set_visible(False)
+        # ajustar tamaño de ticks
+        panel.tick_params(axis="x", labelsize=8)
+        panel.tick_params(axis="y", labelsize=8)
+    return fig, ax
 
 
 # creador de viga
 class Beam:
-    def __init__(self, L):
+    def __init__(self, L, EI=1):
         self.L = L  # largo viga
-        self.node_id = 1  # contador node id
-        self.nodes = []  # [Node] lista con nodos
-        self.eq_nodes = []  # [Node] lista con nodos equivalentes
+        self.EI = EI  # rigidez a flexión E·I (con EI=1 la deflexión queda multiplicada por EI)
         self.supports = []  # [Support] lista con apoyos
-        self.cargas = []  # [Load] lista con cargas
-        self.eq_cargas = []  # [Load] lista con cargas transformadas a puntuales
-        self.forces = []  # [Load] lista con todas las fuerzas (cargas y reacciones)
-        self.eq_forces = []  # [Load] lista con todas la fuerzas equivalentes en cargas puntuales
-        self.reactions_count = 0  # contador reactions()
-        self.calculate_count = 0  # contador calculate()
-        self.elements = []  # [Element] lista con elementos
+        self.loads = LoadTable()  # tabla columnar con cargas
+        self.node_table = NodeTable()  # tabla columnar con nodos (sin agrupar)
+        self.sum_loads = 0.0  # ΣP de las cargas (se actualiza al agregar, mover o quitar cargas)
+        self.sum_moments = 0.0  # ΣP·x de las cargas
+        self.x_nodes = None  # array con posiciones de los nodos agrupados (después de calculate())
+        self.node_count = None  # nodos de la tabla de nodos en cada posición de x_nodes
+        self.node_groups = None  # (orden, inicios) de los grupos de nodos coincidentes en node_table
+        self.nodes_dirty = True  # node_groups desactualizado (nodos agregados, movidos o quitados)
+        self.coef = None  # (V, M) coeficientes de los polinomios de cada elemento (se actualizan solo donde cambian)
+        # con coef calculado, x_nodes y node_count se actualizan al editar cargas sin volver a ordenar la tabla de nodos
+        self.sampling = 100  # política de muestreo por defecto (ver analisis/muestreo.py)
+        self.combinations = {}  # {nombre: {caso: factor}} combinaciones de carga
+        self.objetos = {}  # cache de objetos creados desde las tablas ("cargas", "nodes", "elements")
+        self.fig = None  # figura de matplotlib (se crea al dibujar)
+        self.ax = None
+
+    # [Load] lista con cargas (vistas de la tabla de cargas)
+    @property
+    def cargas(self):
+        cargas = self.objetos.get("cargas")
+        if cargas is None:
+            cargas = [LOAD_TYPES[kind].view(self.loads, i) for i, kind in enumerate(self.loads["kind"])]
+            self.objetos["cargas"] = cargas
+        return cargas
+
+    # [Node] lista con nodos (antes de calculate(): sin agrupar en orden de creación; después: agrupados y ordenados)
+    @property
+    def nodes(self):
+        if self.x_nodes is None:
+            return self.component_nodes(np.arange(len(self.node_table)))
+        if not self.calculate():
+            return None
+        self.group_nodes()
+        if "nodes" not in self.objetos:
+            self.objetos["nodes"] = self.merge_nodes()
+        return self.objetos["nodes"]
+
+    # [Node] nodos sin agrupar ordenados por posición
+    @property
+    def node_components(self):
+        if not self.calculate():
+            return None
+        self.group_nodes()
+        return self.component_nodes(self.node_groups[0])
+
+    # [Element] lista con elementos
+    @property
+    def elements(self):
+        if not self.calculate():
+            return None
+        if "elements" not in self.objetos:
+            self.objetos["elements"] = self.build_elements(self.nodes)
+        return self.objetos["elements"]
+
+    # agregar nodo a la tabla de nodos
+    def add_node(self, role, pos, ref):
+        return self.node_table.append(pos=pos, role=role, ref=ref)
 
     # agregar apoyos
     def add_support(self, support_type, pos):
         if pos < 0 or pos > self.L: print(f"\n! Error: Posición incorrecta para apoyo en posición {pos}.\n")
         else:
-            objeto = Support(support_type, pos, self.node_id)
+            objeto = Support(support_type, pos, len(self.node_table) + 1)
             self.supports.append(objeto)
-            self.nodes.append(Node("support", pos, self.node_id, objeto))
-            self.node_id += 1
-        if len(self.supports) > 1 and any(support.type == 'fixed' for support in self.supports): print('\n! Error: Hay más reacciones que ecuaciones.\n')
+            self.supports.sort(key=lambda x: x.pos)  # ordenar apoyos por posición
+            self.add_node(SUPPORT, pos, -1)
+            # cambia la estructura: recalcular todo
+            self.coef = None
+            self.nodes_dirty = True
+            self.objetos.clear()
+
+    # agregar carga a la tabla de cargas con sus nodos (roles: tipo de nodo en start_pos y en end_pos); devuelve su índice
+    # (None si la posición es incorrecta, como en add_loads y move_load)
+    def add_load(self, kind, start_pos, end_pos, w_start, w_end, case, roles):
+        if start_pos < 0 or end_pos > self.L or end_pos < start_pos:
+            print(f"\n! Error: Posición incorrecta para carga en posición {start_pos}.\n")
+            return None
+        index = self.loads.append(kind=kind, start=start_pos, end=end_pos, w_start=w_start, w_end=w_end, case=self.loads.case_index(case), node=len(self.node_table))
+        positions = (start_pos, end_pos)[:len(roles)]
+        for role, pos in zip(roles, positions):
+            self.add_node(role, pos, index)
+        if self.coef is not None:
+            self.insert_nodes(positions)
+        self.apply_load(index, 1)
+        return index
+
+    # filas de la tabla de nodos de la carga index (consecutivas desde su primer nodo)
+    def load_rows(self, index):
+        first = self.loads["node"][index]
+        return first + np.flatnonzero(self.node_table["ref"][first:first + 2] == index)
+
+    # quitar la carga index (las cargas siguientes bajan de índice, como en una lista)
+    def remove_load(self, index):
+        self.apply_load(index, -1)
+        rows = self.load_rows(index)
+        positions = self.node_table["pos"][rows].copy()
+
+        # quitar filas y corregir referencias entre tablas
+        self.node_table.delete(rows)
+        ref = self.node_table["ref"]
+        ref[ref > index] -= 1
+        first = self.loads["node"][index]
+        node = self.loads["node"]
+        node[node > first] -= len(rows)
+        self.loads.delete([index])
+        for support in self.supports:
+            if support.node_id - 1 > first:
+                support.node_id -= len(rows)
+
+        if self.coef is not None:
+            self.drop_nodes(positions)
+
+    # mover la carga index a start_pos (end_pos=None: conserva su largo)
+    def move_load(self, index, start_pos, end_pos=None):
+        if end_pos is None:
+            end_pos = start_pos + (self.loads["end"][index] - self.loads["start"][index])
+        if start_pos < 0 or end_pos > self.L or end_pos < start_pos:
+            print(f"\n! Error: Posición incorrecta para carga en posición {start_pos}.\n")
+            return
+        self.apply_load(index, -1)
+        rows = self.load_rows(index)
+        positions = self.node_table["pos"][rows].copy()
+
+        self.loads["start"][index] = start_pos
+        self.loads["end"][index] = end_pos
+        self.node_table["pos"][rows] = (start_pos, end_pos)[:len(rows)]
+
+        if self.coef is not None:
+            self.drop_nodes(positions)
+            self.insert_nodes((start_pos, end_pos)[:len(rows)])
+        self.apply_load(index, 1)
+
+    # sumar (sign=1) o restar (sign=-1) la carga index de ΣP, ΣP·x y de los polinomios ya calculados
+    def apply_load(self, index, sign):
+        load_type = LOAD_TYPES[self.loads["kind"][index]]
+        start, end, w_start, w_end = [self.loads[name][index:index + 1] for name in ("start", "end", "w_start", "w_end")]
+        columns = (start, end, sign * w_start, sign * w_end)
+        R, Q = load_type.resultant(*columns)
+        self.sum_loads += float(R[0])
+        self.sum_moments += float(Q[0])
+        self.nodes_dirty = True
+        self.objetos.clear()
+
+        # viga hiperestática: cambian todas las reacciones, recalcular todo
+        if self.coef is not None and not self.simply_supported():
+            self.coef = None
+
+        # solo los elementos desde la carga: kernel dentro de la carga y resultante después (lo mismo para el cambio de
+        # cada reacción, una carga puntual en su apoyo)
+        if self.coef is not None:
+            tol = 1e-9 * self.L
+            if not self.coef[0].flags.writeable:  # compartidos con un BeamResult: copiar antes de escribir
+                self.coef = tuple(c.copy() for c in self.coef)
+            add_contribution(self.coef, self.x_nodes, load_type, columns, tol)
+            before = [support.yreaction for support in self.supports]
+            self.reactions()
+            for support, yreaction in zip(self.supports, before):
+                delta = support.yreaction - yreaction
+                if delta != 0:
+                    add_contribution(self.coef, self.x_nodes, *point_group([support.pos], [delta]), tol)
+
+    # agregar nodos en positions a x_nodes (búsqueda binaria; un nodo nuevo divide el elemento que lo contiene)
+    def insert_nodes(self, positions):
+        tol = 1e-9 * self.L
+        for pos in positions:
+            self.x_nodes, self.node_count, self.coef = insert_node(self.x_nodes, self.node_count, self.coef, float(pos), tol)
+
+    # quitar nodos en positions de x_nodes (las posiciones que quedan sin nodos unen sus dos elementos)
+    def drop_nodes(self, positions):
+        tol = 1e-9 * self.L
+        for pos in positions:
+            self.x_nodes, self.node_count, self.coef = remove_node(self.x_nodes, self.node_count, self.coef, float(pos), tol)
 
     # agregar carga puntual
-    def add_point_load(self, pos, load, d="down"):
+    def add_point_load(self, pos, load, d="down", case="default"):
         if d == "down":
             load = -load  # signo carga (positivo hacia arriba, negativo hacia abajo)
-        objeto = PointLoad(pos, load, d, self.node_id)
-        self.cargas.append(objeto)
-        self.nodes.append(Node("point_load", pos, self.node_id, objeto))
-        self.node_id += 1
+        return self.add_load(POINT, pos, pos, load, load, case, (POINT_LOAD,))
 
     # agregar carga distribuida
-    def add_distributed_load(self, start_pos, end_pos, load, d="down"):
+    def add_distributed_load(self, start_pos, end_pos, load, d="down", case="default"):
         if d == "down":
             load = -load  # signo carga (positivo hacia arriba, negativo hacia abajo)
-        objeto = DistributedLoad(start_pos, end_pos, load, d, [self.node_id, self.node_id + 1])
-        self.cargas.append(objeto)
-        self.nodes.append(Node("distributed_load_L", start_pos, self.node_id, objeto))
-        self.node_id += 1
-        self.nodes.append(Node("distributed_load_R", end_pos, self.node_id, objeto))
-        self.node_id += 1
+        return self.add_load(DISTRIBUTED, start_pos, end_pos, load, load, case, (DISTRIBUTED_LOAD_L, DISTRIBUTED_LOAD_R))
 
     # agregar carga triangular simple
-    def add_triangular_load(self, start_pos, end_pos, load, a_d, d="down"):
+    def add_triangular_load(self, start_pos, end_pos, load, a_d, d="down", case="default"):
         if d == "down":
             load = -load  # signo carga (positivo hacia arriba, negativo hacia abajo)
-        objeto = TriangularLoad(start_pos, end_pos, load, a_d, d, [self.node_id, self.node_id + 1])
-        self.cargas.append(objeto)
         if a_d == "ascending":
-            self.nodes.append(Node("triangular_load_min", start_pos, self.node_id, objeto))
-            self.node_id += 1
-            self.nodes.append(Node("triangular_load_max", end_pos, self.node_id, objeto))
-            self.node_id += 1
+            return self.add_load(TRIANGULAR, start_pos, end_pos, 0, load, case, (TRIANGULAR_LOAD_MIN, TRIANGULAR_LOAD_MAX))
         elif a_d == "descending":
-            self.nodes.append(Node("triangular_load_max", start_pos, self.node_id, objeto))
-            self.node_id += 1
-            self.nodes.append(Node("triangular_load_min", end_pos, self.node_id, objeto))
-            self.node_id += 1
+            return self.add_load(TRIANGULAR, start_pos, end_pos, load, 0, case, (TRIANGULAR_LOAD_MAX, TRIANGULAR_LOAD_MIN))
 
-    # calcular cargas equivalentes
+    # agregar carga trapezoidal (carga start_load en start_pos y end_load en end_pos, ambas con sentido d)
+    def add_trapezoidal_load(self, start_pos, end_pos, start_load, end_load, d="down", case="default"):
+        if d == "down":
+            start_load = -start_load  # signo carga (positivo hacia arriba, negativo hacia abajo)
+            end_load = -end_load
+        if abs(start_load) <= abs(end_load):
+            return self.add_load(TRAPEZOIDAL, start_pos, end_pos, start_load, end_load, case, (TRAPEZOIDAL_LOAD_MIN, TRAPEZOIDAL_LOAD_MAX))
+        return self.add_load(TRAPEZOIDAL, start_pos, end_pos, start_load, end_load, case, (TRAPEZOIDAL_LOAD_MAX, TRAPEZOIDAL_LOAD_MIN))
+
+    # agregar momento concentrado (direction: "clockwise" o "counterclockwise")
+    def add_moment_load(self, pos, moment, direction="clockwise", case="default"):
+        if direction == "clockwise":
+            moment = -moment  # signo momento (positivo antihorario, negativo horario)
+        return self.add_load(MOMENT, pos, pos, moment, moment, case, (MOMENT_LOAD,))
+
+    # agregar muchas cargas del mismo tipo con operaciones de arrays (roles: array (n, nodos por carga) con el tipo de cada nodo)
+    # devuelve los índices de las cargas agregadas; las cargas con posición incorrecta no se agregan
+    def add_loads(self, kind, start_pos, end_pos, w_start, w_end, case, roles):
+        start_pos, end_pos, w_start, w_end = np.broadcast_arrays(*[np.atleast_1d(np.asarray(column, dtype=float)) for column in (start_pos, end_pos, w_start, w_end)])
+        roles = np.broadcast_to(roles, (len(start_pos), np.shape(roles)[-1]))
+        valid = (start_pos >= 0) & (end_pos <= self.L) & (end_pos >= start_pos)
+        if not valid.all():
+            print(f"\n! Error: Posición incorrecta para cargas en posiciones {start_pos[~valid].tolist()}.\n")
+            start_pos, end_pos, w_start, w_end, roles = start_pos[valid], end_pos[valid], w_start[valid], w_end[valid], roles[valid]
+
+        count, per_load = roles.shape
+        if count == 0:  # arrays vacíos o todas las cargas fuera de la viga: nada que agregar
+            return np.arange(0)
+        first_node = len(self.node_table)
+        indices = self.loads.extend(kind=kind, start=start_pos, end=end_pos, w_start=w_start, w_end=w_end, case=self.loads.case_index(case), node=first_node + per_load * np.arange(count))
+        self.node_table.extend(pos=np.stack([start_pos, end_pos], axis=1)[:, :per_load].ravel(), role=roles.ravel(), ref=np.repeat(indices, per_load))
+
+        R, Q = LOAD_TYPES[kind].resultant(start_pos, end_pos, w_start, w_end)
+        self.sum_loads += float(np.sum(R))
+        self.sum_moments += float(np.sum(Q))
+        self.coef = None  # muchas cargas nuevas: recalcular todo
+        self.nodes_dirty = True
+        self.objetos.clear()
+        return indices
+
+    # signo de las cargas (positivo hacia arriba, negativo hacia abajo) según su sentido d ("down" o "up", uno o un array)
+    def signs(self, d):
+        return np.where(np.asarray(d) == "down", -1.0, 1.0)
+
+    # agregar cargas puntuales desde arrays
+    def add_point_loads(self, positions, loads, d="down", case="default"):
+        loads = self.signs(d) * np.asarray(loads, dtype=float)
+        return self.add_loads(POINT, positions, positions, loads, loads, case, [POINT_LOAD])
+
+    # agregar cargas distribuidas desde arrays
+    def add_distributed_loads(self, start_pos, end_pos, loads, d="down", case="default"):
+        loads = self.signs(d) * np.asarray(loads, dtype=float)
+        return self.add_loads(DISTRIBUTED, start_pos, end_pos, loads, loads, case, [DISTRIBUTED_LOAD_L, DISTRIBUTED_LOAD_R])
+
+    # agregar cargas triangulares simples desde arrays (a_d: "ascending" o "descending", uno o un array)
+    def add_triangular_loads(self, start_pos, end_pos, loads, a_d, d="down", case="default"):
+        loads = self.signs(d) * np.asarray(loads, dtype=float)
+        ascending = np.asarray(a_d) == "ascending"
+        roles = np.where(ascending[..., None], [TRIANGULAR_LOAD_MIN, TRIANGULAR_LOAD_MAX], [TRIANGULAR_LOAD_MAX, TRIANGULAR_LOAD_MIN])
+        return self.add_loads(TRIANGULAR, start_pos, end_pos, np.where(ascending, 0, loads), np.where(ascending, loads, 0), case, roles)
+
+    # agregar cargas trapezoidales desde arrays
+    def add_trapezoidal_loads(self, start_pos, end_pos, start_loads, end_loads, d="down", case="default"):
+        start_loads = self.signs(d) * np.asarray(start_loads, dtype=float)
+        end_loads = self.signs(d) * np.asarray(end_loads, dtype=float)
+        ascending = np.abs(start_loads) <= np.abs(end_loads)
+        roles = np.where(ascending[..., None], [TRAPEZOIDAL_LOAD_MIN, TRAPEZOIDAL_LOAD_MAX], [TRAPEZOIDAL_LOAD_MAX, TRAPEZOIDAL_LOAD_MIN])
+        return self.add_loads(TRAPEZOIDAL, start_pos, end_pos, start_loads, end_loads, case, roles)
+
+    # agregar momentos concentrados desde arrays (direction: uno o un array)
+    def add_moment_loads(self, positions, moments, direction="clockwise", case="default"):
+        moments = np.where(np.asarray(direction) == "clockwise", -1.0, 1.0) * np.asarray(moments, dtype=float)
+        return self.add_loads(MOMENT, positions, positions, moments, moments, case, [MOMENT_LOAD])
+
+    # agregar combinación de cargas (factors = {caso: factor})
+    def add_combination(self, name, factors):
+        self.combinations[name] = dict(factors)
+
+    # calcular cargas equivalentes: arrays (posición, carga) de las resultantes de cada carga
+    # (los momentos concentrados tienen resultante nula: carga 0 en su posición)
     def equivalent_loads(self):
-        for carga in self.cargas:
-            if type(carga).__name__ == "PointLoad":
-                self.eq_cargas.append(carga)
-            elif type(carga).__name__ == "DistributedLoad":
-                load = carga.load * carga.length
-                self.eq_cargas.append(PointLoad(carga.pos, load, carga.d, self.node_id))
-            elif type(carga).__name__ == "TriangularLoad":
-                load = (carga.load * carga.length) / 2
-                self.eq_cargas.append(PointLoad(carga.pos, load, carga.d, self.node_id))
-
-    # calcular reacciones
+        # resultante y su momento respecto a x = 0 (kernel de cada tipo de carga)
+        load, momento = resultants(self.loads)
+        start = self.loads["start"]
+        middle = (start + self.loads["end"]) / 2
+        pos = np.divide(momento, load, out=middle, where=load != 0)
+        return pos, load
+
+    # viga simplemente apoyada: dos apoyos sin empotramientos (reacciones por estática)
+    def simply_supported(self):
+        return len(self.supports) == 2 and not any(support.type == "fixed" for support in self.supports)
+
+    # apoyos que sostienen la viga: al menos dos o un empotramiento, cada uno en una posición distinta
+    def valid_supports(self):
+        if not any(support.type == "fixed" for support in self.supports) and len(self.supports) < 2:
+            print("\n! Error: La viga necesita al menos dos apoyos o un empotramiento.\n")
+            return False
+        pos = np.array([support.pos for support in self.supports], dtype=float)
+        if (np.diff(pos) <= 1e-9 * self.L).any():
+            print("\n! Error: Dos apoyos no pueden estar en la misma posición.\n")
+            return False
+        return True
+
+    # calcular reacciones (simplemente apoyada: O(1) desde ΣP y ΣP·x; las demás: método de rigidez)
     def reactions(self):
-        if self.reactions_count < 1:
-            self.equivalent_loads()
-
-            sum_loads = sum([carga.load for carga in self.eq_cargas])
-            By = -sum([carga.load * carga.pos for carga in self.eq_cargas]) / self.supports[1].pos  # Despejamos By en la ecuación de momento respecto a A.
-            Ay = -sum_loads - By
-            self.supports[0].yreaction = Ay
-            self.supports[1].yreaction = By
-
-            self.supports = sorted(self.supports, key=lambda x: x.pos)  # ordenar apoyos por posición
-
-            self.reactions_count += 1
-        else:
-            pass
-
-    # almacenar todas las cargas en nodos
+        if not self.simply_supported():
+            self.stiffness_reactions()
+            return
+        xA = self.supports[0].pos
+        xB = self.supports[1].pos
+        By = -(self.sum_moments - xA * self.sum_loads) / (xB - xA)  # Despejamos By en la ecuación de momento respecto a A.
+        Ay = -self.sum_loads - By
+        self.supports[0].yreaction = float(Ay)
+        self.supports[1].yreaction = float(By)
+
+    # reacciones de vigas hiperestáticas o en voladizo por el método de rigidez (se guardan hasta la próxima edición)
+    def stiffness_reactions(self):
+        if "stiffness" in self.objetos:
+            return
+        fixed = [support.type == "fixed" for support in self.supports]
+        self.group_nodes()
+        pos = [support.pos for support in self.supports]
+        yreactions, mreactions = stiffness_reactions(self.x_nodes, pos, fixed, [load_groups(self.loads)], self.EI)
+        for support, yreaction, mreaction in zip(self.supports, yreactions[0], mreactions[0]):
+            support.yreaction = float(yreaction)
+            support.mreaction = float(mreaction)
+        self.objetos["stiffness"] = True
+
+    # agrupar los nodos y calcular las reacciones (con polinomios calculados, x_nodes ya está al día); False si los
+    # apoyos no sostienen la viga
     def calculate(self):
-        if self.calculate_count < 1:
-            self.reactions()
-
-            def UpDown(support):
-                if support.yreaction > 0:
-                    return "up"
-                else:
-                    return "down"
-
-            [self.forces.append(carga) for carga in self.cargas]
-            [self.forces.append(PointLoad(support.pos, support.yreaction, UpDown(support), support.node_id)) for support in self.supports]
-            self.forces = sorted(self.forces, key=lambda x: x.pos)  # ordenar fuerzas por posición
-
-            self.nodes = sorted(self.nodes, key=lambda x: x.pos)  # ordenar nodos por posición
-            for node in self.nodes:
-                if node.type == "support":
-                    for support in self.supports:
-                        if support.node_id == node.id:
-                            node.load = support.yreaction
-                else:
-                    for carga in self.cargas:
-                        if type(carga.node_id) == list:
-                            if node.id in carga.node_id:
-                                node.load = carga.load
-                        else:
-                            if node.id == carga.node_id:
-                                node.load = carga.load
-
-            # eq_forces: fuerzas equivalentes en cargas puntuales
-            for force in self.forces:
-                if type(force).__name__ == "DistributedLoad":
-                    load = force.load * force.length
-                    self.eq_forces.append(PointLoad(force.pos, load))
-                elif type(force).__name__ == "TriangularLoad":
-                    load = (force.load * force.length) / 2
-                    self.eq_forces.append(PointLoad(force.pos, load))
-                else:
-                    self.eq_forces.append(force)
-
-            # nodos equivalentes (por si hay dos nodos en la misma posición)
-            for _ in range(len(self.nodes)):
-                for i in range(len(self.nodes) - 1):
-                    if self.nodes[i].pos == self.nodes[i + 1].pos:
-                        if self.nodes[i].type == "support":
-                            if self.nodes[i + 1].type == "point_load":
-                                load1 = self.nodes[i].load
-                                load2 = self.nodes[i + 1].load
-                                self.nodes[i] = Node("support_load", self.nodes[i].pos, self.nodes[i].id, [self.nodes[i].objeto, self.nodes[i + 1].objeto])
-                                self.nodes[i].load = [load1, load2]
-                                self.nodes.pop(i + 1)
-                                break
-
-            # asignar el número de cargas en cada nodo
-            for node in self.nodes:
-                if type(node.load) == list:
-                    node.load_num = 2
-                else:
-                    node.load_num = 1
-                    
-            # asignar carga neta en cada nodo
-            for node in self.nodes:
-                if node.load_num > 1:
-                    node.load_neta = sum(node.load)
-                else:
-                    node.load_neta = node.load
-
-            # agregar elementos a lista elements
-            elements_num = len(self.nodes) - 1
-            for i in range(elements_num):
-                self.elements.append(Element(self.nodes[i], self.nodes[i + 1]))
-
-            # calcular el valor que se le restará a x al calcular el momento
-            suma = 0
-            for i in range(1, elements_num):
-                suma += self.elements[i - 1].length
-                self.elements[i].subx = suma
-
-            self.calculate_count += 1
+        if not self.valid_supports():
+            return False
+        if self.coef is None:
+            self.group_nodes()
+        self.reactions()
+        return True
+
+    # agrupar los nodos por posición (solo si cambiaron desde la última vez)
+    def group_nodes(self):
+        if self.nodes_dirty:
+            # nodos coincidentes (a menos de tol) en una sola pasada ordenada
+            tol = 1e-9 * self.L
+            pos = self.node_table["pos"]
+            order = np.argsort(pos, kind="stable")
+            starts = np.concatenate([[0], np.flatnonzero(np.diff(pos[order]) > tol) + 1, [len(pos)]])
+            self.node_groups = (order, starts)
+            x_nodes = pos[order][starts[:-1]]
+            self.node_count = np.diff(starts)
+
+            # los polinomios actualizados por partes deben estar sobre los mismos nodos
+            if self.x_nodes is None or len(x_nodes) != len(self.x_nodes) or (np.abs(x_nodes - self.x_nodes) > tol).any():
+                self.coef = None
+            self.x_nodes = x_nodes
+            self.nodes_dirty = False
+
+    # objetos Node de las filas indices de la tabla de nodos
+    def component_nodes(self, indices):
+        supports = {support.node_id: support for support in self.supports}
+        cargas = self.cargas
+        pos = self.node_table["pos"]
+        role = self.node_table["role"]
+        ref = self.node_table["ref"]
+
+        nodes = []
+        for i in indices:
+            if role[i] == SUPPORT:
+                objeto = supports[i + 1]
+                load = objeto.yreaction
+            elif role[i] in (TRAPEZOIDAL_LOAD_MIN, TRAPEZOIDAL_LOAD_MAX):
+                objeto = cargas[ref[i]]
+                load = objeto.start_load if i == self.loads["node"][ref[i]] else objeto.end_load  # intensidad en el extremo del nodo
+            else:
+                objeto = cargas[ref[i]]
+                load = objeto.load
+            node = Node(ROLE_NAMES[role[i]], float(pos[i]), int(i) + 1, objeto)
+            node.load = load
+            node.load_num = 1
+            node.load_neta = load
+            nodes.append(node)
+        return nodes
+
+    # nodos agrupados (un nodo 'group' por cada posición con más de un nodo)
+    def merge_nodes(self):
+        order, starts = self.node_groups
+        components = self.component_nodes(order)
+
+        merged = []
+        for i in range(len(starts) - 1):
+            group = components[starts[i]:starts[i + 1]]
+            if len(group) == 1:
+                merged.append(group[0])
+                continue
+            node = Node("group", group[0].pos, group[0].id, [component.objeto for component in group])
+            node.components = group
+            node.load = [component.load for component in group]
+            node.load_num = len(group)
+            # carga neta: suma de las cargas concentradas (apoyos y cargas puntuales)
+            node.load_neta = sum([component.load for component in group if component.type in ("support", "point_load")])
+            merged.append(node)
+        return merged
+
+    # elementos entre nodos consecutivos
+    def build_elements(self, nodes):
+        elements = [Element(nodes[i], nodes[i + 1]) for i in range(len(nodes) - 1)]
+
+        # calcular el valor que se le restará a x al calcular el momento
+        suma = 0
+        for i in range(1, len(elements)):
+            suma += elements[i - 1].length
+            elements[i].subx = suma
+        return elements
+
+    # listas con tramos (sampling: int, {"spacing": dx} o {"tol": tol}; None usa self.sampling)
+    def tramos(self, sampling=None):
+        if not self.calculate():
+            return None
+        if sampling is None:
+            sampling = self.sampling
+        if not valid_sampling(sampling):
+            return None
+
+        x, tramosX, tramos = integer_stations(self.x_nodes)
+        if isinstance(sampling, dict) and "tol" in sampling:
+            V_coef, M_coef = self.polynomials()
+            x_ex, tramosX_ex = sample_elements(self.x_nodes, sampling, V_coef, M_coef)
         else:
-            pass
-
-    # listas con tramos
-    def tramos(self):
-        self.calculate()
-
-        tramosX = []
-        n = 0
-        for i in range(1, len(self.nodes)):
-            node = self.nodes[i]
-            lst = []
-            for j in range(n, self.L + 1):
-                lst.append(j)
-                if node.pos == j:
-                    tramosX.append(lst)
-                    n = j
-                    break
-
-        x = []
-        [x.extend(tramo) for tramo in tramosX]
-
-        tramosX_ex = []
-        for tramo in tramosX:
-            a = tramo[0]
-            b = tramo[-1]
-            tramosX_ex.append(np.linspace(a, b, 100))
-
-        x_ex = []
-        [x_ex.extend(tramo) for tramo in tramosX_ex]
-
-        tramos = []
-        for tramo in tramosX:
-            tramos.append(list(np.arange(len(tramo))))
+            x_ex, tramosX_ex = sample_elements(self.x_nodes, sampling)
 
         return tramosX, tramosX_ex, tramos, x, x_ex
 
-    # calcular fuerza cortante
-    def shear_force(self):
-        self.calculate()
-        tramosX, tramosX_ex, tramos, eje_x, x_ex = self.tramos()
-
-        V = []
-        eqV = []
-        ejeX = []
-
-        for i in range(len(self.elements)):
-            node = self.nodes[i]
-            element = self.elements[i]
-            tramoX = tramosX[i]
-            tramoX_ex = tramosX_ex[i]
-            x = sp.Symbol("x")
-
-            if node.type == "point_load" or node.type == "support" or node.type == "support_load":
-                eq = node.load_neta
-                eqV.append(eq)
-                eqV_sum = sum(eqV)
-                for X in tramoX:
-                    V.append(eqV_sum)
-                    ejeX.append(X)
-
-            elif node.type == "distributed_load_L":
-                eq = node.load_neta * (x - element.subx)
-                eqV.append(eq)
-                eqV_sum = sum(eqV)
-                for X in tramoX:
-                    V.append(eqV_sum.subs(x, X))
-                    ejeX.append(X)
-                eqV[-1] = eq.subs(x, X)
-
-            elif node.type == "distributed_load_R":
-                eqV_sum = sum(eqV)
-                for X in tramoX:
-                    V.append(eqV_sum)
-                    ejeX.append(X)
-
-            elif node.type == "triangular_load_min":
-                if node.objeto.a_d == "ascending":
-                    base = x - element.subx
-                    w = (node.load_neta / element.length) * base  # calcular razón entre triángulos para obtener la altura en términos de x (ver info.md)
-                    eq = (w * base) / 2
-                    eqV.append(eq)
-                    eqV_sum = sum(eqV)
-                    for X in tramoX_ex:
-                        V.append(eqV_sum.subs(x, X))
-                        ejeX.append(X)
-                    eqV[-1] = eq.subs(x, X)
-
-                elif node.objeto.a_d == "descending":
-                    eqV_sum = sum(eqV)
-                    for X in tramoX:
-                        V.append(eqV_sum)
-                        ejeX.append(X)
-
-            elif node.type == "triangular_load_max":
-                if node.objeto.a_d == "descending":
-                    base = x - element.subx
-                    h = (node.load_neta / element.length) * base
-                    k = node.load_neta - h
-                    triangulo = (h * base) / 2
-                    cuadrado = k * base
-                    eq = triangulo + cuadrado
-                    eqV.append(eq)
-                    eqV_sum = sum(eqV)
-                    for X in tramoX_ex:
-                        V.append(eqV_sum.subs(x, X))
-                        ejeX.append(X)
-                    eqV[-1] = eq.subs(x, X)
-
-                elif node.objeto.a_d == "ascending":
-                    eqV_sum = sum(eqV)
-                    for X in tramoX:
-                        V.append(eqV_sum)
-                        ejeX.append(X)
-
-        return V, ejeX
-
-    # calcular momento flector
-    def bending_moment(self):
-        self.calculate()
-        tramosX, tramosX_ex, tramos, eje_x, x_ex = self.tramos()
-
-        M = []
-        eqM = []
-
-        for i in range(len(self.elements)):
-            node = self.nodes[i]
-            element = self.elements[i]
-            tramo = tramosX_ex[i]
-            x = sp.Symbol("x")
-
-            if node.type == "point_load" or node.type == "support" or node.type == "support_load":
-                eq = node.load_neta * (x - element.subx)
-                eqM.append(eq)
-                eqM_sum = sum(eqM)
-                for X in tramo:
-                    M.append(eqM_sum.subs(x, X))
-
-            elif node.type == "distributed_load_L":
-                eq = node.load_neta * (x - element.subx) * ((x - element.subx) / 2)
-                eqM.append(eq)
-                eqM_sum = sum(eqM)
-                for X in tramo:
-                    M.append(eqM_sum.subs(x, X))
-                new_last_eq = node.load_neta * (x - element.subx)
-                eqM[-1] = new_last_eq.subs(x, X)
-
-            elif node.type == "distributed_load_R":
-                eq = eqM[-1] * (x - (self.elements[i - 1].subx + (self.elements[i - 1].length / 2)))
-                eqM.pop()
-                eqM.append(eq)
-                eqM_sum = sum(eqM)
-                for X in tramo:
-                    M.append(eqM_sum.subs(x, X))
-
-            elif node.type == "triangular_load_min":
-                if node.objeto.a_d == "ascending":
-                    base = x - element.subx
-                    w = (node.load_neta / element.length) * base
-                    eq = ((w * base) / 2) * ((1 / 3) * base)
-                    eqM.append(eq)
-                    eqM_sum = sum(eqM)
-                    for X in tramo:
-                        M.append(eqM_sum.subs(x, X))
-                    new_last_eq = (node.load_neta * (x - element.subx)) / 2
-                    eqM[-1] = new_last_eq.subs(x, X)
-
-                elif node.objeto.a_d == "descending":
-                    eq = eqM[-1] * (x - (self.elements[i - 1].subx + (self.elements[i - 1].length * (1 / 3))))
-                    eqM.pop()
-                    eqM.append(eq)
-                    eqM_sum = sum(eqM)
-                    for X in tramo:
-                        M.append(eqM_sum.subs(x, X))
-
-            elif node.type == "triangular_load_max":
-                if node.objeto.a_d == "descending":
-                    base = x - element.subx
-                    h = (node.load_neta / element.length) * base
-                    k = node.load_neta - h
-                    triangulo = ((h * base) / 2) * ((2 / 3) * base)
-                    cuadrado = (k * base) * (base / 2)
-                    eq = triangulo + cuadrado
-                    eqM.append(eq)
-                    eqM_sum = sum(eqM)
-                    for X in tramo:
-                        M.append(eqM_sum.subs(x, X))
-                    new_last_eq = (node.load_neta * (x - element.subx)) / 2
-                    eqM[-1] = new_last_eq.subs(x, X)
-
-                elif node.objeto.a_d == "ascending":
-                    eq = eqM[-1] * (x - (self.elements[i - 1].subx + (self.elements[i - 1].length * (2 / 3))))
-                    eqM.pop()
-                    eqM.append(eq)
-                    eqM_sum = sum(eqM)
-                    for X in tramo:
-                        M.append(eqM_sum.subs(x, X))
-
-        return M
+    # coeficientes de los polinomios de V y M en cada elemento
+    def polynomials(self):
+        if not self.calculate():
+            return None
+        if self.coef is None:
+            pos = [support.pos for support in self.supports]
+            reactions = [point_group(pos, [support.yreaction for support in self.supports]), couple_group(pos, [support.mreaction for support in self.supports])]
+            self.coef = element_coefficients(self.x_nodes, load_groups(self.loads) + reactions)
+        return self.coef
+
+    # resultados de la viga: BeamResult inmutable, el mismo objeto hasta la próxima edición de la viga
+    def solve(self):
+        if "result" not in self.objetos:
+            coef = self.polynomials()
+            if coef is None:
+                return None
+            supports = self.supports
+            self.objetos["result"] = BeamResult(self.L, [support.pos for support in supports], [support.yreaction for support in supports], self.x_nodes, self.loads, self.sampling, coef, self.EI,
+                                                [support.mreaction for support in supports], [support.type == "fixed" for support in supports])
+        return self.objetos["result"]
+
+    # calcular fuerza cortante (symbolic=True: cálculo con sympy, solo como referencia)
+    def shear_force(self, symbolic=False, sampling=None):
+        if symbolic:
+            return self.shear_force_symbolic(sampling)
+        result = self.solve()
+        return None if result is None else result.shear_force(self.sampling if sampling is None else sampling)
+
+    # calcular momento flector (symbolic=True: cálculo con sympy, solo como referencia)
+    def bending_moment(self, symbolic=False, sampling=None):
+        if symbolic:
+            return self.bending_moment_symbolic(sampling)
+        result = self.solve()
+        return None if result is None else result.bending_moment(self.sampling if sampling is None else sampling)
+
+    # puntos críticos exactos de V y M (extremos, puntos de inflexión y saltos en nodos)
+    def critical_points(self):
+        result = self.solve()
+        return None if result is None else result.critical_points
+
+    # calcular giro θ = dδ/dx (integral de M / EI)
+    def slope(self, sampling=None):
+        result = self.solve()
+        return None if result is None else result.slope(self.sampling if sampling is None else sampling)
+
+    # calcular deflexión δ (positiva hacia arriba, 0 en los apoyos)
+    def deflection(self, sampling=None):
+        result = self.solve()
+        return None if result is None else result.deflection(self.sampling if sampling is None else sampling)
+
+    # deflexión máxima en valor absoluto (x, δ)
+    def max_deflection(self):
+        result = self.solve()
+        return None if result is None else result.max_deflection
+
+    # reacciones en y, momentos de reacción de los apoyos (antihorarios, 0 en apoyos simples), V y M de cada combinación
+    # por superposición de los casos de carga
+    def combination_results(self, sampling=None):
+        muestreo = self.tramos(sampling)
+        if muestreo is None:
+            return None
+        tramosX, tramosX_ex, tramos, x, x_ex = muestreo
+        cases = case_names(self.loads)
+        R, R_M, V, M = case_results(cases, self.loads, self.supports, self.x_nodes, tramosX_ex)
+        names, F = combination_matrix(self.combinations, [self.loads.cases[case] for case in cases])
+        return names, F @ R, F @ R_M, F @ V, F @ M, x_ex
+
+    # envolventes máximas y mínimas de reacciones, momentos de reacción, V y M de todas las combinaciones
+    def envelope(self, sampling=None):
+        results = self.combination_results(sampling)
+        if results is None:
+            return None
+        names, R, R_M, V, M, x = results
+        return x, (R.max(axis=0), R.min(axis=0)), (R_M.max(axis=0), R_M.min(axis=0)), (V.max(axis=0), V.min(axis=0)), (M.max(axis=0), M.min(axis=0))
+
+    # líneas de influencia ("reaction", "shear" o "moment") en las estaciones para una carga unitaria en cada posición
+    def influence_line(self, quantity, station, positions):
+        supports = sorted(self.supports, key=lambda x: x.pos)
+        if not self.valid_supports():
+            return None
+        if not self.simply_supported():
+            print("\n! Error: Las líneas de influencia requieren dos apoyos simples.\n")
+            return None
+        if quantity not in ("reaction", "shear", "moment"):
+            print(f"\n! Error: Magnitud '{quantity}' incorrecta para línea de influencia.\n")
+            return None
+        if quantity == "reaction" and not all(any(np.isclose(s, support.pos) for support in supports) for s in np.atleast_1d(station)):
+            print("\n! Error: La estación de una reacción debe ser la posición de un apoyo.\n")
+            return None
+        lines = influence_lines(quantity, np.atleast_1d(station), np.atleast_1d(positions), supports[0].pos, supports[1].pos)
+        if np.ndim(station) == 0:
+            return lines[0]
+        return lines
+
+    # tren de cargas móvil (offsets: posición de cada eje respecto al primero, loads: carga de cada eje)
+    # n_steps=None: envolvente exacta (posiciones con un eje sobre la estación o un extremo de la viga); n_steps: tren
+    # sobre la grilla de paso L / n_steps (las separaciones que no son múltiplos del paso se interpolan, ver info.md)
+    # devuelve estaciones y envolventes de V y M: (máx, mín, posición eje 0 en máx, en mín, sentido en máx, en mín)
+    def moving_load(self, offsets, loads, stations=None, n_steps=None):
+        supports = sorted(self.supports, key=lambda x: x.pos)
+        if not self.valid_supports():
+            return None
+        if not self.simply_supported():
+            print("\n! Error: El análisis de carga móvil requiere dos apoyos simples.\n")
+            return None
+        if stations is None:
+            stations = np.linspace(0, self.L, 101)
+        stations = np.atleast_1d(np.asarray(stations, dtype=float))
+        if n_steps is None:
+            V_env, M_env = exact_envelope(offsets, loads, stations, supports[0].pos, supports[1].pos, self.L)
+        else:
+            V_env, M_env = moving_load_envelope(offsets, loads, stations, supports[0].pos, supports[1].pos, self.L, self.L / n_steps)
+        return stations, V_env, M_env
+
+    # nodos sin agrupar, sus elementos y tramos para el cálculo con sympy (los nodos coincidentes en el orden de
+    # ordered_nodes; los elementos de largo cero entre ellos no se evalúan, ver symbolic_stations)
+    # sampling {"tol": tol}: puntos de los elementos agrupados (polinomios numéricos) en los elementos con largo
+    def symbolic_layout(self, sampling=None):
+        if not self.calculate():
+            return None
+        if sampling is None:
+            sampling = self.sampling
+        nodes = ordered_nodes(self.node_components, self.node_groups[1])
+        elements = self.build_elements(nodes)
+        x_nodes = np.array([node.pos for node in nodes], dtype=float)
+        tramosX = integer_stations(x_nodes)[1]
+        if isinstance(sampling, dict) and "tol" in sampling:
+            V_coef, M_coef = self.polynomials()
+            length = np.diff(x_nodes)
+            counts = np.full(len(length), 2)
+            counts[length > 1e-9 * self.L] = sample_counts(np.diff(self.x_nodes), sampling, V_coef, M_coef)
+            x_ex, start = linspace_elements(x_nodes[:-1], x_nodes[1:], counts)
+            tramosX_ex = np.split(x_ex, start[1:])
+        else:
+            tramosX_ex = sample_elements(x_nodes, sampling)[1]
+        return nodes, elements, tramosX, tramosX_ex
+
+    # el cálculo con sympy avanza nodo a nodo reemplazando la última ecuación al terminar cada carga distribuida:
+    # no admite empotramientos, cargas trapezoidales, momentos concentrados ni cargas distribuidas superpuestas (el
+    # cálculo numérico sí)
+    def symbolic_supported(self, sampling=None):
+        if not self.valid_supports():
+            return False
+        if any(support.type == "fixed" for support in self.supports):
+            print("\n! Error: El cálculo con sympy no admite empotramientos.\n")
+            return False
+        kind = self.loads["kind"]
+        if (kind == TRAPEZOIDAL).any():
+            print("\n! Error: El cálculo con sympy no admite cargas trapezoidales.\n")
+            return False
+        if (kind == MOMENT).any():
+            print("\n! Error: El cálculo con sympy no admite momentos concentrados.\n")
+            return False
+        distribuidas = kind != POINT
+        start = self.loads["start"][distribuidas]
+        end = self.loads["end"][distribuidas]
+        order = np.argsort(start)
+        if (start[order][1:] < np.maximum.accumulate(end[order])[:-1] - 1e-9 * self.L).any():
+            print("\n! Error: El cálculo con sympy no admite cargas distribuidas superpuestas.\n")
+            return False
+        return valid_sampling(self.sampling if sampling is None else sampling)
+
+    # elementos con largo (los de largo cero entre nodos coincidentes darían valores intermedios en el nodo)
+    def symbolic_stations(self, elements, tramos):
+        keep = [i for i, element in enumerate(elements) if element.length > 1e-9 * self.L]
+        return keep, [tramos[i] for i in keep]
+
+    # calcular fuerza cortante con sympy (ecuaciones compiladas y guardadas por firma estructural)
+    def shear_force_symbolic(self, sampling=None):
+        if not self.symbolic_supported(sampling):
+            return None
+        nodes, elements, tramosX, tramosX_ex = self.symbolic_layout(sampling)
+        V_functions, M_functions, extended = compiled_diagrams(signature(nodes))
+        keep, stations = self.symbolic_stations(elements, [tramosX_ex[i] if extended[i] else tramosX[i] for i in range(len(elements))])
+        p, w = node_values(nodes)
+        V = evaluate_compiled([V_functions[i] for i in keep], stations, p, w)
+        return V.tolist(), np.concatenate(stations).tolist()
+
+    # calcular momento flector con sympy (ecuaciones compiladas y guardadas por firma estructural)
+    def bending_moment_symbolic(self, sampling=None):
+        if not self.symbolic_supported(sampling):
+            return None
+        nodes, elements, tramosX, tramosX_ex = self.symbolic_layout(sampling)
+        V_functions, M_functions, extended = compiled_diagrams(signature(nodes))
+        keep, stations = self.symbolic_stations(elements, tramosX_ex)
+        p, w = node_values(nodes)
+        return evaluate_compiled([M_functions[i] for i in keep], stations, p, w).tolist()
+
+    # ejes donde se dibuja (crea la figura la primera vez)
+    def axes(self):
+        if self.ax is None:
+            self.fig, self.ax = new_figure()
+        return self.ax
+
+    # mostrar figura (self.fig queda con la figura mostrada; la siguiente llamada a dibujar crea una figura nueva)
+    def show(self, equal=True):
+        import matplotlib.pyplot as plt
+        if equal:
+            self.axes().axis("equal")
+        plt.show()
+        self.ax = None
 
     # artistas de viga
     # definir xticks
     def newTicks(self, coords=None, decimals=3):
+        from matplotlib.ticker import FormatStrFormatter
+        ax = self.axes()
         if coords is not None:
             ax.set_xticks([coords[0]])
             ax.set_yticks([coords[1]])
-            ax.xaxis.set_major_formatter(plt.FormatStrFormatter(f"%.{decimals}f"))
-            ax.yaxis.set_major_formatter(plt.FormatStrFormatter(f"%.{decimals}f"))
+            ax.xaxis.set_major_formatter(FormatStrFormatter(f"%.{decimals}f"))
+            ax.yaxis.set_major_formatter(FormatStrFormatter(f"%.{decimals}f"))
         else:
             ticks = []
             for node in self.nodes:
@@ -409,20 +687,25 @@ class Beam:
 
     # dibujar viga
     def draw_beam(self):
+        ax = self.axes()
         ax.hlines(y=0, xmin=0, xmax=self.L, color="#000000", linewidth=3)
 
     # dibujar nodos
     def draw_nodes(self):
+        ax = self.axes()
         for node in self.nodes:
             ax.scatter(node.pos, 0, s=20, c="#FFD500", marker="s", linewidths=0.5, edgecolors="#000000", zorder=2)
 
     # dibujar linea en nodos
     def draw_node_lines(self):
+        ax = self.axes()
         for node in self.nodes:
             ax.axvline(x=node.pos, ymax=0.5, color="#909090", linestyle="--", linewidth=0.5, dashes=(4, 3), zorder=0)
 
     # dibujar apoyos
     def draw_supports(self):
+        from matplotlib.patches import Circle
+        ax = self.axes()
         l = self.L / 34  # real = 2*l   # longitud apoyo
         h = self.L / 17  # altura apoyo
 
@@ -440,17 +723,23 @@ class Beam:
             elif support.type == "roller":
                 r = self.L / 85
                 ax.fill((support.pos - l, support.pos + l, support.pos, support.pos - l), (-(h - 2 * r), -(h - 2 * r), 0, -(h - 2 * r)), color="#264F92")
-                circle1 = plt.Circle((support.pos - (l - r), -(h - r)), r, color="#264F92")
-                circle2 = plt.Circle((support.pos + (l - r), -(h - r)), r, color="#264F92")
+                circle1 = Circle((support.pos - (l - r), -(h - r)), r, color="#264F92")
+                circle2 = Circle((support.pos + (l - r), -(h - r)), r, color="#264F92")
                 ax.add_artist(circle1)
                 ax.add_artist(circle2)
                 sub_support(support.pos)
+            elif support.type == "fixed":
+                # empotramiento: placa vertical con la sombra hacia el extremo más cercano de la viga
+                side = -1 if support.pos <= self.L / 2 else 1
+                ax.fill((support.pos, support.pos + side * l, support.pos + side * l, support.pos), (-h, -h, h, h), color="#CBCBCB")
+                ax.vlines(x=support.pos, ymin=-h, ymax=h, color="#264F92", linewidth=2.5)
 
         for support in self.supports:
             drawSupports(support)
 
     # dibujar reacciones
     def draw_reactions(self, decimals=2):
+        ax = self.axes()
         for support in self.supports:
             arrow_h = self.L / 8.5
             arrow_w = self.L / 170
@@ -462,58 +751,26 @@ class Beam:
             elif support.yreaction < 0:
                 ax.arrow(support.pos, arrow_h, 0, -arrow_h, width=arrow_w, head_width=head_w, length_includes_head=True, facecolor="#FF0000", linewidth=0.5, zorder=3)
                 ax.text(support.pos, text_dy, f"{round(abs(support.yreaction), decimals)} kN", horizontalalignment="center", verticalalignment="center", fontsize=6, zorder=3)
+            if support.mreaction != 0:
+                # momento de reacción: arco alrededor del empotramiento en su sentido (antihorario si es positivo)
+                r = self.L / 14
+                side = -1 if support.pos <= self.L / 2 else 1
+                sentido = 1 if support.mreaction > 0 else -1
+                start_y = -r * side * sentido
+                ax.annotate("", xy=(support.pos, -start_y), xytext=(support.pos, start_y), arrowprops=dict(arrowstyle="-|>", connectionstyle=f"arc3,rad={0.7 * sentido}", color="#FF0000", linewidth=1), zorder=3)
+                ax.text(support.pos + side * 1.9 * r, r, f"{round(abs(support.mreaction), decimals)} kN·m", horizontalalignment="center", verticalalignment="center", fontsize=6, zorder=3)
 
     # dibujar cargas
     def draw_loads(self):
-        for carga in self.cargas:
-            # dibujar carga puntual
-            if type(carga).__name__ == "PointLoad":
-                arrow_h = self.L / 6.8
-                arrow_w = self.L / 250
-                head_w = self.L / 60
-                text_dy = arrow_h + arrow_h / 5
-                if carga.d == "down":
-                    ax.arrow(carga.pos, arrow_h, 0, -arrow_h, width=arrow_w, head_width=head_w, length_includes_head=True, color="#000000", linewidth=0.5, zorder=3)
-                    ax.text(carga.pos, text_dy, f"{abs(carga.load)} kN", horizontalalignment="center", verticalalignment="center", fontsize=6, zorder=3)
-            # dibujar carga distribuida
-            elif type(carga).__name__ == "DistributedLoad":
-                arrow_h = self.L / 9.5
-                arrow_w = self.L / 380
-                head_w = self.L / 80
-                text_dy = arrow_h + arrow_h / 4
-                mid_pos = (carga.start_pos + carga.end_pos) / 2
-                if carga.d == "down":
-                    if isinstance(carga.length, int):
-                        for i in range(carga.start_pos, carga.end_pos + 1):
-                            ax.arrow(i, arrow_h, 0, -arrow_h, width=arrow_w, head_width=head_w, length_includes_head=True, color="#000000", linewidth=0.5, zorder=3)
-                        ax.hlines(y=arrow_h, xmin=carga.start_pos, xmax=carga.end_pos, color="#000000", linewidth=1.3, zorder=3)
-                        ax.text(mid_pos, text_dy, f"{abs(carga.load)} kN/m", horizontalalignment="center", verticalalignment="center", fontsize=6, zorder=3)
-            # dibujar carga triangular
-            elif type(carga).__name__ == "TriangularLoad":
-                arrow_h = self.L / 9.5
-                h_factor = arrow_h / carga.length
-                arrow_w = self.L / 380
-                head_w = self.L / 80
-                text_dy = arrow_h + arrow_h / 4
-                if isinstance(carga.length, int):
-                    if carga.a_d == "ascending":
-                        h = 0
-                        for i in range(carga.start_pos, carga.end_pos + 1):
-                            ax.arrow(i, h, 0, -h, width=arrow_w, head_width=head_w, length_includes_head=True, color="#000000", linewidth=0.5, zorder=3)
-                            h += h_factor
-                        ax.plot((carga.start_pos, carga.end_pos), (0, arrow_h), color="#000000", linewidth=1.3, zorder=3)
-                        ax.text(carga.end_pos, text_dy, f"{abs(carga.load)} kN/m", horizontalalignment="center", verticalalignment="center", fontsize=6, zorder=3)
-                    elif carga.a_d == "descending":
-                        h = arrow_h
-                        for i in range(carga.start_pos, carga.end_pos + 1):
-                            ax.arrow(i, h, 0, -h, width=arrow_w, head_width=head_w, length_includes_head=True, color="#000000", linewidth=0.5, zorder=3)
-                            h -= h_factor
-                        ax.plot((carga.start_pos, carga.end_pos), (arrow_h, 0), color="#000000", linewidth=1.3, zorder=3)
-                        ax.text(carga.start_pos, text_dy, f"{abs(carga.load)} kN/m", horizontalalignment="center", verticalalignment="center", fontsize=6, zorder=3)
+        ax = self.axes()
+        # cada tipo de carga dibuja todas sus cargas (ver analisis/registro.py)
+        for load_type, columns in load_groups(self.loads):
+            load_type.draw(ax, self.L, *columns)
 
     # dibujar solicitado
     def draw_beam_elements(self, solicitado, nodes=False, load_lines=False, decimals=2):  # solicitado = ['beam', 'supports', 'loads', 'reactions']
-        self.reactions()
+        if "reactions" in solicitado and not self.calculate():
+            return
         for artist in solicitado:
             if artist == "beam":
                 self.draw_beam()
@@ -528,15 +785,12 @@ class Beam:
         if load_lines == True:
             self.draw_load_lines()
             self.newTicks()
-        if solicitado == ["beam"]:
-            plt.show()
-        else:
-            plt.axis("equal")
-            plt.show()
+        self.show(equal=solicitado != ["beam"])
 
     # dibujar todos los elementos de la viga
     def draw_beam_all(self, nodes=False, load_lines=True, decimals=2):
-        self.reactions()
+        if not self.calculate():
+            return
         self.draw_beam()
         self.draw_supports()
         self.draw_loads()
@@ -546,21 +800,19 @@ class Beam:
             self.newTicks()
         if nodes == True:
             self.draw_nodes()
-        plt.axis("equal")
-        plt.show()
+        self.show()
 
     # artistas diagramas
-    # dibujar diagrama de fuerza cortante
-    def draw_shear(self, nodes=False):
-        V, x = self.shear_force()
-
+    # dibujar valores de un diagrama en los ejes actuales
+    def plot_diagram(self, x, values, title):
+        ax = self.axes()
         x = np.array(x, dtype=float)
-        V = np.array(V, dtype=float)
+        values = np.array(values, dtype=float)
 
-        ax.plot(x, V)
-        ax.fill_between(x, V, color="#328DCB", alpha=0.4)
+        ax.plot(x, values)
+        ax.fill_between(x, values, color="#328DCB", alpha=0.4)
 
-        y_max = max(abs(np.asarray(V)))
+        y_max = max(abs(values))
         ax.set_ylim(-(y_max * 2), (y_max * 2))
 
         ax.yaxis.set_visible(True)
@@ -569,54 +821,111 @@ class Beam:
         ax.minorticks_on()  # sub valores ejes
         ax.grid(linewidth=0.1, which="minor", linestyle=":")  # sub cuadrícula
         ax.set_axisbelow(True)  # cuadrícula detrás de la gráfica
-        ax.set_title("Diagrama de fuerza cortante")
+        ax.set_title(title)
+
+    # marcar un punto (x, valor) del diagrama (ticks=False: texto junto al punto, para no cambiar los ticks del eje x compartido)
+    def draw_max(self, point, decimals=3, ticks=True):
+        ax = self.axes()
+        x_max, y_max = point
+        ax.scatter(x_max, y_max, s=20, c="#FF0000", linewidth=0.6, edgecolor="#000000", zorder=3)  # zorder=3 porque ax.plot() tiene zorder=2 por defecto
+        ax.axhline(y=y_max, color="#707070", linestyle="--", linewidth=0.6, zorder=2)
+        ax.axvline(x=x_max, color="#707070", linestyle="--", linewidth=0.6, zorder=2)
+        if ticks:
+            ax.grid(False)
+            ax.minorticks_off()
+            self.newTicks(coords=(x_max, y_max), decimals=decimals)
+        else:
+            ax.annotate(f"({x_max:.{decimals}f}, {y_max:.{decimals}f})", (x_max, y_max), textcoords="offset points", xytext=(4, 4), fontsize=6, zorder=3)
+
+    # marcar el momento máximo absoluto
+    def draw_moment_max(self, decimals=3, ticks=True):
+        self.draw_max(self.critical_points().M_abs_max, decimals=decimals, ticks=ticks)
+
+    # marcar la deflexión máxima absoluta
+    def draw_deflection_max(self, decimals=3, ticks=True):
+        self.draw_max(self.max_deflection(), decimals=decimals, ticks=ticks)
+
+    # dibujar diagrama de fuerza cortante
+    def draw_shear(self, nodes=False, sampling=None):
+        shear = self.shear_force(sampling=sampling)
+        if shear is None:
+            return
+        V, x = shear
+        self.plot_diagram(x, V, "Diagrama de fuerza cortante")
 
         if nodes == True:
             self.draw_nodes()
         self.draw_beam_elements(["beam"])
 
     # dibujar diagrama de momento flector
-    def draw_moment(self, nodes=False, max_value=False, decimals=3):
-        M = self.bending_moment()
-        tramosX, tramosX_ex, tramos, x, x_ex = self.tramos()
+    def draw_moment(self, nodes=False, max_value=False, decimals=3, sampling=None):
+        result = self.solve()
+        if result is None or not valid_sampling(self.sampling if sampling is None else sampling):
+            return
+        x_ex, V, M = result.diagrams(self.sampling if sampling is None else sampling)
+        self.plot_diagram(x_ex, M, "Diagrama de momento flector")
 
-        x_ex = np.array(x_ex, dtype=float)
-        M = np.array(M, dtype=float)
+        if max_value == True:
+            self.draw_moment_max(decimals=decimals)
 
-        ax.plot(x_ex, M)
-        ax.fill_between(x_ex, M, color="#328DCB", alpha=0.4)
+        if nodes == True:
+            self.draw_nodes()
+        self.draw_beam_elements(["beam"])
 
-        y_max = max(abs(np.asarray(M)))
-        ax.set_ylim(-(y_max * 2), (y_max * 2))
-
-        ax.yaxis.set_visible(True)
-        ax.spines["left"].set_visible(True)
-        ax.grid(linewidth=0.2)  # cuadrícula
-        ax.minorticks_on()  # sub valores ejes
-        ax.grid(linewidth=0.1, which="minor", linestyle=":")  # sub cuadrícula
-        ax.set_axisbelow(True)  # cuadrícula detrás de la gráfica
-        ax.set_title("Diagrama de momento flector")
+    # dibujar diagrama de deflexión
+    def draw_deflection(self, nodes=False, max_value=False, decimals=3, sampling=None):
+        result = self.solve()
+        if result is None:
+            return
+        diagrams = result.deflection_diagrams(self.sampling if sampling is None else sampling)
+        if diagrams is None:
+            return
+        x, theta, delta = diagrams
+        self.plot_diagram(x, delta, "Diagrama de deflexión")
 
         if max_value == True:
-            
-            def max_abs(M):
-                indice_max_M, valor_max_M = max(enumerate(M), key=lambda x: x[1])
-                indice_min_M, valor_min_M = min(enumerate(M), key=lambda x: x[1])
-                if abs(valor_min_M) > abs(valor_max_M):
-                    return indice_min_M, valor_min_M
-                else:
-                    return indice_max_M, valor_max_M
-                
-            indice_abs_max_M, valor_abs_max_M = max_abs(M)
-            x_max = x_ex[indice_abs_max_M]
-            M_max = valor_abs_max_M
-            ax.scatter(x_max, M_max, s=20, c="#FF0000", linewidth=0.6, edgecolor="#000000", zorder=3)  # zorder=3 porque ax.plot() tiene zorder=2 por defecto
-            ax.axhline(y=M_max, color="#707070", linestyle="--", linewidth=0.6, zorder=2)
-            ax.axvline(x=x_max, color="#707070", linestyle="--", linewidth=0.6, zorder=2)
-            ax.grid(False)
-            ax.minorticks_off()
-            self.newTicks(coords=(x_max, M_max), decimals=decimals)
+            self.draw_deflection_max(decimals=decimals)
 
         if nodes == True:
             self.draw_nodes()
         self.draw_beam_elements(["beam"])
+
+    # dibujar viga con cargas y diagramas en paneles apilados con eje x compartido (V y M se calculan una sola vez)
+    # deflection=True agrega el panel de deflexión
+    def draw_all_diagrams(self, nodes=False, load_lines=True, max_value=False, decimals=2, sampling=None, deflection=False):
+        result = self.solve()
+        if result is None or not valid_sampling(self.sampling if sampling is None else sampling):
+            return
+        x_ex, V, M = result.diagrams(self.sampling if sampling is None else sampling)
+        diagrams = [("Diagrama de fuerza cortante", V), ("Diagrama de momento flector", M)]
+        if deflection == True:
+            diagrams.append(("Diagrama de deflexión", result.deflection_diagrams(self.sampling if sampling is None else sampling)[2]))
+
+        self.fig, panels = new_figure(rows=1 + len(diagrams))
+
+        # viga con apoyos, cargas y reacciones
+        self.ax = panels[0]
+        self.draw_beam()
+        self.draw_supports()
+        self.draw_loads()
+        self.draw_reactions(decimals=decimals)
+        if load_lines == True:
+            self.draw_node_lines()
+            self.newTicks()
+        if nodes == True:
+            self.draw_nodes()
+        self.ax.set_aspect("equal", adjustable="datalim")
+        self.ax.set_title("Cargas")
+
+        for panel, (title, values) in zip(panels[1:], diagrams):
+            self.ax = panel
+            self.plot_diagram(x_ex, values, title)
+            self.draw_beam()
+            if nodes == True:
+                self.draw_nodes()
+            if max_value == True and title == "Diagrama de momento flector":
+                self.draw_moment_max(decimals=decimals, ticks=False)
+            if max_value == True and title == "Diagrama de deflexión":
+                self.draw_deflection_max(decimals=decimals, ticks=False)
+
+        self.show(equal=False)
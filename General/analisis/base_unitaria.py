@@ -0,0 +1,215 @@
+import numpy as np
+from analisis.cache import new_cache, cached, cache_stats, clear_cache
+from analisis.influencia import influence_lines
+from analisis.lote import batch_groups, batch_reactions, batch_diagrams
+from constructores.LoadTable import POINT
+
+
+# respuestas unitarias por disposición de apoyos: vigas con el mismo largo, apoyos y estaciones comparten la base
+# (V y M en las estaciones para una carga puntual unitaria justo a la derecha y sobre cada estación, y sumas acumuladas
+# por tramos entre estaciones de las cargas w = 1 y w = x) y cualquier conjunto de cargas se resuelve como suma
+# ponderada de la base: una matriz de pesos (vigas, 4 x estaciones) armada con un solo np.bincount por la base
+# (4 x estaciones, 2 x estaciones), sin nodos ni elementos
+# las disposiciones con menos de MIN_BEAMS vigas que no están en el cache, y los lotes cuyas cargas cuestan menos con los
+# kernels de analisis/lote.py que con la base (pocas cargas puntuales), se resuelven directo con esos kernels
+MAX_LAYOUTS = 32  # disposiciones guardadas (se descarta la usada hace más tiempo)
+MIN_BEAMS = 128  # vigas de una disposición nueva para armar su base (armarla cuesta como ≈100 vigas con 101 estaciones)
+# costo medido por viga y estación (ns): kernels directos, DIRECT_BASE (apoyos y estaciones) más el costo de cada columna
+# de carga; base, BASIS_BASE más cada bloque de 2 x estaciones de pesos (las cargas puntuales usan solo el primero; la
+# multiplicación crece con las estaciones) y el armado de los pesos de cada columna de carga
+DIRECT_BASE = 40.0
+DIRECT_COST = {POINT: 15.0}
+LINEAR_COST = 40.0  # cargas lineales (uniformes, triangulares y trapezoidales)
+BASIS_BASE = 8.0
+BLOCK_BASE = 19.0
+BLOCK_COST = 0.1  # por estación
+WEIGHT_COST = 4.0
+LAYOUTS = new_cache(MAX_LAYOUTS)  # {(L, xA, xB, n_points): (x, base)}
+
+
+# base de una disposición: estaciones x y matriz (4 n, 2 n) con la respuesta (V | M) en las estaciones a cada peso:
+# fuerza justo a la derecha de cada estación, fuerza sobre cada estación (cuenta a la izquierda) y sumas acumuladas de
+# las cargas w = 1 y w = x en los tramos anteriores a cada estación (fuerzas hacia arriba)
+def build_basis(L, xA, xB, n_points):
+    x = L * np.linspace(0, 1, n_points)
+    h = np.diff(x)
+    IL_V = -influence_lines("shear", x, x, xA, xB)  # carga unitaria hacia arriba
+    IL_M = -influence_lines("moment", x, x, xA, xB)
+    right_V = IL_V - np.eye(n_points)  # a la derecha de la estación no cuenta en su V
+
+    # carga lineal en el tramo k: resultante R y momento Q respecto a x[k] repartidos entre los bordes del tramo
+    def cumulative(wu, wv):
+        R = (wu + wv) / 2 * h
+        Q = (wu + 2 * wv) / 6 * h**2
+        V = right_V[:, :-1] * (R - Q / h) + IL_V[:, 1:] * (Q / h)
+        M = IL_M[:, :-1] * (R - Q / h) + IL_M[:, 1:] * (Q / h)
+        zero = np.zeros((n_points, 1))
+        return np.hstack([zero, np.cumsum(V, axis=1)]), np.hstack([zero, np.cumsum(M, axis=1)])
+
+    CU_V, CU_M = cumulative(np.ones(n_points - 1), np.ones(n_points - 1))
+    CX_V, CX_M = cumulative(x[:-1], x[1:])
+    basis = np.vstack([np.hstack([right_V.T, IL_M.T]), np.hstack([IL_V.T, IL_M.T]), np.hstack([CU_V.T, CU_M.T]), np.hstack([CX_V.T, CX_M.T])])
+    return x, basis
+
+
+# base de la disposición desde el cache (LRU)
+def layout_basis(L, xA, xB, n_points):
+    key = (float(L), float(min(xA, xB)), float(max(xA, xB)), int(n_points))
+    return cached(LAYOUTS, key, lambda: build_basis(*key))
+
+
+# estadísticas del cache
+def cache_info():
+    return cache_stats(LAYOUTS)
+
+
+def cache_clear():
+    clear_cache(LAYOUTS)
+
+
+# tramo (índice k de su estación izquierda) de cada posición
+def cell(x, pos):
+    return np.clip(np.searchsorted(x, pos, side="right") - 1, 0, len(x) - 2)
+
+
+# trozos (u, v, w(u), w(v)) de las cargas lineales cortadas en las estaciones interiores a cada carga; columna de cada trozo
+def pieces(x, beam, start, end, w_start, w_end):
+    first = np.searchsorted(x, start, side="right")  # primera estación > start
+    last = np.searchsorted(x, end, side="left")  # primera estación >= end
+    count = np.maximum(last - first, 0) + 1  # trozos por carga
+    load = np.repeat(np.arange(len(start)), count)
+    j = np.arange(count.sum()) - np.repeat(np.cumsum(count) - count, count)  # número de trozo dentro de su carga
+
+    k = first[load] + j
+    u = np.where(j == 0, start[load], x[np.minimum(k - 1, len(x) - 1)])
+    v = np.where(j == count[load] - 1, end[load], x[np.minimum(k, len(x) - 1)])
+    length = end - start
+    slope = np.divide(w_end - w_start, length, out=np.zeros(len(start)), where=length != 0)[load]
+    wu = w_start[load] + slope * (u - start[load])
+    wv = w_start[load] + slope * (v - start[load])
+    return beam[load], u, v, wu, wv
+
+
+# pesos (vigas, 4 n) de las cargas de las vigas rows sobre la base de estaciones x (un solo np.bincount)
+# columnas: [fuerza a la derecha de cada estación | fuerza sobre cada estación | w = 1 acumulada | w = x acumulada]
+# (solo cargas puntuales: (vigas, 2 n), los dos primeros bloques)
+# (tramos completos de una carga lineal w = a + b x: diferencia de las sumas acumuladas entre su primera y su última
+# estación; los trozos en los tramos de sus extremos y las cargas puntuales se reparten entre los bordes del tramo)
+def layout_weights(x, groups, rows):
+    n_points = len(x)
+    width = basis_width(groups, n_points)
+    index = []
+    weight = []
+
+    def add(column, beam, values):
+        index.append(beam * width + column)
+        weight.append(values)
+
+    for load_type, columns in groups:
+        beam = np.repeat(np.arange(len(rows)), columns[0].shape[1])
+        start, end, w_start, w_end = [column[rows].ravel() for column in columns]
+
+        # carga puntual entre x[k] y x[k + 1]: V y M son lineales en su posición entre los dos bordes del tramo
+        if load_type.kind == POINT:
+            k = cell(x, start)
+            t = (start - x[k]) / (x[k + 1] - x[k])
+            add(k, beam, np.where(t > 0, (1 - t) * w_start, 0))
+            add(n_points + k, beam, np.where(t > 0, 0, w_start))
+            add(n_points + k + 1, beam, np.where(t > 0, t * w_start, 0))
+            continue
+
+        # tramos completos de ka a kb: w = a + b x con las sumas acumuladas
+        length = end - start
+        b = np.divide(w_end - w_start, length, out=np.zeros(len(start)), where=length != 0)
+        a = w_start - b * start
+        ka = np.searchsorted(x, start, side="left")  # primera estación >= start
+        kb = np.searchsorted(x, end, side="right") - 1  # última estación <= end
+        inside = ka <= kb  # alguna estación dentro de la carga
+        full = ka < kb
+        for column, coefficient in ((2 * n_points, a), (3 * n_points, b)):
+            add(column + np.where(full, kb, 0), beam, np.where(full, coefficient, 0))
+            add(column + np.where(full, ka, 0), beam, np.where(full, -coefficient, 0))
+
+        # trozos en los tramos de los extremos: de start a la primera estación y de la última estación a end (sin
+        # estaciones dentro: toda la carga)
+        xa = x[np.minimum(ka, n_points - 1)]
+        xb = x[np.maximum(kb, 0)]
+        for u, v in ((start, np.where(inside, xa, end)), (np.where(inside, xb, end), end)):
+            k = cell(x, u)
+            h = x[k + 1] - x[k]
+            wu = a + b * u
+            wv = a + b * v
+            R = (wu + wv) / 2 * (v - u)
+            Q = R * (u - x[k]) + (wu + 2 * wv) / 6 * (v - u)**2
+            add(k, beam, R - Q / h)
+            add(n_points + k + 1, beam, Q / h)
+
+    if not index:
+        return np.zeros((len(rows), width))
+    return np.bincount(np.concatenate(index), weights=np.concatenate(weight), minlength=len(rows) * width).reshape(len(rows), width)
+
+
+# columnas de pesos que usan las cargas: los dos primeros bloques si son solo puntuales, los cuatro si no
+def basis_width(groups, n_points):
+    if all(load_type.kind == POINT for load_type, columns in groups):
+        return 2 * n_points
+    return 4 * n_points
+
+
+# la base es más barata que los kernels directos para estas cargas (costo por viga y estación, ver DIRECT_COST)
+def basis_pays(groups, n_points):
+    direct = DIRECT_BASE + sum(DIRECT_COST.get(load_type.kind, LINEAR_COST) * columns[0].shape[1] for load_type, columns in groups)
+    blocks = basis_width(groups, n_points) // (2 * n_points)
+    basis = BASIS_BASE + blocks * (BLOCK_BASE + BLOCK_COST * n_points) + WEIGHT_COST * sum(columns[0].shape[1] for load_type, columns in groups)
+    return basis < direct
+
+
+# resolver un lote de vigas simplemente apoyadas con la base de su disposición (mismos argumentos que lote.solve_batch)
+# las vigas con la misma disposición se resuelven juntas: (V | M) = pesos @ base con una sola multiplicación de matrices
+def solve_cached(L, supports, point_loads=None, distributed_loads=None, triangular_loads=None, trapezoidal_loads=None, n_points=101):
+    L = np.asarray(L, dtype=float)
+    n = len(L)
+    supports = np.asarray(supports, dtype=float).reshape(n, 2)
+    groups = batch_groups(n, point_loads, distributed_loads, triangular_loads, trapezoidal_loads)
+    reactions = batch_reactions(supports, groups)
+    X = L[:, None] * np.linspace(0, 1, n_points)
+    if not basis_pays(groups, n_points):
+        V, M = batch_diagrams(X, supports, reactions, groups)
+        return reactions, X, V, M
+
+    keys = np.stack([L, supports.min(axis=1), supports.max(axis=1)], axis=1)
+    stored = {key[:3] for key in LAYOUTS["items"] if key[3] == n_points}
+    if (keys == keys[0]).all():
+        # una sola disposición: sin agrupar ni copiar filas
+        if n < MIN_BEAMS and tuple(keys[0].tolist()) not in stored:
+            V, M = batch_diagrams(X, supports, reactions, groups)
+            return reactions, X, V, M
+        x, basis = layout_basis(*keys[0], n_points)
+        W = layout_weights(x, groups, np.arange(n))
+        VM = W @ basis[:W.shape[1]]
+        return reactions, X, VM[:, :n_points], VM[:, n_points:]
+
+    V = np.zeros((n, n_points))
+    M = np.zeros((n, n_points))
+    layouts, layout_of, count = np.unique(keys, axis=0, return_inverse=True, return_counts=True)
+    order = np.argsort(layout_of.ravel(), kind="stable")
+    first = np.cumsum(count) - count
+    # disposiciones con base: en el cache o con al menos MIN_BEAMS vigas (las demás se resuelven directo)
+    direct = np.ones(n, dtype=bool)
+    for g in np.flatnonzero((count >= MIN_BEAMS) | np.array([tuple(layout) in stored for layout in layouts.tolist()], dtype=bool)):
+        rows = order[first[g]:first[g] + count[g]]
+        direct[rows] = False
+        x, basis = layout_basis(*layouts[g], n_points)
+        W = layout_weights(x, groups, rows)
+        VM = W @ basis[:W.shape[1]]
+        V[rows] = VM[:, :n_points]
+        M[rows] = VM[:, n_points:]
+        X[rows] = x
+
+    # disposiciones con pocas vigas: kernels de cada tipo de carga
+    if direct.all():
+        V, M = batch_diagrams(X, supports, reactions, groups)
+    elif direct.any():
+        rows = np.flatnonzero(direct)
+        V[rows], M[rows] = batch_diagrams(X[rows], supports[rows], reactions[rows], [(load_type, tuple(column[rows] for column in columns)) for load_type, columns in groups])
+    return reactions, X, V, M
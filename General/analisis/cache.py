@@ -0,0 +1,36 @@
+from collections import OrderedDict
+
+
+# caches LRU de los módulos de análisis (bases de respuestas unitarias, funciones compiladas con sympy): guardan hasta
+# maxsize valores y descartan el usado hace más tiempo
+
+
+def new_cache(maxsize):
+    return {"items": OrderedDict(), "maxsize": maxsize, "hits": 0, "misses": 0}
+
+
+# valor guardado con la clave key; si no está, build() lo calcula y se guarda
+def cached(cache, key, build):
+    items = cache["items"]
+    value = items.get(key)
+    if value is not None:
+        cache["hits"] += 1
+        items.move_to_end(key)
+        return value
+    cache["misses"] += 1
+    value = build()
+    items[key] = value
+    while len(items) > cache["maxsize"]:
+        items.popitem(last=False)
+    return value
+
+
+# estadísticas del cache: aciertos, fallos y tamaño
+def cache_stats(cache):
+    return {"hits": cache["hits"], "misses": cache["misses"], "size": len(cache["items"]), "maxsize": cache["maxsize"]}
+
+
+def clear_cache(cache):
+    cache["items"].clear()
+    cache["hits"] = 0
+    cache["misses"] = 0
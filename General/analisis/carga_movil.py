@@ -0,0 +1,150 @@
+import numpy as np
+from analisis.influencia import influence_lines
+
+
+# análisis de tren de cargas móvil sobre líneas de influencia precalculadas
+# offsets: posiciones de los ejes respecto al primero | loads: cargas de los ejes (positivo hacia abajo)
+
+
+# respuesta del tren en cada paso: res[:, k] = Σ_j W_j · IL[:, k + shift_j]
+def train_response(IL, shifts, loads, n_steps, spectrum=None):
+    if spectrum is None:
+        # ventana deslizante: una suma de columnas desplazadas por eje
+        res = loads[0] * IL[:, shifts[0]:shifts[0] + n_steps]
+        tmp = np.empty_like(res)
+        for shift, load in zip(shifts[1:], loads[1:]):
+            res += np.multiply(load, IL[:, shift:shift + n_steps], out=tmp)
+        return res
+    # correlación con FFT (spectrum = rfft de IL con largo n)
+    n = 2 * (spectrum.shape[1] - 1)
+    kernel = np.zeros(n)
+    np.add.at(kernel, (-shifts) % n, loads)
+    return np.fft.irfft(spectrum * np.fft.rfft(kernel), n, axis=1)[:, :n_steps]
+
+
+# costo medido (ns): sumar la columna desplazada de un eje ≈ 3.4 por estación y paso; la FFT inversa ≈ 1.0 y el
+# espectro ≈ 0.8 por estación y n·log2(n) (el espectro se calcula una vez y lo usan los dos sentidos)
+WINDOW_COST = 3.4
+FFT_COST = 1.0
+SPECTRUM_COST = 0.8
+
+
+# ejes sobre la grilla (rel = distancia al eje de referencia en pasos): un eje fuera de la grilla se reparte entre los
+# dos puntos vecinos en forma lineal (interpolación lineal de la línea de influencia, exacta salvo a menos de un paso
+# de una estación o un apoyo, donde el error es del orden de step como el de la posición del tren)
+def axle_grid(rel, loads):
+    shifts = np.floor(rel + 1e-9).astype(int)
+    fractions = np.maximum(rel - shifts, 0)
+    fractions[fractions < 1e-9] = 0
+    grid_shifts = np.concatenate((shifts, shifts + 1))
+    weights = np.bincount(grid_shifts, np.concatenate((loads * (1 - fractions), loads * fractions)))
+    grid_shifts = np.unique(grid_shifts[np.concatenate((fractions < 1, fractions > 0))])
+    return grid_shifts, weights[grid_shifts]
+
+
+# envolventes máximas y mínimas de V y M y posición del eje 0 que las gobierna, en ambos sentidos de avance
+# las separaciones entre ejes no tienen que ser múltiplos de step (ver axle_grid)
+def moving_load_envelope(offsets, loads, stations, xA, xB, L, step):
+    offsets = np.asarray(offsets, dtype=float)
+    loads = np.asarray(loads, dtype=float)
+    rel = (offsets - offsets.min()) / step
+    n_pad = int(np.ceil(rel.max() - 1e-9))
+    trains = []
+    for sentido, r in ((1, rel), (-1, rel.max() - rel)):  # 1: izquierda a derecha, -1: derecha a izquierda
+        trains.append((sentido, r[0] * step) + axle_grid(r, loads))  # (sentido, posición del eje 0 respecto a grid, shifts, cargas)
+
+    # posiciones de la grilla: el tren entra y sale completamente de la viga (fuera de la viga IL = 0)
+    n_span = int(np.ceil(L / step))
+    grid = np.arange(-n_pad, n_span + n_pad + 1) * step
+    n_steps = len(grid) - n_pad
+    sobre = np.flatnonzero((grid >= 0) & (grid <= L))
+
+    # camino más barato según el costo medido: ventana deslizante (costo por eje) o FFT (costo fijo)
+    n = 2 ** int(np.ceil(np.log2(len(grid))))
+    window_cost = sum(WINDOW_COST * len(train[2]) * n_steps for train in trains)
+    fft_cost = (2 * FFT_COST + SPECTRUM_COST) * n * np.log2(n)
+
+    envelopes = []
+    for quantity in ("shear", "moment"):
+        IL = np.zeros((len(stations), len(grid)))
+        IL[:, sobre[0]:sobre[-1] + 1] = influence_lines(quantity, stations, grid[sobre], xA, xB)
+        spectrum = None
+        if window_cost > fft_cost:
+            spectrum = np.fft.rfft(IL, n, axis=1)
+
+        env = None
+        rows = np.arange(len(stations))
+        for sentido, x0, s, w in trains:
+            res = train_response(IL, s, w, n_steps, spectrum)
+            i_max = res.argmax(axis=1)
+            i_min = res.argmin(axis=1)
+            actual = (res[rows, i_max], res[rows, i_min], grid[i_max] + x0, grid[i_min] + x0, np.full(len(rows), sentido), np.full(len(rows), sentido))
+            if env is None:
+                env = actual
+            else:
+                mayor = actual[0] > env[0]
+                menor = actual[1] < env[1]
+                env = tuple(np.where(mayor if j % 2 == 0 else menor, actual[j], env[j]) for j in range(6))
+        envelopes.append(env)
+    return envelopes
+
+
+# envolvente exacta (sin grilla): con p la posición del tren, la respuesta Σ_j W_j · IL(p + o_j) es lineal por tramos
+# en p y solo cambia de pendiente (o salta, en V y en los extremos de una viga con voladizos) cuando un eje pasa por la
+# estación o por un extremo de la viga; los extremos de la respuesta están en esas posiciones p = b - o_j: el valor en p
+# y los límites por la izquierda y por la derecha (en un salto se informa el límite con la posición del salto, por
+# ejemplo en V el eje justo a un lado de la estación)
+# cada posición se evalúa con sumas acumuladas de W y W·o de los ejes ordenados: O(estaciones · ejes · log(ejes))
+def exact_envelope(offsets, loads, stations, xA, xB, L):
+    offsets = np.asarray(offsets, dtype=float)
+    loads = np.asarray(loads, dtype=float)
+    stations = np.asarray(stations, dtype=float)
+    rel = offsets - offsets.min()
+    n_axles = len(rel)
+    s = stations[:, None]
+    coefficients = {  # IL = cA · RA + cB · RB - término de la estación (RA y RB lineales en la posición de la carga)
+        "shear": ((stations >= xA)[:, None], (stations >= xB)[:, None]),
+        "moment": (np.maximum(s - xA, 0), np.maximum(s - xB, 0)),
+    }
+
+    values = {"shear": [], "moment": []}
+    positions = []
+    sentidos = []
+    for sentido, r in ((1, rel), (-1, rel.max() - rel)):  # 1: izquierda a derecha, -1: derecha a izquierda
+        order = np.argsort(r, kind="stable")
+        o = r[order]
+        P0 = np.concatenate([[0], np.cumsum(loads[order])])
+        P1 = np.concatenate([[0], np.cumsum(loads[order] * o)])
+        # eje j sobre el extremo izquierdo, el extremo derecho o la estación: (estaciones, 3 x ejes)
+        b = np.hstack([np.zeros((len(stations), n_axles)), np.full((len(stations), n_axles), float(L)), np.repeat(s, n_axles, axis=1)])
+        o_j = np.tile(o, 3)[None, :]
+        p = b - o_j
+        # límites de las sumas sobre los ejes en la viga (0 <= p + o <= L) y a la izquierda de la estación (p + o <= s),
+        # medidos desde el eje j para que quede exactamente sobre su punto
+        bounds = (o_j - b, o_j + (L - b), o_j + (s - b))
+        # lado de cada búsqueda: límite por la izquierda (p → p⁻), por la derecha (p → p⁺) y valor en p
+        for sides in (("right", "right", "right"), ("left", "left", "left"), ("left", "right", "right")):
+            i0, i1, i2 = [np.searchsorted(o, bound, side=side) for bound, side in zip(bounds, sides)]
+            i2 = np.clip(i2, i0, i1)
+            S0 = P0[i1] - P0[i0]
+            Wx = p * S0 + (P1[i1] - P1[i0])  # Σ W · posición de los ejes en la viga
+            T0 = P0[i2] - P0[i0]
+            Tx = p * T0 + (P1[i2] - P1[i0])
+            RA = (xB * S0 - Wx) / (xB - xA)
+            RB = (Wx - xA * S0) / (xB - xA)
+            for quantity, (cA, cB) in coefficients.items():
+                term = T0 if quantity == "shear" else s * T0 - Tx
+                values[quantity].append(cA * RA + cB * RB - term)
+            positions.append(p + r[0])  # posición del eje 0
+            sentidos.append(np.full(p.shape, sentido))
+
+    positions = np.hstack(positions)
+    sentidos = np.hstack(sentidos)
+    rows = np.arange(len(stations))
+    envelopes = []
+    for quantity in ("shear", "moment"):
+        res = np.hstack(values[quantity])
+        i_max = res.argmax(axis=1)
+        i_min = res.argmin(axis=1)
+        envelopes.append((res[rows, i_max], res[rows, i_min], positions[rows, i_max], positions[rows, i_min], sentidos[rows, i_max], sentidos[rows, i_min]))
+    return envelopes
@@ -0,0 +1,56 @@
+import numpy as np
+from analisis.polinomios import element_coefficients, evaluate
+from analisis.registro import load_groups, point_group, couple_group
+from analisis.rigidez import stiffness_reactions
+from analisis.lote import batch_reactions
+
+
+# índices de los casos de carga con cargas, en orden de aparición
+def case_names(loads):
+    case = loads["case"]
+    unicos, primero = np.unique(case, return_index=True)
+    return list(unicos[np.argsort(primero)])
+
+
+# reacciones en y, momentos de reacción (antihorarios), V y M de cada caso de carga (cada caso se resuelve una sola vez)
+def case_results(cases, loads, supports, x_nodes, tramosX_ex):
+    case = loads["case"]
+    supports_pos = [support.pos for support in supports]
+    fixed = [support.type == "fixed" for support in supports]
+    if len(supports) == 2 and not any(fixed):
+        # reacciones de todos los casos a la vez: un caso por fila del solver por lotes
+        reactions = batch_reactions(np.tile(supports_pos, (len(cases), 1)), case_groups(cases, loads))
+        moments = np.zeros_like(reactions)
+    else:
+        # viga hiperestática: una sola matriz de rigidez para todos los casos
+        reactions, moments = stiffness_reactions(x_nodes, supports_pos, fixed, [load_groups(loads, case == c) for c in cases])
+
+    # sin cargas: ningún caso, V y M con una fila por caso y una columna por estación
+    V = np.zeros((len(cases), sum(len(tramo) for tramo in tramosX_ex)))
+    M = np.zeros_like(V)
+    for i, (c, case_reactions, case_moments) in enumerate(zip(cases, reactions, moments)):
+        groups = load_groups(loads, case == c) + [point_group(supports_pos, case_reactions), couple_group(supports_pos, case_moments)]
+        V_coef, M_coef = element_coefficients(x_nodes, groups)
+        V[i] = evaluate(V_coef, x_nodes, tramosX_ex)
+        M[i] = evaluate(M_coef, x_nodes, tramosX_ex)
+    return reactions, moments, V, M
+
+
+# cargas de cada caso como una fila del solver por lotes: [(tipo, (start, end, w_start, w_end))] con columnas
+# (casos, cargas del tipo) y las cargas de los demás casos con magnitud 0
+def case_groups(cases, loads):
+    rows = loads["case"][None, :] == np.asarray(cases, dtype=int)[:, None]
+    groups = []
+    for load_type, (start, end, w_start, w_end) in load_groups(loads):
+        mask = rows[:, loads["kind"] == load_type.kind]
+        groups.append((load_type, (np.broadcast_to(start, mask.shape), np.broadcast_to(end, mask.shape), np.where(mask, w_start, 0.0), np.where(mask, w_end, 0.0))))
+    return groups
+
+
+# matriz de factores (combinaciones x casos); sin combinaciones, cada caso es una combinación
+def combination_matrix(combinations, cases):
+    if not combinations:
+        return list(cases), np.eye(len(cases))
+    names = list(combinations)
+    F = np.array([[combinations[name].get(case, 0) for case in cases] for name in names], dtype=float)
+    return names, F
@@ -0,0 +1,60 @@
+import numpy as np
+from analisis.polinomios import horner
+from analisis.puntos_criticos import element_roots
+
+
+# giro θ(x) y deflexión δ(x) por doble integración cerrada de los polinomios de M: EI θ' = M, δ' = θ
+# (coeficientes en s = x - x_izq de cada elemento, grado 4 y 5); θ y δ son continuos en los nodos y las dos constantes
+# de integración salen de las condiciones de los apoyos (δ = 0 en cada apoyo y θ = 0 en los empotramientos)
+
+
+# integral de los polinomios de cada elemento: continua en los nodos y 0 en el primer nodo
+def integrate(coef, length):
+    integral = np.zeros((coef.shape[0], coef.shape[1] + 1))
+    integral[:, 1:] = coef / np.arange(1, coef.shape[1] + 1)
+    integral[:, 0] = np.concatenate([[0], np.cumsum(horner(integral, length))[:-1]])
+    return integral
+
+
+# derivada de los polinomios de cada elemento
+def derivative(coef):
+    return coef[..., 1:] * np.arange(1, coef.shape[-1])
+
+
+# evaluar polinomios continuos en x arbitrarios (mismo shape que xs); fuera de los nodos M = 0 y la viga sigue la recta
+# tangente al primer o último nodo (voladizos sin cargas)
+def evaluate_continuous(coef, x_nodes, xs):
+    xs = np.asarray(xs, dtype=float)
+    edge = np.clip(xs, x_nodes[0], x_nodes[-1])
+    index = np.clip(np.searchsorted(x_nodes, edge, side="right") - 1, 0, len(x_nodes) - 2)
+    s = edge - x_nodes[index]
+    c = coef[index]
+    return horner(c, s) + horner(derivative(c), s) * (xs - edge)
+
+
+# (θ, δ) coeficientes de los polinomios de cada elemento
+def deflection_coefficients(x_nodes, M_coef, EI, supports, fixed=None):
+    length = np.diff(x_nodes)
+    theta = integrate(M_coef / EI, length)
+    delta = integrate(theta, length)
+
+    # δ = δ0 + C1 (x - x0) + C2 con δ = 0 en los apoyos y θ = θ0 + C1 = 0 en los empotramientos
+    # (con las reacciones de la viga hiperestática las condiciones son compatibles y mínimos cuadrados da la solución exacta)
+    supports = np.asarray(supports, dtype=float)
+    fixed = supports[np.zeros(len(supports), dtype=bool) if fixed is None else np.asarray(fixed, dtype=bool)]
+    A = np.vstack([np.column_stack([supports - x_nodes[0], np.ones(len(supports))]), np.column_stack([np.ones(len(fixed)), np.zeros(len(fixed))])])
+    b = -np.concatenate([evaluate_continuous(delta, x_nodes, supports), evaluate_continuous(theta, x_nodes, fixed)])
+    C1, C2 = np.linalg.lstsq(A, b, rcond=None)[0]
+    theta[:, 0] += C1
+    delta[:, 0] += C1 * (x_nodes[:-1] - x_nodes[0]) + C2
+    delta[:, 1] += C1
+    return theta, delta
+
+
+# deflexión máxima en valor absoluto (x, δ): candidatos en los nodos, en los extremos de la viga y donde θ = 0
+def max_deflection(x_nodes, theta, delta, L):
+    e, s = element_roots(theta, np.diff(x_nodes))
+    cand_x = np.concatenate([[0.0, L], x_nodes, x_nodes[e] + s])
+    cand_delta = evaluate_continuous(delta, x_nodes, cand_x)
+    i = np.argmax(np.abs(cand_delta))
+    return cand_x[i], cand_delta[i]
@@ -0,0 +1,25 @@
+import numpy as np
+
+
+# líneas de influencia de una viga con dos apoyos (xA, xB) para una carga unitaria hacia abajo en cada posición
+# quantity: "reaction" (stations = posiciones de apoyos), "shear" o "moment"; devuelve array (estaciones, posiciones)
+
+# reacciones de los apoyos para la carga unitaria en cada posición
+def unit_reactions(xA, xB, positions):
+    RB = (positions - xA) / (xB - xA)
+    RA = 1 - RB
+    return RA, RB
+
+
+def influence_lines(quantity, stations, positions, xA, xB):
+    stations = np.asarray(stations, dtype=float)[:, None]
+    positions = np.asarray(positions, dtype=float)[None, :]
+    RA, RB = unit_reactions(xA, xB, positions)
+
+    if quantity == "reaction":
+        return np.where(np.isclose(stations, xA), RA, RB)
+    elif quantity == "shear":
+        # suma de fuerzas a la izquierda de la estación (la carga sobre la estación cuenta a la izquierda)
+        return RA * (stations >= xA) + RB * (stations >= xB) - (positions <= stations)
+    elif quantity == "moment":
+        return RA * np.maximum(stations - xA, 0) + RB * np.maximum(stations - xB, 0) - np.maximum(stations - positions, 0)
@@ -0,0 +1,93 @@
+import numpy as np
+from constructores.LoadTable import POINT, DISTRIBUTED, TRIANGULAR, TRAPEZOIDAL
+from analisis.registro import LOAD_TYPES
+
+
+# solver por lotes: vigas simplemente apoyadas (dos apoyos) resueltas con operaciones de arrays
+# las cargas se dan como en Beam.add_*: magnitud positiva hacia abajo (negativa hacia arriba)
+
+
+# convertir tabla de cargas (array (n, k) o lista de arrays de distinto largo) a array (n, k) con relleno
+def pad(tabla, n, fill=0.0, dtype=float):
+    if tabla is None:
+        return np.full((n, 0), fill, dtype=dtype)
+    try:
+        arr = np.asarray(tabla, dtype=dtype)
+        if arr.ndim == 2:
+            return arr
+    except ValueError:
+        pass
+    filas = [np.atleast_1d(np.asarray(fila, dtype=dtype)) for fila in tabla]
+    arr = np.full((n, max([len(fila) for fila in filas], default=0)), fill, dtype=dtype)
+    for i, fila in enumerate(filas):
+        arr[i, :len(fila)] = fila
+    return arr
+
+
+# grupos de cargas del lote por tipo: [(tipo, (start, end, w_start, w_end))] con columnas (n, k)
+def batch_groups(n, point_loads=None, distributed_loads=None, triangular_loads=None, trapezoidal_loads=None):
+    groups = []
+    if point_loads is not None:
+        pos, load = [pad(t, n) for t in point_loads]
+        groups.append((LOAD_TYPES[POINT], (pos, pos, -load, -load)))  # signo carga (positivo hacia arriba, negativo hacia abajo)
+    if distributed_loads is not None:
+        start, end, load = [pad(t, n) for t in distributed_loads]
+        groups.append((LOAD_TYPES[DISTRIBUTED], (start, end, -load, -load)))
+    if triangular_loads is not None:
+        start, end, load = [pad(t, n) for t in triangular_loads[:3]]
+        a_d = pad(triangular_loads[3], n, fill="ascending", dtype=object)
+        ascending = a_d == "ascending"
+        groups.append((LOAD_TYPES[TRIANGULAR], (start, end, np.where(ascending, 0, -load), np.where(ascending, -load, 0))))
+    if trapezoidal_loads is not None:
+        start, end, start_load, end_load = [pad(t, n) for t in trapezoidal_loads]
+        groups.append((LOAD_TYPES[TRAPEZOIDAL], (start, end, -start_load, -end_load)))
+    return groups
+
+
+# reacciones de todas las vigas: sumas ΣP y ΣP·(x - xA) por fila con los kernels de resultante de cada tipo
+def batch_reactions(supports, groups):
+    xA = supports[:, 0]
+    xB = supports[:, 1]
+    sum_loads = np.zeros(len(supports))
+    sum_moments = np.zeros(len(supports))
+    for load_type, columns in groups:
+        R, Q = load_type.resultant(*columns)
+        sum_loads += R.sum(axis=1)
+        sum_moments += Q.sum(axis=1)
+    By = -(sum_moments - xA * sum_loads) / (xB - xA)
+    Ay = -sum_loads - By
+    return np.stack([Ay, By], axis=1)
+
+
+# fuerza cortante y momento flector en las estaciones x (n, m) de cada viga (una llamada al kernel por columna de carga)
+def batch_diagrams(x, supports, reactions, groups):
+    V = np.zeros_like(x)
+    M = np.zeros_like(x)
+    groups = [(LOAD_TYPES[POINT], (supports, supports, reactions, reactions))] + groups
+    for load_type, columns in groups:
+        for j in range(columns[0].shape[1]):
+            Vj, Mj = load_type.diagram(x, *[column[:, j][:, None] for column in columns])
+            V += Vj
+            M += Mj
+    return V, M
+
+
+# resolver un lote de vigas simplemente apoyadas
+# L: (n,) largos | supports: (n, 2) posiciones de los apoyos
+# point_loads: (pos, load) | distributed_loads: (start_pos, end_pos, load) | triangular_loads: (start_pos, end_pos, load, a_d)
+# trapezoidal_loads: (start_pos, end_pos, start_load, end_load)
+# cada columna puede ser un array (n, k) con relleno de carga 0 o una lista de arrays de distinto largo
+# n_points: estaciones por viga (0 para calcular solo reacciones)
+def solve_batch(L, supports, point_loads=None, distributed_loads=None, triangular_loads=None, trapezoidal_loads=None, n_points=101):
+    L = np.asarray(L, dtype=float)
+    n = len(L)
+    supports = np.asarray(supports, dtype=float).reshape(n, 2)
+    groups = batch_groups(n, point_loads, distributed_loads, triangular_loads, trapezoidal_loads)
+
+    reactions = batch_reactions(supports, groups)
+    if n_points == 0:
+        return reactions
+
+    x = L[:, None] * np.linspace(0, 1, n_points)
+    V, M = batch_diagrams(x, supports, reactions, groups)
+    return reactions, x, V, M
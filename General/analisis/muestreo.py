@@ -0,0 +1,85 @@
+import numpy as np
+
+
+# puntos de muestreo de cada elemento según la política de muestreo:
+# int: número fijo de puntos por elemento | {"spacing": dx}: espaciado fijo | {"tol": tol}: adaptivo,
+# error de interpolación lineal de V y M menor que tol * max|valor| (elementos lineales: solo sus dos extremos)
+
+
+# política de muestreo válida: entero >= 2, {"spacing": dx} con dx > 0 o {"tol": tol} con tol > 0
+def valid_sampling(sampling):
+    if isinstance(sampling, dict):
+        name = "spacing" if "spacing" in sampling else "tol" if "tol" in sampling else None
+        if name is None:
+            print(f"\n! Error: Política de muestreo {sampling} incorrecta (usar 'spacing' o 'tol').\n")
+            return False
+        if not isinstance(sampling[name], (int, float, np.integer, np.floating)) or not sampling[name] > 0:
+            print(f"\n! Error: '{name}' del muestreo debe ser un número mayor que 0.\n")
+            return False
+        return True
+    if isinstance(sampling, bool) or not isinstance(sampling, (int, np.integer)):
+        print(f"\n! Error: El número de puntos por elemento debe ser un entero (no {sampling!r}).\n")
+        return False
+    if sampling < 2:
+        print("\n! Error: El muestreo necesita al menos 2 puntos por elemento.\n")
+        return False
+    return True
+
+
+# número de puntos por elemento
+def sample_counts(length, sampling, V_coef=None, M_coef=None):
+    if isinstance(sampling, dict) and "spacing" in sampling:
+        return np.maximum(np.ceil(length / sampling["spacing"]).astype(int) + 1, 2)
+    elif isinstance(sampling, dict) and "tol" in sampling:
+        n = np.full(len(length), 2)
+        for coef in (V_coef, M_coef):
+            # |f''| máximo en el elemento (f'' es lineal: máximo en un extremo)
+            d2 = np.maximum(np.abs(2 * coef[:, 2]), np.abs(2 * coef[:, 2] + 6 * coef[:, 3] * length))
+            s = np.linspace(0, 1, 5)[None, :] * length[:, None]
+            escala = np.abs(((coef[:, 3:4] * s + coef[:, 2:3]) * s + coef[:, 1:2]) * s + coef[:, 0:1]).max()
+            tol = sampling["tol"] * max(escala, 1e-12)
+            # error máximo de interpolación lineal con paso h: h² |f''| / 8
+            segmentos = np.ceil(length * np.sqrt(d2 / (8 * tol)))
+            n = np.maximum(n, segmentos.astype(int) + 1)
+        return n
+    return np.full(len(length), int(sampling))
+
+
+# puntos de todos los elementos en un solo array (counts puntos de a a b por elemento) y el índice de inicio de cada elemento
+def linspace_elements(a, b, counts):
+    start = np.concatenate([[0], np.cumsum(counts)[:-1]]).astype(int)
+    k = np.arange(counts.sum()) - np.repeat(start, counts)
+    t = k / np.repeat(np.maximum(counts - 1, 1), counts)
+    x = np.repeat(a, counts) + t * np.repeat(b - a, counts)
+    x[start + counts - 1] = b  # extremos exactos
+    return x, start
+
+
+# x de cada elemento: x_ex (concatenado) y tramosX_ex (vistas de x_ex)
+def sample_elements(x_nodes, sampling, V_coef=None, M_coef=None):
+    length = np.diff(x_nodes)
+    counts = sample_counts(length, sampling, V_coef, M_coef)
+    x_ex, start = linspace_elements(x_nodes[:-1], x_nodes[1:], counts)
+    return x_ex, np.split(x_ex, start[1:])
+
+
+# valores enteros de x de cada elemento más sus extremos: x (concatenado), tramosX (vistas de x) y tramos (índices locales)
+def integer_stations(x_nodes):
+    a = x_nodes[:-1]
+    b = x_nodes[1:]
+    grid = np.arange(np.ceil(x_nodes[0]), np.floor(x_nodes[-1]) + 1)
+    left = np.searchsorted(grid, a, side="right")  # primer entero mayor que a
+    right = np.searchsorted(grid, b, side="left")  # primer entero mayor o igual que b
+    inner = np.maximum(right - left, 0)
+
+    counts = inner + 2
+    start = np.concatenate([[0], np.cumsum(counts)[:-1]]).astype(int)
+    x = np.empty(counts.sum())
+    x[start] = a
+    x[start + counts - 1] = b
+    inner_start = np.concatenate([[0], np.cumsum(inner)[:-1]]).astype(int)
+    k = np.arange(inner.sum()) - np.repeat(inner_start, inner)
+    x[np.repeat(start + 1, inner) + k] = grid[np.repeat(left, inner) + k]
+
+    tramos = np.arange(len(x)) - np.repeat(start, counts)
+    return x, np.split(x, start[1:]), np.split(tramos, start[1:])
@@ -0,0 +1,117 @@
+import numpy as np
+from analisis.registro import shift
+
+
+# motor numérico: V(x) y M(x) como polinomios por elemento (coeficientes [c0, c1, c2, c3] en s = x - x_izq)
+
+# puntos y pesos de Gauss-Legendre en [-1, 1]: integración exacta de una carga lineal por funciones cúbicas
+# (cargas consistentes del método de rigidez e integrales de M0 de los tres momentos)
+GAUSS_T, GAUSS_W = np.polynomial.legendre.leggauss(3)
+
+
+# evaluar polinomios de cualquier grado (coeficientes [c0, c1, ...] en el último eje, uno por valor de s)
+def horner(c, s):
+    values = c[..., -1]
+    for j in range(c.shape[-1] - 2, -1, -1):
+        values = values * s + c[..., j]
+    return values
+
+
+# coeficientes de V y M en cada elemento (superposición de todos los grupos de cargas, un kernel por tipo)
+# groups: [(tipo de carga, (start, end, w_start, w_end))] (ver analisis/registro.py)
+# cada carga marca su rango de elementos en arrays de diferencias (O(cargas + elementos), las cargas pueden superponerse);
+# la suma acumulada da el polinomio en x de cada elemento, que se pasa a s = x - x_izq
+def element_coefficients(x_nodes, groups, tol=None):
+    if tol is None:
+        tol = 1e-9 * (x_nodes[-1] - x_nodes[0])  # tolerancia de nodos coincidentes
+    origin = x_nodes[0]  # origen de x cerca de los elementos (polinomios globales mejor condicionados)
+    x = x_nodes - origin
+    D_V = np.zeros((len(x_nodes), 4))
+    D_M = np.zeros((len(x_nodes), 4))
+
+    for load_type, columns in groups:
+        start, end, w_start, w_end = [np.asarray(column, dtype=float).ravel() for column in columns]
+        load_type.add_coefficients(D_V, D_M, x, start - origin, end - origin, w_start, w_end, tol)
+
+    d = x[:-1]
+    V = np.stack(shift(*np.cumsum(D_V, axis=0)[:-1].T, d), axis=1)
+    M = np.stack(shift(*np.cumsum(D_M, axis=0)[:-1].T, d), axis=1)
+    return V, M
+
+
+# sumar a coef = (V, M) la contribución de una carga (columnas de un elemento) solo donde cambia: los elementos dentro
+# de la carga con el kernel de su tipo y los elementos después de la carga con su resultante R y su momento Q respecto a
+# x = 0 (V = R, M = R x - Q); con la convención de suma por la izquierda, los elementos anteriores a la carga no cambian
+def add_contribution(coef, x_nodes, load_type, columns, tol):
+    start, end, w_start, w_end = columns
+    n = len(x_nodes) - 1  # elementos
+    k = np.searchsorted(x_nodes, start[0] - tol)  # primer elemento que comienza en o después de la carga
+    a = min(np.searchsorted(x_nodes, end[0] - tol), n)  # primer elemento después de la carga
+    if k < a:
+        V, M = element_coefficients(x_nodes[k:a + 1], [(load_type, columns)], tol)
+        coef[0][k:a] += V
+        coef[1][k:a] += M
+    if a < n:
+        R, Q = load_type.resultant(*columns)
+        coef[0][a:, 0] += R[0]
+        coef[1][a:, 0] += R[0] * x_nodes[a:-1] - Q[0]
+        coef[1][a:, 1] += R[0]
+
+
+# agregar un nodo en pos a (x_nodes, count, coef) donde V y M son continuos (count: nodos de la tabla en cada posición)
+# si coincide con un nodo existente solo suma a su cuenta; si no, el elemento que lo contiene se divide (el nuevo
+# elemento toma su polinomio desplazado a pos) y fuera de los nodos el nuevo elemento tiene V = M = 0
+def insert_node(x_nodes, count, coef, pos, tol):
+    k = np.searchsorted(x_nodes, pos)
+    for j in (k - 1, k):
+        if 0 <= j < len(x_nodes) and abs(x_nodes[j] - pos) <= tol:
+            count[j] += 1
+            return x_nodes, count, coef
+    inside = 0 < k < len(x_nodes)
+    row = k if inside else min(k, len(x_nodes) - 1)
+    new = []
+    for c in coef:
+        piece = np.array([shift(*c[k - 1], pos - x_nodes[k - 1])]) if inside else np.zeros((1, c.shape[1]))
+        new.append(np.concatenate([c[:row], piece, c[row:]]))
+    return np.concatenate([x_nodes[:k], [pos], x_nodes[k:]]), np.concatenate([count[:k], [1], count[k:]]), tuple(new)
+
+
+# quitar un nodo en pos de (x_nodes, count, coef); si ya no quedan nodos en esa posición se unen sus dos elementos (el
+# polinomio del elemento de la izquierda sigue valiendo, V y M son continuos ahí) o se quita el elemento del extremo
+def remove_node(x_nodes, count, coef, pos, tol):
+    j = np.searchsorted(x_nodes, pos - tol)
+    count[j] -= 1
+    if count[j] > 0:
+        return x_nodes, count, coef
+    row = j if j < len(x_nodes) - 1 else j - 1
+    if len(x_nodes) > 1:
+        coef = tuple(np.concatenate([c[:row], c[row + 1:]]) for c in coef)
+    return np.concatenate([x_nodes[:j], x_nodes[j + 1:]]), np.concatenate([count[:j], count[j + 1:]]), coef
+
+
+# evaluar los polinomios de cada elemento en sus valores de x (tramosX_ex)
+def evaluate(coef, x_nodes, tramosX):
+    index = np.repeat(np.arange(len(tramosX)), [len(tramo) for tramo in tramosX])
+    x = np.concatenate(tramosX).astype(float) if len(tramosX) else np.zeros(0)
+    s = x - x_nodes[index]
+    return horner(coef[index], s)
+
+
+# elemento de cada x (búsqueda binaria en los nodos) y s = x - x_izq
+# side="right": límite por la derecha (en un nodo cuenta lo que está sobre el nodo, como en los diagramas)
+# side="left": límite por la izquierda; fuera de la viga (antes del primer nodo o después del último) V = M = 0
+def locate(x_nodes, xs, side="right"):
+    xs = np.asarray(xs, dtype=float)
+    index = np.clip(np.searchsorted(x_nodes, xs, side=side) - 1, 0, len(x_nodes) - 2)
+    if side == "right":
+        inside = (xs >= x_nodes[0]) & (xs < x_nodes[-1])
+    else:
+        inside = (xs > x_nodes[0]) & (xs <= x_nodes[-1])
+    return index, xs - x_nodes[index], inside
+
+
+# evaluar los polinomios de los elementos en x arbitrarios (mismo shape que xs)
+def evaluate_points(coef, x_nodes, xs, side="right"):
+    index, s, inside = locate(x_nodes, xs, side)
+    return np.where(inside, horner(coef[index], s), 0.0)
+
@@ -0,0 +1,98 @@
+import numpy as np
+from analisis.polinomios import horner
+
+
+# raíces reales de los polinomios de cada elemento dentro del elemento (0 < s < largo)
+# coef: (n, grado + 1) coeficientes [c0, c1, c2, ...] | devuelve (índice de elemento, s)
+def element_roots(coef, length, tol=1e-12):
+    escala = np.abs(coef).max(axis=1) + tol
+    c = np.where(np.abs(coef) > tol * escala[:, None], coef, 0)
+    no_nulo = c != 0
+    grado = np.where(no_nulo.any(axis=1), c.shape[1] - 1 - np.argmax(no_nulo[:, ::-1], axis=1), 0)
+
+    indices = []
+    raices = []
+
+    # grado 3 o más: valores propios de las matrices compañeras
+    for g in range(c.shape[1] - 1, 2, -1):
+        e = np.flatnonzero(grado == g)
+        if len(e):
+            comp = np.zeros((len(e), g, g))
+            comp[:, np.arange(1, g), np.arange(g - 1)] = 1
+            comp[:, :, g - 1] = -c[e, :g] / c[e, g:g + 1]
+            r = np.linalg.eigvals(comp)
+            real = np.abs(r.imag) <= 1e-9 * (1 + np.abs(r.real))
+            indices.append(np.repeat(e, g)[real.ravel()])
+            raices.append(r.real[real])
+
+    # grado 2: fórmula cuadrática
+    e = np.flatnonzero(grado == 2)
+    if len(e):
+        a, b, c0 = c[e, 2], c[e, 1], c[e, 0]
+        disc = b**2 - 4 * a * c0
+        ok = disc >= 0
+        sq = np.sqrt(np.where(ok, disc, 0))
+        for signo in (1, -1):
+            indices.append(e[ok])
+            raices.append(((-b + signo * sq) / (2 * a))[ok])
+
+    # grado 1
+    e = np.flatnonzero(grado == 1)
+    indices.append(e)
+    raices.append(-c[e, 0] / c[e, 1])
+
+    indices = np.concatenate(indices).astype(int)
+    raices = np.concatenate(raices)
+    dentro = (raices > tol * length[indices]) & (raices < length[indices] * (1 - tol))
+    orden = np.lexsort((raices[dentro], indices[dentro]))
+    return indices[dentro][orden], raices[dentro][orden]
+
+
+# evaluar el polinomio de los elementos e en s
+def evaluate_at(coef, e, s):
+    return horner(coef[e], s)
+
+
+# puntos críticos de V y M a partir de los polinomios de los elementos
+def critical_points(x_nodes, V_coef, M_coef):
+    length = np.diff(x_nodes)
+    n = len(length)
+    inicio = np.zeros(n)
+    e_all = np.arange(n)
+
+    # valores en los extremos de cada elemento
+    V_L, V_R = evaluate_at(V_coef, e_all, inicio), evaluate_at(V_coef, e_all, length)
+    M_L, M_R = evaluate_at(M_coef, e_all, inicio), evaluate_at(M_coef, e_all, length)
+
+    # saltos en nodos interiores (valor a la derecha menos valor a la izquierda)
+    jump_V = V_L[1:] - V_R[:-1]
+    jump_M = M_L[1:] - M_R[:-1]
+    hay_salto = ~np.isclose(jump_V, 0) | ~np.isclose(jump_M, 0)
+    jumps = (x_nodes[1:-1][hay_salto], jump_V[hay_salto], jump_M[hay_salto])
+
+    # extremos de M: V = 0 dentro de un elemento o V cambia de signo en un nodo
+    e, s = element_roots(V_coef, length)
+    e_nodo = np.flatnonzero(V_R[:-1] * V_L[1:] < 0)
+    extrema_x = np.concatenate([x_nodes[e] + s, x_nodes[e_nodo + 1]])
+    extrema_M = np.concatenate([evaluate_at(M_coef, e, s), M_R[e_nodo]])
+    extrema_element = np.concatenate([e, e_nodo + 1])
+    orden = np.argsort(extrema_x, kind="stable")
+    extrema = (extrema_x[orden], extrema_M[orden], extrema_element[orden])
+
+    # puntos de inflexión del diagrama de momento (M = 0 dentro de un elemento)
+    e, s = element_roots(M_coef, length)
+    contraflexure = x_nodes[e] + s
+
+    # máximos y mínimos globales: candidatos en extremos de elementos, raíces de V y raíces de V' (extremos de V)
+    e_V, s_V = element_roots(np.column_stack([V_coef[:, 1], 2 * V_coef[:, 2], 3 * V_coef[:, 3], np.zeros(n)]), length)
+    cand_x = np.concatenate([x_nodes[:-1], x_nodes[1:], extrema_x, x_nodes[e_V] + s_V])
+    cand_V = np.concatenate([V_L, V_R, np.full(len(extrema_x), np.nan), evaluate_at(V_coef, e_V, s_V)])
+    cand_M = np.concatenate([M_L, M_R, extrema_M, evaluate_at(M_coef, e_V, s_V)])
+    i_V_max, i_V_min = np.nanargmax(cand_V), np.nanargmin(cand_V)
+    i_M_max, i_M_min = np.nanargmax(cand_M), np.nanargmin(cand_M)
+    V_max = (cand_x[i_V_max], cand_V[i_V_max])
+    V_min = (cand_x[i_V_min], cand_V[i_V_min])
+    M_max = (cand_x[i_M_max], cand_M[i_M_max])
+    M_min = (cand_x[i_M_min], cand_M[i_M_min])
+
+    return V_max, V_min, M_max, M_min, extrema, contraflexure, jumps
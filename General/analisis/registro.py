@@ -0,0 +1,238 @@
+import numpy as np
+from constructores.LoadTable import POINT, DISTRIBUTED, TRIANGULAR, TRAPEZOIDAL, MOMENT
+from constructores.PointLoad import PointLoad
+from constructores.DistributedLoad import DistributedLoad
+from constructores.TriangularLoad import TriangularLoad
+from constructores.TrapezoidalLoad import TrapezoidalLoad
+from constructores.MomentLoad import MomentLoad
+
+
+# registro de tipos de carga: cada tipo aporta kernels vectorizados que reciben todas sus cargas a la vez
+# columnas de cada carga: (start, end, w_start, w_end) como en LoadTable (arrays del mismo largo o con broadcast)
+# add_coefficients: cada carga suma un polinomio fijo en x (coeficientes globales) a un rango contiguo de elementos,
+# marcado en arrays de diferencias D_V, D_M (elementos + 1, 4): se suma al inicio del rango y se resta al final
+LOAD_TYPES = {}
+
+
+# registrar un tipo de carga
+def register(load_type):
+    LOAD_TYPES[load_type.kind] = load_type
+    return load_type
+
+
+# cargas puntuales: posición start, magnitud w_start
+class PointType:
+    kind = POINT
+    name = "point"
+    view = PointLoad  # vista de una fila de la tabla de cargas
+
+    # resultante R y su momento respecto a x = 0
+    def resultant(self, start, end, w_start, w_end):
+        return w_start, w_start * start
+
+    # V y M en las estaciones x (la carga sobre la estación cuenta a la izquierda)
+    def diagram(self, x, start, end, w_start, w_end):
+        d = x - start
+        return np.where(d >= 0, w_start, 0), np.maximum(d, 0) * w_start
+
+    # desde el primer elemento que comienza en o después de la carga: V = P, M = P (x - pos)
+    def add_coefficients(self, D_V, D_M, x_nodes, start, end, w_start, w_end, tol):
+        first = np.searchsorted(x_nodes, start - tol)
+        np.add.at(D_V[:, 0], first, w_start)
+        np.add.at(D_M[:, 0], first, -w_start * start)
+        np.add.at(D_M[:, 1], first, w_start)
+
+    # dibujar cargas
+    def draw(self, ax, L, start, end, w_start, w_end):
+        arrow_h = L / 6.8
+        arrow_w = L / 250
+        head_w = L / 60
+        text_dy = arrow_h + arrow_h / 5
+        for pos, load in zip(start, w_start):
+            if load < 0:
+                ax.arrow(pos, arrow_h, 0, -arrow_h, width=arrow_w, head_width=head_w, length_includes_head=True, color="#000000", linewidth=0.5, zorder=3)
+                ax.text(pos, text_dy, f"{abs(load):g} kN", horizontalalignment="center", verticalalignment="center", fontsize=6, zorder=3)
+
+
+# momentos concentrados (cargas de momento y momentos de reacción): posición start, momento w_start (positivo
+# antihorario); M baja en C a la derecha del momento y V no cambia
+class CoupleType:
+    kind = MOMENT
+    name = "moment"
+    view = MomentLoad
+
+    # resultante nula; su momento respecto a x = 0 es el mismo momento
+    def resultant(self, start, end, w_start, w_end):
+        return 0 * w_start, w_start
+
+    def diagram(self, x, start, end, w_start, w_end):
+        d = x - start
+        return 0 * d, np.where(d >= 0, -w_start, 0)
+
+    # desde el primer elemento que comienza en o después del momento: M = -C
+    def add_coefficients(self, D_V, D_M, x_nodes, start, end, w_start, w_end, tol):
+        first = np.searchsorted(x_nodes, start - tol)
+        np.add.at(D_M[:, 0], first, -w_start)
+
+    # arco sobre la viga en el sentido del momento (antihorario si es positivo) y texto
+    def draw(self, ax, L, start, end, w_start, w_end):
+        r = L / 25
+        for pos, moment in zip(start, w_start):
+            if moment == 0:
+                continue
+            sentido = 1 if moment > 0 else -1
+            ax.annotate("", xy=(pos - sentido * r, 0), xytext=(pos + sentido * r, 0), arrowprops=dict(arrowstyle="-|>", connectionstyle=f"arc3,rad={sentido}", color="#000000", linewidth=1), zorder=3)
+            ax.text(pos, 2.2 * r, f"{abs(moment):g} kN·m", horizontalalignment="center", verticalalignment="center", fontsize=6, zorder=3)
+
+
+# desplazar polinomio cúbico en t a s = t - d, es decir p(s + d)
+def shift(c0, c1, c2, c3, d):
+    return (c0 + d * (c1 + d * (c2 + d * c3)),
+            c1 + d * (2 * c2 + 3 * c3 * d),
+            c2 + 3 * c3 * d,
+            c3)
+
+
+# cargas distribuidas lineales: w(t) = w_start + k t, con t = x - start y k = (w_end - w_start) / largo
+class LinearType:
+    kind = None
+    name = None
+    view = None
+
+    def resultant(self, start, end, w_start, w_end):
+        length = end - start
+        R = (w_start + w_end) / 2 * length
+        Q = (w_start + 2 * w_end) / 6 * length**2  # momento respecto al inicio de la carga
+        return R, R * start + Q
+
+    def diagram(self, x, start, end, w_start, w_end):
+        length = end - start
+        k = np.divide(w_end - w_start, length, out=np.zeros(np.shape(length)), where=length != 0)
+        X = x - start
+        u = np.clip(X, 0, length)  # largo cargado a la izquierda de la estación
+        V = w_start * u + k * u**2 / 2
+        M = w_start * u * (X - u / 2) + k * u**2 * (X / 2 - u / 3)
+        return V, M
+
+    # elementos dentro de la carga (desde start hasta end): polinomios de t = x - start llevados a x
+    # elementos después de la carga: V = R, M = R (x - start) - Q (resultante R y momento Q respecto a su inicio)
+    def add_coefficients(self, D_V, D_M, x_nodes, start, end, w_start, w_end, tol):
+        length = end - start
+        k = np.divide(w_end - w_start, length, out=np.zeros_like(length), where=length != 0)
+        first = np.searchsorted(x_nodes, start - tol)  # primer elemento dentro de la carga
+        after = np.searchsorted(x_nodes, end - tol)  # primer elemento después de la carga
+
+        zero = np.zeros_like(start)
+        inside_V = np.stack(shift(zero, w_start, k / 2, zero, -start), axis=1)
+        inside_M = np.stack(shift(zero, zero, w_start / 2, k / 6, -start), axis=1)
+        R = w_start * length + k * length**2 / 2
+        Q = w_start * length**2 / 2 + k * length**3 / 3
+        after_V = np.stack([R, zero, zero, zero], axis=1)
+        after_M = np.stack([-R * start - Q, R, zero, zero], axis=1)
+
+        np.add.at(D_V, first, inside_V)
+        np.add.at(D_M, first, inside_M)
+        np.add.at(D_V, after, after_V - inside_V)
+        np.add.at(D_M, after, after_M - inside_M)
+
+    # flechas (una por metro) con altura proporcional a la carga, línea superior y texto
+    def draw(self, ax, L, start, end, w_start, w_end):
+        arrow_h = L / 9.5
+        arrow_w = L / 380
+        head_w = L / 80
+        text_dy = arrow_h + arrow_h / 4
+        for a, b, wa, wb in zip(start, end, w_start, w_end):
+            if wa > 0 or wb > 0 or wa == wb == 0:  # solo cargas hacia abajo (las nulas no tienen flechas)
+                continue
+            peak = max(abs(wa), abs(wb))
+            ha = arrow_h * abs(wa) / peak
+            hb = arrow_h * abs(wb) / peak
+            arrows = max(round(b - a), 1) + 1
+            for i, h in zip(np.linspace(a, b, arrows), np.linspace(ha, hb, arrows)):
+                if h > 0:
+                    ax.arrow(i, h, 0, -h, width=arrow_w, head_width=head_w, length_includes_head=True, color="#000000", linewidth=0.5, zorder=3)
+            if ha == hb:
+                ax.hlines(y=arrow_h, xmin=a, xmax=b, color="#000000", linewidth=1.3, zorder=3)
+            else:
+                ax.plot((a, b), (ha, hb), color="#000000", linewidth=1.3, zorder=3)
+            self.draw_text(ax, a, b, wa, wb, text_dy)
+
+    def draw_text(self, ax, a, b, wa, wb, text_dy):
+        ax.text((a + b) / 2, text_dy, f"{abs(wa):g} kN/m", horizontalalignment="center", verticalalignment="center", fontsize=6, zorder=3)
+
+
+# cargas distribuidas uniformes
+class UniformType(LinearType):
+    kind = DISTRIBUTED
+    name = "distributed"
+    view = DistributedLoad
+
+
+# cargas triangulares simples (texto sobre el extremo con carga máxima)
+class TriangularType(LinearType):
+    kind = TRIANGULAR
+    name = "triangular"
+    view = TriangularLoad
+
+    def draw_text(self, ax, a, b, wa, wb, text_dy):
+        if wa == 0:
+            ax.text(b, text_dy, f"{abs(wb):g} kN/m", horizontalalignment="center", verticalalignment="center", fontsize=6, zorder=3)
+        else:
+            ax.text(a, text_dy, f"{abs(wa):g} kN/m", horizontalalignment="center", verticalalignment="center", fontsize=6, zorder=3)
+
+
+# cargas trapezoidales (texto sobre cada extremo)
+class TrapezoidalType(LinearType):
+    kind = TRAPEZOIDAL
+    name = "trapezoidal"
+    view = TrapezoidalLoad
+
+    def draw_text(self, ax, a, b, wa, wb, text_dy):
+        ax.text(a, text_dy, f"{abs(wa):g} kN/m", horizontalalignment="center", verticalalignment="center", fontsize=6, zorder=3)
+        ax.text(b, text_dy, f"{abs(wb):g} kN/m", horizontalalignment="center", verticalalignment="center", fontsize=6, zorder=3)
+
+
+register(PointType())
+register(UniformType())
+register(TriangularType())
+register(TrapezoidalType())
+COUPLE = register(CoupleType())  # también para los momentos de reacción de los empotramientos
+
+
+# cargas de la tabla agrupadas por tipo: [(tipo, (start, end, w_start, w_end))] (rows: filas a usar, por defecto todas)
+def load_groups(loads, rows=None):
+    kind = loads["kind"]
+    groups = []
+    for load_type in LOAD_TYPES.values():
+        sel = kind == load_type.kind
+        if rows is not None:
+            sel &= rows
+        if sel.any():
+            groups.append((load_type, (loads["start"][sel], loads["end"][sel], loads["w_start"][sel], loads["w_end"][sel])))
+    return groups
+
+
+# grupo de cargas puntuales (posiciones, magnitudes)
+def point_group(pos, load):
+    pos = np.asarray(pos, dtype=float)
+    load = np.asarray(load, dtype=float)
+    return LOAD_TYPES[POINT], (pos, pos, load, load)
+
+
+# grupo de momentos concentrados (posiciones, momentos antihorarios)
+def couple_group(pos, moment):
+    pos = np.asarray(pos, dtype=float)
+    moment = np.asarray(moment, dtype=float)
+    return COUPLE, (pos, pos, moment, moment)
+
+
+# resultante R y su momento respecto a x = 0 de cada fila de la tabla de cargas
+def resultants(loads):
+    kind = loads["kind"]
+    R = np.zeros(len(kind))
+    Q = np.zeros(len(kind))
+    for load_type in LOAD_TYPES.values():
+        sel = kind == load_type.kind
+        if sel.any():
+            R[sel], Q[sel] = load_type.resultant(loads["start"][sel], loads["end"][sel], loads["w_start"][sel], loads["w_end"][sel])
+    return R, Q
@@ -0,0 +1,124 @@
+import numpy as np
+from analisis.polinomios import element_coefficients, horner, GAUSS_T, GAUSS_W
+
+
+# método de rigidez (elementos de viga de Euler-Bernoulli) para vigas hiperestáticas y en voladizo, con dos grados de
+# libertad por nodo (desplazamiento v hacia arriba y giro θ antihorario) ordenados [v0, θ0, v1, θ1, ...]
+# los nodos de carga no tienen apoyos y se condensan en forma exacta: los nodos de rigidez son los apoyos, cada tramo
+# entre apoyos es un elemento y las cargas de los elementos de la viga (cargas y momentos en los nodos y carga lineal
+# en cada elemento) se llevan a cargas consistentes del tramo con las funciones de forma cúbicas de Hermite, que son
+# exactas para vigas de Euler-Bernoulli (los voladizos pasan sus cargas al apoyo extremo como cuerpo rígido)
+# así la matriz de banda (3 diagonales sobre la principal) queda bien condicionada aunque la viga tenga 10^5 elementos;
+# se resuelve con scipy.linalg.solveh_banded para todos los casos de carga a la vez
+# con EI constante las reacciones no dependen de EI
+
+
+# matriz de rigidez en banda (forma superior de solveh_banded: ab[3 + i - j, j] = K[i, j])
+def banded_stiffness(x_nodes, EI=1):
+    h = np.diff(x_nodes)
+    k = EI / h**3
+    local = [[12 * k, 6 * h * k, -12 * k, 6 * h * k],
+             [None, 4 * h**2 * k, -6 * h * k, 2 * h**2 * k],
+             [None, None, 12 * k, -6 * h * k],
+             [None, None, None, 4 * h**2 * k]]
+    ab = np.zeros((4, 2 * len(x_nodes)))
+    e = np.arange(len(h))
+    for a in range(4):
+        for b in range(a, 4):
+            ab[3 + a - b, 2 * e + b] += local[a][b]
+    return ab
+
+
+# producto K @ D con K simétrica en banda (D: (2 n, casos))
+def banded_product(ab, D):
+    KD = ab[3][:, None] * D
+    for m in range(3):
+        o = 3 - m  # diagonal o sobre la principal
+        KD[:-o] += ab[m, o:, None] * D[o:]
+        KD[o:] += ab[m, o:, None] * D[:-o]
+    return KD
+
+
+# funciones de forma en x (y sus derivadas) y grados de libertad del tramo de cada x
+# fuera de los apoyos extremos: cuerpo rígido unido al apoyo (v = v_k + θ_k (x - x_k))
+def shape_functions(x_supports, x):
+    m = len(x_supports)
+    j = np.searchsorted(x_supports, x, side="right") - 1
+    inside = (j >= 0) & (j < m - 1)
+    k = np.clip(j, 0, max(m - 2, 0))
+    a = x_supports[k]
+    l = x_supports[np.minimum(k + 1, m - 1)] - a
+    t = np.divide(x - a, l, out=np.zeros_like(x), where=inside)
+    N = np.stack([1 - 3 * t**2 + 2 * t**3, l * (t - 2 * t**2 + t**3), 3 * t**2 - 2 * t**3, l * (t**3 - t**2)], axis=1)
+    dN = np.stack([6 * (t**2 - t) / np.where(inside, l, 1), 1 - 4 * t + 3 * t**2, 6 * (t - t**2) / np.where(inside, l, 1), 3 * t**2 - 2 * t], axis=1)
+    dofs = np.stack([2 * k, 2 * k + 1, 2 * k + 2, 2 * k + 3], axis=1)
+
+    # voladizos: el apoyo extremo toma la fuerza y su momento
+    edge = np.where(j < 0, 0, m - 1)
+    rigid = ~inside
+    zero = np.zeros(rigid.sum())
+    N[rigid] = np.stack([zero + 1, x[rigid] - x_supports[edge[rigid]], zero, zero], axis=1)
+    dN[rigid] = np.stack([zero, zero + 1, zero, zero], axis=1)
+    dofs[rigid] = np.stack([2 * edge[rigid], 2 * edge[rigid] + 1, 2 * edge[rigid], 2 * edge[rigid] + 1], axis=1)
+    return N, dN, dofs
+
+
+# fuerzas nodales (2 apoyos, casos) de cada caso (lista de grupos de cargas, ver analisis/registro.py)
+# de los polinomios de las cargas sin reacciones en los elementos de la viga: cargas y momentos sobre los nodos (saltos
+# de V y M, con un elemento más después del último nodo) y carga lineal de cada elemento (w = dV/ds, puntos de Gauss)
+def load_vectors(x_nodes, x_supports, cases):
+    h = np.diff(x_nodes)
+    x = np.append(x_nodes, x_nodes[-1] + max(x_nodes[-1] - x_nodes[0], 1))
+    gauss_x = (x_nodes[:-1, None] + h[:, None] * (1 + GAUSS_T) / 2).ravel()
+    points = np.concatenate([x_nodes, gauss_x])
+    N, dN, dofs = shape_functions(x_supports, points)
+
+    F = np.zeros((2 * len(x_supports), len(cases)))
+    for c, groups in enumerate(cases):
+        V, M = element_coefficients(x, groups)
+        V_R = np.concatenate([[0], horner(V[:-1], h)])  # valor a la izquierda de cada nodo
+        M_R = np.concatenate([[0], horner(M[:-1], h)])
+        P = V[:, 0] - V_R
+        C = -(M[:, 0] - M_R)  # momento antihorario C: M baja en C
+
+        s = h[:, None] * (1 + GAUSS_T) / 2
+        w = V[:-1, 1:2] + 2 * V[:-1, 2:3] * s + 3 * V[:-1, 3:4] * s**2
+        P_gauss = (w * h[:, None] / 2 * GAUSS_W).ravel()
+
+        forces = np.concatenate([P, P_gauss])
+        couples = np.concatenate([C, np.zeros(len(P_gauss))])
+        np.add.at(F[:, c], dofs, forces[:, None] * N + couples[:, None] * dN)
+    return F
+
+
+# reacciones de los apoyos (posiciones supports, fixed: empotramientos) para cada caso de carga
+# devuelve (reacciones en y, momentos de reacción antihorarios) con shape (casos, apoyos)
+# (apoyos en la misma posición se reparten la reacción en partes iguales)
+def stiffness_reactions(x_nodes, supports, fixed, cases, EI=1):
+    from scipy.linalg import solveh_banded
+    tol = 1e-9 * (x_nodes[-1] - x_nodes[0])
+    fixed = np.asarray(fixed, dtype=bool)
+    x_supports, node = np.unique(x_nodes[np.searchsorted(x_nodes, np.asarray(supports, dtype=float) - tol)], return_inverse=True)
+    m = len(x_supports)
+    restrained = np.zeros(2 * m, dtype=bool)
+    restrained[2 * node] = True
+    restrained[2 * node[fixed] + 1] = True
+
+    K = banded_stiffness(x_supports, EI)
+    F = load_vectors(x_nodes, x_supports, cases)
+
+    # desplazamientos nulos en los grados de libertad restringidos: filas y columnas de la identidad
+    A = K.copy()
+    j = np.arange(2 * m)
+    for b in range(4):
+        i = j - (3 - b)
+        A[b, restrained | ((i >= 0) & restrained[np.maximum(i, 0)])] = 0
+    A[3, restrained] = 1
+    D = solveh_banded(A, np.where(restrained[:, None], 0, F))
+
+    R = banded_product(K, D) - F
+    count = np.bincount(node, minlength=m)[node]
+    fixed_count = np.bincount(node, weights=fixed, minlength=m)[node]
+    yreactions = R[2 * node] / count[:, None]
+    mreactions = np.where(fixed[:, None], R[2 * node + 1] / np.maximum(fixed_count, 1)[:, None], 0)
+    return yreactions.T, mreactions.T
@@ -0,0 +1,148 @@
+import numpy as np
+from analisis.cache import new_cache, cached, cache_stats, clear_cache
+
+
+# diagramas con sympy compilados por firma estructural: vigas con los mismos tipos de nodo en el mismo orden (cargas,
+# sentido de las triangulares y tipo de apoyo) comparten las ecuaciones; las posiciones y cargas de los nodos son
+# símbolos y las ecuaciones se compilan una vez con sp.lambdify, las vigas siguientes se evalúan solo con numpy
+MAX_SIGNATURES = 64  # firmas guardadas (se descarta la usada hace más tiempo)
+COMPILED = new_cache(MAX_SIGNATURES)  # {firma: (funciones V, funciones M, V en tramos extendidos)}
+
+
+# firma de la viga: (tipo de nodo, sentido de la carga triangular o tipo de apoyo) de cada nodo sin agrupar
+def signature(nodes):
+    firma = []
+    for node in nodes:
+        if node.type == "support":
+            firma.append((node.type, node.objeto.type))
+        elif node.type.startswith("triangular"):
+            firma.append((node.type, node.objeto.a_d))
+        else:
+            firma.append((node.type, None))
+    return tuple(firma)
+
+
+# orden de los nodos en una misma posición: finales de cargas distribuidas, apoyos y cargas puntuales, inicios de cargas
+# distribuidas (cada carga avanza de su nodo inicial a su nodo final sin otro nodo entre ellos)
+def node_rank(node):
+    if node.type in ("support", "point_load"):
+        return 1
+    if node.type.startswith("triangular"):
+        inicio = (node.type == "triangular_load_min") == (node.objeto.a_d == "ascending")
+        return 2 if inicio else 0
+    return 2 if node.type == "distributed_load_L" else 0
+
+
+# nodos ordenados por posición y, en cada grupo de nodos coincidentes (starts: inicios de los grupos), por node_rank
+def ordered_nodes(nodes, starts):
+    group = np.repeat(np.arange(len(starts) - 1), np.diff(starts))
+    rank = [node_rank(node) for node in nodes]
+    return [nodes[i] for i in np.lexsort((rank, group))]
+
+
+# posiciones y cargas netas de los nodos (valores de los símbolos)
+def node_values(nodes):
+    return [node.pos for node in nodes], [node.load_neta for node in nodes]
+
+
+# ecuaciones de V y M por elemento con sympy (mismo avance nodo a nodo que el cálculo original): x, posiciones p y
+# cargas w de los nodos son símbolos; extended indica si V se evalúa en el tramo extendido del elemento
+def build_expressions(firma):
+    import sympy as sp
+    n = len(firma)
+    x = sp.Symbol("x")
+    p = sp.symbols(f"p0:{n}")
+    w = sp.symbols(f"w0:{n}")
+
+    V = []
+    M = []
+    extended = []
+    eqV = []
+    eqM = []
+    for i in range(n - 1):
+        node_type, detalle = firma[i]
+        subx = p[i] - p[0]
+        length = p[i + 1] - p[i]
+        X = p[i + 1]  # última estación del elemento
+        base = x - subx
+        ext = False
+
+        if node_type == "point_load" or node_type == "support":
+            eqV.append(w[i])
+            eqM.append(w[i] * base)
+
+        elif node_type == "distributed_load_L":
+            eq = w[i] * base
+            eqV.append(eq)
+            eqM.append(w[i] * base * (base / 2))
+
+        elif node_type == "distributed_load_R":
+            centro = p[i - 1] - p[0] + (p[i] - p[i - 1]) / 2
+            eqM[-1] = eqM[-1] * (x - centro)
+
+        elif node_type == "triangular_load_min" and detalle == "ascending":
+            altura = (w[i] / length) * base
+            eqV.append((altura * base) / 2)
+            eqM.append(((altura * base) / 2) * ((1 / 3) * base))
+            ext = True
+
+        elif node_type == "triangular_load_max" and detalle == "descending":
+            h = (w[i] / length) * base
+            k = w[i] - h
+            eqV.append((h * base) / 2 + k * base)
+            eqM.append(((h * base) / 2) * ((2 / 3) * base) + (k * base) * (base / 2))
+            ext = True
+
+        elif node_type == "triangular_load_min" and detalle == "descending":
+            centro = p[i - 1] - p[0] + (p[i] - p[i - 1]) * (1 / 3)
+            eqM[-1] = eqM[-1] * (x - centro)
+
+        elif node_type == "triangular_load_max" and detalle == "ascending":
+            centro = p[i - 1] - p[0] + (p[i] - p[i - 1]) * (2 / 3)
+            eqM[-1] = eqM[-1] * (x - centro)
+
+        V.append(sum(eqV))
+        M.append(sum(eqM))
+        extended.append(ext)
+
+        # al terminar la ecuación de la carga se reemplaza por su valor en el extremo del elemento
+        if node_type == "distributed_load_L":
+            eqV[-1] = eqV[-1].subs(x, X)
+            eqM[-1] = (w[i] * base).subs(x, X)
+        elif ext:
+            eqV[-1] = eqV[-1].subs(x, X)
+            eqM[-1] = ((w[i] * base) / 2).subs(x, X)
+
+    return (x, p, w), V, M, extended
+
+
+# compilar las ecuaciones de una firma a funciones de numpy f(x, p, w)
+def compile_signature(firma):
+    import sympy as sp
+    args, V, M, extended = build_expressions(firma)
+    V_functions = [sp.lambdify(args, eq, "numpy") for eq in V]
+    M_functions = [sp.lambdify(args, eq, "numpy") for eq in M]
+    return V_functions, M_functions, extended
+
+
+# funciones compiladas de la firma desde el cache (LRU)
+def compiled_diagrams(firma):
+    return cached(COMPILED, firma, lambda: compile_signature(firma))
+
+
+# estadísticas del cache
+def cache_info():
+    return cache_stats(COMPILED)
+
+
+def cache_clear():
+    clear_cache(COMPILED)
+
+
+# evaluar las funciones de cada elemento en sus estaciones (las ecuaciones constantes devuelven un escalar)
+def evaluate_compiled(functions, stations, p, w):
+    values = []
+    for f, X in zip(functions, stations):
+        X = np.asarray(X, dtype=float)
+        values.append(np.broadcast_to(np.asarray(f(X, p, w), dtype=float), X.shape))
+    return np.concatenate(values) if values else np.zeros(0)
@@ -0,0 +1,127 @@
+import numpy as np
+from constructores.LoadTable import POINT, TRAPEZOIDAL
+from analisis.registro import LOAD_TYPES
+from analisis.lote import batch_groups, batch_diagrams
+from analisis.base_unitaria import pieces
+from analisis.polinomios import GAUSS_T, GAUSS_W
+
+
+# vigas continuas de muchos tramos con apoyos simples (EI constante) por la ecuación de los tres momentos (Clapeyron):
+# M_{i-1} L_i + 2 M_i (L_i + L_{i+1}) + M_{i+1} L_{i+1} = -6 (∫ M0 x dx / L_i + ∫ M0 (L - x) dx / L_{i+1})
+# (M0: momento de cada tramo simplemente apoyado, x desde su apoyo izquierdo); sistema tridiagonal resuelto con
+# scipy.linalg.solve_banded para todos los casos de carga a la vez en O(tramos x casos)
+# V y M de cada tramo: tramo simplemente apoyado (analisis/lote.py) más la recta de los momentos de sus apoyos
+
+
+# ∫ M0 x dx y ∫ M0 (L - x) dx de una carga unitaria hacia arriba en u de un tramo simplemente apoyado de largo L
+def span_integrals(u, L):
+    return -u * (L - u) * (L + u) / 6, -u * (L - u) * (2 * L - u) / 6
+
+
+# cargas de los casos en cada tramo (coordenadas locales): cargas puntuales (caso, tramo, u, P) y trozos de cargas
+# lineales cortadas en los apoyos (caso, tramo, u, v, w(u), w(v)); cargas positivas hacia arriba
+def span_loads(x_supports, groups):
+    n_spans = len(x_supports) - 1
+    points = []
+    linear = []
+    for load_type, columns in groups:
+        case = np.repeat(np.arange(columns[0].shape[0]), columns[0].shape[1])
+        start, end, w_start, w_end = [column.ravel() for column in columns]
+        if load_type.kind == POINT:
+            span = np.clip(np.searchsorted(x_supports, start, side="right") - 1, 0, n_spans - 1)
+            points.append((case, span, start - x_supports[span], w_start))
+        else:
+            case, u, v, wu, wv = pieces(x_supports, case, start, end, w_start, w_end)
+            span = np.clip(np.searchsorted(x_supports, (u + v) / 2, side="right") - 1, 0, n_spans - 1)
+            linear.append((case, span, u - x_supports[span], v - x_supports[span], wu, wv))
+    empty = np.zeros(0)
+    points = [np.concatenate(column) for column in zip(*points)] if points else [empty.astype(int)] * 2 + [empty] * 2
+    linear = [np.concatenate(column) for column in zip(*linear)] if linear else [empty.astype(int)] * 2 + [empty] * 4
+    return points, linear
+
+
+# columnas (casos x tramos, k) de las cargas de cada viga simplemente apoyada (caso, tramo) con relleno de carga 0
+def pack(beam, n_beams, *columns):
+    order = np.argsort(beam, kind="stable")
+    beam = beam[order]
+    count = np.bincount(beam, minlength=n_beams)
+    rank = np.arange(len(beam)) - np.repeat(np.cumsum(count) - count, count)
+    packed = []
+    for column in columns:
+        table = np.zeros((n_beams, count.max(initial=0)))
+        table[beam, rank] = column[order]
+        packed.append(table)
+    return packed
+
+
+# resolver una viga continua para muchos casos de carga
+# spans: (tramos,) largos de los tramos (apoyos simples en 0 y al final de cada tramo)
+# cargas como en lote.solve_batch, con posiciones en toda la viga: cada fila es un caso de carga
+# n_points: estaciones por tramo (0 para calcular solo momentos en los apoyos y reacciones)
+# devuelve momentos en los apoyos y reacciones (casos, apoyos) y, con n_points > 0, x (tramos x n_points) y V, M (casos, x)
+def solve_continuous(spans, point_loads=None, distributed_loads=None, triangular_loads=None, trapezoidal_loads=None, n_points=11):
+    from scipy.linalg import solve_banded
+    spans = np.asarray(spans, dtype=float)
+    n_spans = len(spans)
+    x_supports = np.concatenate([[0], np.cumsum(spans)])
+    tables = [t for t in (point_loads, distributed_loads, triangular_loads, trapezoidal_loads) if t is not None]
+    n = max([len(t[0]) for t in tables], default=1)
+    groups = batch_groups(n, point_loads, distributed_loads, triangular_loads, trapezoidal_loads)
+    (p_case, p_span, p_u, P), (l_case, l_span, l_u, l_v, l_wu, l_wv) = span_loads(x_supports, groups)
+
+    # ∫ M0 x dx (hacia el apoyo derecho) e ∫ M0 (L - x) dx (hacia el izquierdo) de cada tramo y caso, y resultantes:
+    # cargas puntuales y cargas lineales en sus puntos de Gauss como fuerzas en u
+    half = (l_v - l_u) / 2
+    u = np.concatenate([p_u] + [(l_u + l_v) / 2 + half * t for t in GAUSS_T])
+    force = np.concatenate([P] + [(l_wu * (1 - t) + l_wv * (1 + t)) / 2 * half * weight for t, weight in zip(GAUSS_T, GAUSS_W)])
+    beam = np.concatenate([p_case * n_spans + p_span] + [l_case * n_spans + l_span] * len(GAUSS_T))
+    I_right, I_left = span_integrals(u, np.tile(spans, n)[beam])
+
+    def per_span(values):
+        return np.bincount(beam, weights=values, minlength=n * n_spans).reshape(n, n_spans)
+    right = per_span(force * I_right)
+    left = per_span(force * I_left)
+    R = per_span(force)
+    Q = per_span(force * u)  # momento respecto al apoyo izquierdo del tramo
+
+    # momentos en los apoyos interiores (sistema tridiagonal, una columna por caso); extremos con M = 0
+    # (matriz de banda (1, 1) de solve_banded: también resuelve el sistema 1 x 1 de dos tramos)
+    moments = np.zeros((n, n_spans + 1))
+    if n_spans > 1:
+        ab = np.zeros((3, n_spans - 1))
+        ab[0, 1:] = spans[1:-1]
+        ab[1] = 2 * (spans[:-1] + spans[1:])
+        ab[2, :-1] = spans[1:-1]
+        rhs = -6 * (right[:, :-1] / spans[:-1] + left[:, 1:] / spans[1:])
+        moments[:, 1:-1] = solve_banded((1, 1), ab, rhs.T).T
+
+    # reacciones: tramo simplemente apoyado más la diferencia de momentos de sus apoyos
+    B0 = -Q / spans
+    A0 = -R - B0
+    dM = np.diff(moments, axis=1) / spans
+    reactions = np.zeros((n, n_spans + 1))
+    reactions[:, :-1] += A0 + dM
+    reactions[:, 1:] += B0 - dM
+    if n_points == 0:
+        return moments, reactions
+
+    # diagramas: cada (caso, tramo) es una viga simplemente apoyada (solo la reacción izquierda en las estaciones: en el
+    # apoyo derecho V es el límite por la izquierda, el tramo siguiente da el límite por la derecha)
+    n_beams = n * n_spans
+    L = np.tile(spans, n)
+    t = np.linspace(0, 1, n_points)
+    x_local = L[:, None] * t
+    beam_groups = []
+    if len(P):
+        pos, load = pack(p_case * n_spans + p_span, n_beams, p_u, P)
+        beam_groups.append((LOAD_TYPES[POINT], (pos, pos, load, load)))
+    if len(l_u):
+        beam_groups.append((LOAD_TYPES[TRAPEZOIDAL], tuple(pack(l_case * n_spans + l_span, n_beams, l_u, l_v, l_wu, l_wv))))
+    V, M = batch_diagrams(x_local, np.zeros((n_beams, 1)), A0.reshape(n_beams, 1), beam_groups)
+
+    M_left = moments[:, :-1].reshape(n_beams, 1)
+    M_right = moments[:, 1:].reshape(n_beams, 1)
+    V += (M_right - M_left) / L[:, None]
+    M += M_left * (1 - t) + M_right * t
+    x = (x_supports[:-1, None] + spans[:, None] * t).ravel()
+    return moments, reactions, x, V.reshape(n, -1), M.reshape(n, -1)
@@ -0,0 +1,181 @@
+import numpy as np
+from types import MappingProxyType
+from constructores.CriticalPoints import CriticalPoints
+from analisis.polinomios import element_coefficients, evaluate, evaluate_points
+from analisis.registro import load_groups, point_group, couple_group
+from analisis.puntos_criticos import critical_points
+from analisis.muestreo import sample_elements, valid_sampling
+from analisis.deflexion import deflection_coefficients, evaluate_continuous, max_deflection
+
+
+LOAD_COLUMNS = ("kind", "start", "end", "w_start", "w_end")
+
+
+# creador de resultados de una viga resuelta (Beam.solve()): copia inmutable de los datos de la viga (arrays de solo
+# lectura y diccionarios de solo lectura con MappingProxyType); los polinomios, los diagramas muestreados, los puntos
+# críticos y la deflexión se calculan al pedirlos y quedan guardados
+class BeamResult:
+    __slots__ = ("L", "EI", "supports", "reactions", "moments", "fixed", "x_nodes", "loads", "sampling", "computed")
+
+    def __init__(self, L, supports, reactions, x_nodes, loads, sampling=100, coef=None, EI=1, moments=None, fixed=None):
+        values = {
+            "L": L,  # largo viga
+            "EI": EI,  # rigidez a flexión
+            "supports": np.array(supports, dtype=float),  # posiciones de los apoyos
+            "reactions": np.array(reactions, dtype=float),  # reacciones en y de los apoyos
+            "moments": np.zeros(len(supports)) if moments is None else np.array(moments, dtype=float),  # momentos de reacción (antihorarios)
+            "fixed": np.zeros(len(supports), dtype=bool) if fixed is None else np.array(fixed, dtype=bool),  # apoyos empotrados
+            "x_nodes": self.shared(np.asarray(x_nodes, dtype=float)),  # posiciones de los nodos agrupados
+            "loads": MappingProxyType({name: self.frozen(loads[name]) for name in LOAD_COLUMNS}),  # columnas de la tabla de cargas
+            "sampling": sampling,  # política de muestreo por defecto
+            "computed": {},  # valores ya calculados (solo BeamResult escribe aquí; afuera se lee con cache)
+        }
+        for array in [values["supports"], values["reactions"], values["moments"], values["fixed"]]:
+            array.setflags(write=False)
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+        if coef is not None:
+            self.computed["polynomials"] = tuple(self.shared(c) for c in coef)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("BeamResult no se puede modificar")
+
+    # valores ya calculados (solo lectura)
+    @property
+    def cache(self):
+        return MappingProxyType(self.computed)
+
+    # pickle: datos y polinomios (los diagramas muestreados se vuelven a calcular al pedirlos)
+    def __getstate__(self):
+        state = {name: getattr(self, name) for name in self.__slots__ if name != "computed"}
+        state["loads"] = dict(self.loads)
+        state["coef"] = self.computed.get("polynomials")
+        return state
+
+    def __setstate__(self, state):
+        coef = state.pop("coef")
+        state["loads"] = MappingProxyType(state["loads"])
+        for name, value in state.items():
+            if isinstance(value, np.ndarray):
+                value.setflags(write=False)
+            object.__setattr__(self, name, value)
+        for array in state["loads"].values():
+            array.setflags(write=False)
+        object.__setattr__(self, "computed", {})
+        if coef is not None:
+            self.computed["polynomials"] = tuple(self.shared(c) for c in coef)
+
+    # el mismo array en solo lectura, sin copiar (x_nodes y polinomios de Beam: Beam los copia antes de escribir)
+    def shared(self, array):
+        array.setflags(write=False)
+        return array
+
+    # copia de solo lectura
+    def frozen(self, array):
+        array = np.array(array)
+        array.setflags(write=False)
+        return array
+
+    # (V, M) coeficientes de los polinomios de cada elemento
+    @property
+    def polynomials(self):
+        if "polynomials" not in self.computed:
+            groups = load_groups(self.loads) + [point_group(self.supports, self.reactions), couple_group(self.supports, self.moments)]
+            self.computed["polynomials"] = tuple(self.frozen(c) for c in element_coefficients(self.x_nodes, groups))
+        return self.computed["polynomials"]
+
+    # puntos críticos exactos de V y M
+    @property
+    def critical_points(self):
+        if "critical_points" not in self.computed:
+            V_coef, M_coef = self.polynomials
+            self.computed["critical_points"] = CriticalPoints(*critical_points(self.x_nodes, V_coef, M_coef))
+        return self.computed["critical_points"]
+
+    # (θ, δ) coeficientes de los polinomios de giro y deflexión de cada elemento
+    @property
+    def deflection_polynomials(self):
+        if "deflection_polynomials" not in self.computed:
+            theta, delta = deflection_coefficients(self.x_nodes, self.polynomials[1], self.EI, self.supports, self.fixed)
+            self.computed["deflection_polynomials"] = (self.frozen(theta), self.frozen(delta))
+        return self.computed["deflection_polynomials"]
+
+    # deflexión máxima en valor absoluto (x, δ)
+    @property
+    def max_deflection(self):
+        if "max_deflection" not in self.computed:
+            self.computed["max_deflection"] = max_deflection(self.x_nodes, *self.deflection_polynomials, self.L)
+        return self.computed["max_deflection"]
+
+    # llave del cache para una política de muestreo
+    def sampling_key(self, name, sampling):
+        if sampling is None:
+            sampling = self.sampling
+        return (name, tuple(sorted(sampling.items())) if isinstance(sampling, dict) else sampling), sampling
+
+    # (x, V, M) en los puntos de muestreo (sampling: int, {"spacing": dx} o {"tol": tol}; None usa self.sampling)
+    def diagrams(self, sampling=None):
+        key, sampling = self.sampling_key("diagrams", sampling)
+        if key not in self.computed:
+            if not valid_sampling(sampling):
+                return None
+            V_coef, M_coef = self.polynomials
+            x_ex, tramosX_ex = sample_elements(self.x_nodes, sampling, V_coef, M_coef)
+            self.computed[("tramos", key[1])] = tuple(self.shared(t) for t in tramosX_ex)  # x de cada elemento (para evaluar θ y δ en los mismos puntos)
+            self.computed[key] = (self.frozen(x_ex), self.frozen(evaluate(V_coef, self.x_nodes, tramosX_ex)), self.frozen(evaluate(M_coef, self.x_nodes, tramosX_ex)))
+        return self.computed[key]
+
+    def shear_force(self, sampling=None):
+        diagrams = self.diagrams(sampling)
+        if diagrams is None:
+            return None
+        x, V, M = diagrams
+        return V, x
+
+    def bending_moment(self, sampling=None):
+        diagrams = self.diagrams(sampling)
+        if diagrams is None:
+            return None
+        x, V, M = diagrams
+        return M
+
+    # (x, θ, δ) en los mismos puntos de muestreo que V y M
+    def deflection_diagrams(self, sampling=None):
+        key, sampling = self.sampling_key("deflection", sampling)
+        if key not in self.computed:
+            diagrams = self.diagrams(sampling)
+            if diagrams is None:
+                return None
+            x = diagrams[0]
+            tramosX_ex = self.computed[("tramos", key[1])]
+            theta, delta = self.deflection_polynomials
+            self.computed[key] = (x, self.frozen(evaluate(theta, self.x_nodes, tramosX_ex)), self.frozen(evaluate(delta, self.x_nodes, tramosX_ex)))
+        return self.computed[key]
+
+    def slope(self, sampling=None):
+        diagrams = self.deflection_diagrams(sampling)
+        if diagrams is None:
+            return None
+        x, theta, delta = diagrams
+        return theta
+
+    def deflection(self, sampling=None):
+        diagrams = self.deflection_diagrams(sampling)
+        if diagrams is None:
+            return None
+        x, theta, delta = diagrams
+        return delta
+
+    # V y M exactos en x arbitrarios (side="right" o "left": límite en los nodos con saltos)
+    def shear_at(self, xs, side="right"):
+        return evaluate_points(self.polynomials[0], self.x_nodes, xs, side)
+
+    def moment_at(self, xs, side="right"):
+        return evaluate_points(self.polynomials[1], self.x_nodes, xs, side)
+
+    # θ y δ exactos en x arbitrarios (continuos en los nodos)
+    def slope_at(self, xs):
+        return evaluate_continuous(self.deflection_polynomials[0], self.x_nodes, xs)
+
+    def deflection_at(self, xs):
+        return evaluate_continuous(self.deflection_polynomials[1], self.x_nodes, xs)
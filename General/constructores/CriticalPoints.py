@@ -0,0 +1,38 @@
+import numpy as np
+
+
+# creador de puntos críticos de los diagramas de fuerza cortante y momento flector (inmutable: atributos fijos y arrays
+# de solo lectura, se comparte entre todos los que piden BeamResult.critical_points)
+class CriticalPoints:
+    __slots__ = ("V_max", "V_min", "M_max", "M_min", "extrema", "contraflexure", "jumps", "M_abs_max")
+
+    def __init__(self, V_max, V_min, M_max, M_min, extrema, contraflexure, jumps):
+        values = {
+            "V_max": V_max,  # (x, V) fuerza cortante máxima
+            "V_min": V_min,  # (x, V) fuerza cortante mínima
+            "M_max": M_max,  # (x, M) momento flector máximo
+            "M_min": M_min,  # (x, M) momento flector mínimo
+            "extrema": extrema,  # (x, M, índice de elemento) extremos locales de M (V = 0 o cambio de signo de V en un nodo)
+            "contraflexure": contraflexure,  # x de los puntos de inflexión (M = 0 dentro de un elemento)
+            "jumps": jumps,  # (x, salto V, salto M) saltos en nodos interiores
+        }
+        # momento flector máximo en valor absoluto
+        values["M_abs_max"] = M_min if abs(M_min[1]) > abs(M_max[1]) else M_max
+        for name, value in values.items():
+            object.__setattr__(self, name, self.frozen(value))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("CriticalPoints no se puede modificar")
+
+    # pickle: se vuelve a crear con los mismos valores
+    def __reduce__(self):
+        return CriticalPoints, (self.V_max, self.V_min, self.M_max, self.M_min, self.extrema, self.contraflexure, self.jumps)
+
+    # tuplas de valores y arrays de solo lectura (copias)
+    def frozen(self, value):
+        if isinstance(value, tuple):
+            return tuple(self.frozen(item) for item in value)
+        if isinstance(value, np.ndarray):
+            value = value.copy()
+            value.setflags(write=False)
+        return value
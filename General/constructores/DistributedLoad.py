@@ -1,11 +1,20 @@
-# creador de cargas distribuidas
-class DistributedLoad:
-    def __init__(self, start_pos, end_pos, load, d="down", node_id=None):
-        self.type = "distributed"
-        self.start_pos = start_pos  # posición inicial
-        self.end_pos = end_pos  # posición final
-        self.length = end_pos - start_pos  # longitud
-        self.pos = (start_pos + end_pos) / 2
-        self.load = load  # magnitud carga
-        self.d = d  # dirección carga ('up' o 'down')
-        self.node_id = node_id  # id nodo
+from constructores.LoadView import LoadView
+
+
+# creador de cargas distribuidas (vista de la tabla de cargas)
+class DistributedLoad(LoadView):
+    __slots__ = ()
+    type = "distributed"
+
+    @property
+    def pos(self):
+        return (self.start_pos + self.end_pos) / 2
+
+    @property
+    def load(self):  # magnitud carga
+        return float(self.table["w_start"][self.index])
+
+    @property
+    def node_id(self):  # id nodos
+        node_id = int(self.table["node"][self.index]) + 1
+        return [node_id, node_id + 1]
@@ -1,5 +1,7 @@
 # creador de elementos
 class Element:
+    __slots__ = ("l_node", "r_node", "length", "subx")
+
     def __init__(self, l_node, r_node, subx=0):
         self.l_node = l_node  # nodo en extremo izquierdo
         self.r_node = r_node  # nodo en extremo derecho
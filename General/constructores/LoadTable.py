@@ -0,0 +1,38 @@
+import numpy as np
+from constructores.Table import Table
+
+
+# tipos de carga
+POINT = 0
+DISTRIBUTED = 1
+TRIANGULAR = 2
+TRAPEZOIDAL = 3
+MOMENT = 4
+KIND_NAMES = ("point", "distributed", "triangular", "trapezoidal", "moment")
+
+
+# creador de tabla columnar de cargas
+# carga puntual: start = end = posición, w_start = w_end = magnitud
+# cargas distribuidas: carga lineal de w_start (en start) a w_end (en end)
+# momento concentrado: start = end = posición, w_start = w_end = momento (positivo antihorario)
+# magnitudes con signo (positivo hacia arriba, negativo hacia abajo)
+class LoadTable(Table):
+    __slots__ = ("cases",)
+
+    def __init__(self, capacity=16):
+        super().__init__({
+            "kind": np.int8,  # tipo de carga (ver KIND_NAMES y analisis/registro.py)
+            "start": np.float64,  # posición inicial
+            "end": np.float64,  # posición final
+            "w_start": np.float64,  # carga en la posición inicial
+            "w_end": np.float64,  # carga en la posición final
+            "case": np.int32,  # índice del caso de carga en cases
+            "node": np.int64,  # índice del primer nodo de la carga en la tabla de nodos
+        }, capacity)
+        self.cases = []  # nombres de los casos de carga
+
+    # índice de un caso de carga (lo agrega si no existe)
+    def case_index(self, name):
+        if name not in self.cases:
+            self.cases.append(name)
+        return self.cases.index(name)
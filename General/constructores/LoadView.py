@@ -0,0 +1,33 @@
+# vista de una fila de la tabla de cargas (acceso por objeto sin copiar los datos)
+class LoadView:
+    __slots__ = ("table", "index")
+
+    def __init__(self, table, index):
+        self.table = table  # tabla de cargas (LoadTable)
+        self.index = index  # fila en la tabla
+
+    @property
+    def start_pos(self):  # posición inicial
+        return float(self.table["start"][self.index])
+
+    @property
+    def end_pos(self):  # posición final
+        return float(self.table["end"][self.index])
+
+    @property
+    def length(self):  # longitud
+        return self.end_pos - self.start_pos
+
+    @property
+    def d(self):  # dirección carga ('up' o 'down')
+        if self.load > 0:
+            return "up"
+        return "down"
+
+    @property
+    def case(self):  # caso de carga
+        return self.table.cases[self.table["case"][self.index]]
+
+    @property
+    def node_id(self):  # id nodo
+        return int(self.table["node"][self.index]) + 1
@@ -0,0 +1,21 @@
+from constructores.LoadView import LoadView
+
+
+# creador de momentos concentrados (vista de la tabla de cargas)
+class MomentLoad(LoadView):
+    __slots__ = ()
+    type = "moment"
+
+    @property
+    def pos(self):  # posición momento
+        return self.start_pos
+
+    @property
+    def load(self):  # momento (positivo antihorario)
+        return float(self.table["w_start"][self.index])
+
+    @property
+    def d(self):  # sentido del momento ('clockwise' o 'counterclockwise')
+        if self.load > 0:
+            return "counterclockwise"
+        return "clockwise"
@@ -1,10 +1,13 @@
 # creador de nodos
 class Node:
+    __slots__ = ("type", "pos", "load", "load_num", "load_neta", "id", "objeto", "components")
+
     def __init__(self, node_type, pos, node_id, objeto):
-        self.type = node_type  # tipo de nodo ('support', 'point_load', 'support_load', 'distributed_load_L', 'distributed_load_R', 'triangular_load_min', 'triangular_load_max')
+        self.type = node_type  # tipo de nodo ('support', 'point_load', 'distributed_load_L', 'distributed_load_R', 'triangular_load_min', 'triangular_load_max', 'trapezoidal_load_min', 'trapezoidal_load_max', 'moment_load', 'group')
         self.pos = pos  # posición nodo
-        self.load = None  # carga en nodo
+        self.load = None  # carga en nodo (lista con la carga de cada componente en nodos 'group')
         self.load_num = None  # número de cargas en el nodo
-        self.load_neta = None  # carga neta en el nodo
+        self.load_neta = None  # carga neta en el nodo (en nodos 'group': suma de apoyos y cargas puntuales)
         self.id = node_id  # id nodo
         self.objeto = objeto
+        self.components = [self]  # nodos agrupados en este nodo (nodos 'group': todos los nodos coincidentes)
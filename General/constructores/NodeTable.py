@@ -0,0 +1,27 @@
+import numpy as np
+from constructores.Table import Table
+
+
+# tipos de nodo
+SUPPORT = 0
+POINT_LOAD = 1
+DISTRIBUTED_LOAD_L = 2
+DISTRIBUTED_LOAD_R = 3
+TRIANGULAR_LOAD_MIN = 4
+TRIANGULAR_LOAD_MAX = 5
+TRAPEZOIDAL_LOAD_MIN = 6
+TRAPEZOIDAL_LOAD_MAX = 7
+MOMENT_LOAD = 8
+ROLE_NAMES = ("support", "point_load", "distributed_load_L", "distributed_load_R", "triangular_load_min", "triangular_load_max", "trapezoidal_load_min", "trapezoidal_load_max", "moment_load")
+
+
+# creador de tabla columnar de nodos (node id = índice + 1)
+class NodeTable(Table):
+    __slots__ = ()
+
+    def __init__(self, capacity=16):
+        super().__init__({
+            "pos": np.float64,  # posición nodo
+            "role": np.int8,  # tipo de nodo (ver ROLE_NAMES)
+            "ref": np.int64,  # índice del apoyo (role SUPPORT) o de la carga en la tabla de cargas
+        }, capacity)
@@ -1,8 +1,15 @@
-# creador de cargas puntuales
-class PointLoad:
-    def __init__(self, pos, load, d="down", node_id=None):
-        self.type = "point"
-        self.pos = pos  # posición carga
-        self.load = load  # magnitud carga
-        self.d = d  # dirección carga ('up' o 'down')
-        self.node_id = node_id  # id nodo
+from constructores.LoadView import LoadView
+
+
+# creador de cargas puntuales (vista de la tabla de cargas)
+class PointLoad(LoadView):
+    __slots__ = ()
+    type = "point"
+
+    @property
+    def pos(self):  # posición carga
+        return self.start_pos
+
+    @property
+    def load(self):  # magnitud carga
+        return float(self.table["w_start"][self.index])
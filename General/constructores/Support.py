@@ -1,7 +1,10 @@
 # creador de apoyos
 class Support:
+    __slots__ = ("type", "pos", "yreaction", "mreaction", "node_id")
+
     def __init__(self, support_type, pos, node_id):
-        self.type = support_type  # pinned , roller
+        self.type = support_type  # pinned , roller , fixed
         self.pos = pos  # posición apoyo
         self.yreaction = None  # reacción en y
+        self.mreaction = 0.0  # momento de reacción (empotramientos, positivo antihorario)
         self.node_id = node_id  # id nodo
@@ -0,0 +1,53 @@
+import numpy as np
+
+
+# creador de tablas columnares (un array de NumPy por columna, crecen por bloques)
+class Table:
+    __slots__ = ("n", "data")
+
+    def __init__(self, dtypes, capacity=16):
+        self.n = 0  # número de filas
+        self.data = {name: np.zeros(capacity, dtype=dtype) for name, dtype in dtypes.items()}  # {columna: array}
+
+    def __len__(self):
+        return self.n
+
+    # columna con las filas usadas (vista)
+    def __getitem__(self, name):
+        return self.data[name][:self.n]
+
+    # asegurar capacidad para extra filas (duplicando el tamaño)
+    def reserve(self, extra):
+        capacity = len(next(iter(self.data.values())))
+        if self.n + extra > capacity:
+            capacity = max(2 * capacity, self.n + extra)
+            for name, arr in self.data.items():
+                nuevo = np.zeros(capacity, dtype=arr.dtype)
+                nuevo[:self.n] = arr[:self.n]
+                self.data[name] = nuevo
+
+    # agregar filas (escalares o arrays del mismo largo); devuelve los índices de las nuevas filas
+    def extend(self, **columns):
+        count = max([np.size(value) for value in columns.values()], default=0)
+        self.reserve(count)
+        for name, value in columns.items():
+            self.data[name][self.n:self.n + count] = value
+        self.n += count
+        return np.arange(self.n - count, self.n)
+
+    # agregar una fila; devuelve su índice
+    def append(self, **columns):
+        self.reserve(1)
+        for name, value in columns.items():
+            self.data[name][self.n] = value
+        self.n += 1
+        return self.n - 1
+
+    # quitar filas (índices); las filas siguientes bajan de índice
+    def delete(self, rows):
+        keep = np.ones(self.n, dtype=bool)
+        keep[rows] = False
+        count = int(keep.sum())
+        for arr in self.data.values():
+            arr[:count] = arr[:self.n][keep]
+        self.n = count
@@ -0,0 +1,39 @@
+from constructores.LoadView import LoadView
+
+
+# creador de cargas distribuidas trapezoidales (vista de la tabla de cargas)
+class TrapezoidalLoad(LoadView):
+    __slots__ = ()
+    type = "trapezoidal"
+
+    @property
+    def start_load(self):  # carga inicial
+        return float(self.table["w_start"][self.index])
+
+    @property
+    def end_load(self):  # carga final
+        return float(self.table["w_end"][self.index])
+
+    @property
+    def load(self):  # magnitud carga máxima
+        if abs(self.end_load) > abs(self.start_load):
+            return self.end_load
+        return self.start_load
+
+    @property
+    def a_d(self):  # dirección carga ('ascending' o 'descending')
+        if abs(self.end_load) > abs(self.start_load):
+            return "ascending"
+        return "descending"
+
+    @property
+    def pos(self):  # posición de la resultante (resultante nula: punto medio, como en equivalent_loads)
+        total = self.start_load + self.end_load
+        if total == 0:
+            return self.start_pos + self.length / 2
+        return self.start_pos + self.length * (self.start_load + 2 * self.end_load) / (3 * total)
+
+    @property
+    def node_id(self):  # id nodos
+        node_id = int(self.table["node"][self.index]) + 1
+        return [node_id, node_id + 1]
@@ -1,16 +1,28 @@
-# creador de cargas distribuidas triangulares simples (comienzan o terminan con magnitud 0)
-class TriangularLoad:
-    def __init__(self, start_pos, end_pos, load, a_d, d="down", node_id=None):
-        self.type = "triangular"
-        self.start_pos = start_pos  # posición inicial
-        self.end_pos = end_pos  # posición final
-        self.length = end_pos - start_pos  # longitud
-        self.load = load  # magnitud carga
-        self.a_d = a_d  # dirección carga ('ascending' o 'descending')
-        self.d = d  # dirección carga ('up' o 'down')
-        self.node_id = node_id  # id nodo
-        # definir posición
-        if a_d == "ascending":
-            self.pos = start_pos + (2 / 3) * (end_pos - start_pos)
-        elif a_d == "descending":
-            self.pos = start_pos + (1 / 3) * (end_pos - start_pos)
+from constructores.LoadView import LoadView
+
+
+# creador de cargas distribuidas triangulares simples (comienzan o terminan con magnitud 0; vista de la tabla de cargas)
+class TriangularLoad(LoadView):
+    __slots__ = ()
+    type = "triangular"
+
+    @property
+    def a_d(self):  # dirección carga ('ascending' o 'descending')
+        if self.table["w_start"][self.index] == 0:
+            return "ascending"
+        return "descending"
+
+    @property
+    def load(self):  # magnitud carga
+        return float(self.table["w_start"][self.index] + self.table["w_end"][self.index])
+
+    @property
+    def pos(self):
+        if self.a_d == "ascending":
+            return self.start_pos + (2 / 3) * self.length
+        return self.start_pos + (1 / 3) * self.length
+
+    @property
+    def node_id(self):  # id nodos
+        node_id = int(self.table["node"][self.index]) + 1
+        return [node_id, node_id + 1]
@@ -0,0 +1,8 @@
+# Configuración de pytest para las pruebas de General: los módulos (Beam, analisis, constructores) se importan desde
+# General sin instalar el paquete
+# Ejecutar desde General: python -m pytest -q test
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,54 @@
+# Lotes con la base de respuestas unitarias: mismos resultados que lote.solve_batch
+# Ejecutar desde General: python -m pytest -q test
+
+import numpy as np
+
+from analisis.lote import solve_batch
+from analisis import base_unitaria
+
+
+def loads(L, seed):
+    rng = np.random.default_rng(seed)
+    n = len(L)
+    start = rng.uniform(0, 0.5, (n, 2)) * L[:, None]
+    end = start + rng.uniform(0, 0.5, (n, 2)) * L[:, None]
+    return dict(point_loads=(np.round(rng.uniform(0, 1, (n, 3)), 2) * L[:, None], rng.uniform(1, 10, (n, 3))),
+                distributed_loads=(start, end, rng.uniform(1, 5, (n, 2))),
+                triangular_loads=(start, end, rng.uniform(1, 5, (n, 2)), np.where(rng.uniform(size=(n, 2)) < 0.5, "ascending", "descending")),
+                trapezoidal_loads=(start, end, rng.uniform(-2, 4, (n, 2)), rng.uniform(-2, 4, (n, 2))))
+
+
+def check(L, supports, seed=0):
+    kwargs = loads(L, seed)
+    expected = solve_batch(L, supports, **kwargs)
+    for _ in range(2):  # cache vacío y cache con las bases guardadas
+        for a, b in zip(expected, base_unitaria.solve_cached(L, supports, **kwargs)):
+            assert np.allclose(a, b, atol=1e-9)
+
+
+def test_one_layout_uses_basis():
+    base_unitaria.cache_clear()
+    L = np.full(300, 12.0)
+    check(L, np.stack([np.full(300, 2.0), np.full(300, 9.0)], axis=1))
+    assert base_unitaria.cache_info()["size"] == 1
+
+
+def test_few_beams_per_layout_direct():
+    base_unitaria.cache_clear()
+    L = np.random.default_rng(1).uniform(8, 20, 50)
+    check(L, np.stack([np.zeros(50), L], axis=1))
+    assert base_unitaria.cache_info()["size"] == 0
+
+
+def test_point_loads_only():
+    # solo cargas puntuales: media base con 101 estaciones, kernels directos con muchas estaciones y una carga
+    rng = np.random.default_rng(2)
+    L = np.full(300, 12.0)
+    supports = np.stack([np.zeros(300), L], axis=1)
+    point_loads = (rng.uniform(0, 12, (300, 2)), rng.uniform(1, 10, (300, 2)))
+    for n_points, size in ((101, 1), (1001, 0)):
+        base_unitaria.cache_clear()
+        expected = solve_batch(L, supports, point_loads=point_loads, n_points=n_points)
+        for a, b in zip(expected, base_unitaria.solve_cached(L, supports, point_loads=point_loads, n_points=n_points)):
+            assert np.allclose(a, b, atol=1e-9)
+        assert base_unitaria.cache_info()["size"] == size
@@ -0,0 +1,88 @@
+# Tren de cargas móvil: separaciones fuera de la grilla y elección entre ventana deslizante y FFT
+# Ejecutar desde General: python -m pytest -q test
+
+import numpy as np
+
+from Beam import Beam
+from analisis import carga_movil
+from analisis.carga_movil import moving_load_envelope, exact_envelope
+from analisis.influencia import influence_lines
+
+
+def beam(L):
+    viga = Beam(L)
+    viga.add_support("pinned", 0)
+    viga.add_support("roller", L)
+    return viga
+
+
+# envolvente de M con los ejes en sus posiciones exactas (eje 0 en la misma grilla)
+def exact_moment(offsets, loads, stations, L, step):
+    offsets = np.asarray(offsets, dtype=float)
+    res = []
+    for rel in (offsets - offsets.min(), offsets.max() - offsets):
+        lead = np.arange(-int(np.ceil(rel.max() / step - 1e-9)), int(np.ceil(L / step)) + 1) * step
+        M = np.zeros((len(stations), len(lead)))
+        for offset, load in zip(rel, loads):
+            pos = lead + offset
+            sobre = (pos >= 0) & (pos <= L)
+            M[:, sobre] += load * influence_lines("moment", stations, pos[sobre], 0, L)
+        res.append(M)
+    M = np.concatenate(res, axis=1)
+    return M.max(axis=1), M.min(axis=1)
+
+
+def test_off_grid_spacing_not_snapped():
+    # dos ejes de 1 a 0.33 (paso 0.1): un eje en el centro y el otro a 0.33, M = 3 + 0.5 · 5.67
+    stations, V_env, M_env = beam(12).moving_load([0, 0.33], [1, 1], stations=[6.0], n_steps=120)
+    assert np.isclose(M_env[0][0], 3 + 0.5 * (6 - 0.33))
+
+
+def test_off_grid_moment_matches_exact_positions():
+    rng = np.random.default_rng(3)
+    offsets = np.cumsum(np.r_[0, rng.random(9) * 2])
+    loads = rng.random(10) + 1
+    stations = np.linspace(0, 12, 25) + 0.0137
+    step = 0.1
+    M_max, M_min = exact_moment(offsets, loads, stations, 12, step)
+    V_env, M_env = moving_load_envelope(offsets, loads, stations, 0, 12, 12, step)
+    # la interpolación solo cambia M a menos de un paso de una estación: error del orden de carga · step
+    assert np.abs(M_env[0] - M_max).max() <= loads.max() * step
+    assert np.abs(M_env[1] - M_min).max() <= loads.max() * step
+
+
+def test_window_and_fft_agree():
+    offsets = [0, 0.33, 1.7, 4.05, 4.4]
+    loads = [3, 2, 5, 4, 1]
+    stations = np.linspace(0, 20, 41)
+    results = []
+    for fft_cost in (1e-9, 1e9):  # forzar FFT y ventana deslizante
+        carga_movil.FFT_COST = fft_cost
+        try:
+            results.append(moving_load_envelope(offsets, loads, stations, 0, 20, 20, 0.05))
+        finally:
+            carga_movil.FFT_COST = 1.0
+    for fft_env, window_env in zip(*results):
+        assert np.allclose(fft_env[0], window_env[0]) and np.allclose(fft_env[1], window_env[1])
+
+
+def test_exact_single_axle():
+    # un eje W: M máx = W s (L - s) / L con el eje sobre la estación; V máx = W (L - s) / L con el eje justo a la derecha
+    stations, V_env, M_env = beam(12).moving_load([0], [2], stations=[3.0, 6.0])
+    assert np.allclose(M_env[0], 2 * np.array([3 * 9, 6 * 6]) / 12) and np.allclose(M_env[2], [3, 6])
+    assert np.allclose(V_env[0], 2 * np.array([9, 6]) / 12) and np.allclose(V_env[1], -2 * np.array([3, 6]) / 12)
+
+
+def test_exact_bounds_fine_grid():
+    # la envolvente exacta contiene a la de una grilla fina y difiere en el orden del paso (también con voladizos; en los
+    # extremos de la viga V tiene el valor aislado con un eje justo en el extremo, que la grilla no alcanza)
+    rng = np.random.default_rng(5)
+    offsets = np.cumsum(np.r_[0, rng.random(7) * 2])
+    loads = rng.random(8) + 1
+    stations = np.linspace(0, 12, 37)
+    for xA, xB in ((0, 12), (2, 10)):
+        exact = exact_envelope(offsets, loads, stations, xA, xB, 12)
+        fine = moving_load_envelope(offsets, loads, stations, xA, xB, 12, 0.001)
+        for e, f in zip(exact, fine):
+            assert (e[0] >= f[0] - 1e-9).all() and (e[1] <= f[1] + 1e-9).all()
+            assert np.abs(e[0] - f[0])[1:-1].max() < 0.1 and np.abs(e[1] - f[1])[1:-1].max() < 0.1
@@ -0,0 +1,92 @@
+# Cargas agregadas desde arrays (add_*_loads): mismas tablas y resultados que agregarlas una por una
+# Ejecutar desde General: python -m pytest -q test
+
+import numpy as np
+
+from Beam import Beam
+
+
+def beam():
+    viga = Beam(12)
+    viga.add_support("pinned", 1)
+    viga.add_support("roller", 11)
+    return viga
+
+
+def same(a, b):
+    for name in ("kind", "start", "end", "w_start", "w_end", "case", "node"):
+        assert np.array_equal(a.loads[name], b.loads[name])
+    for name in ("pos", "role", "ref"):
+        assert np.array_equal(a.node_table[name], b.node_table[name])
+    ra, rb = a.solve(), b.solve()
+    assert np.allclose(ra.reactions, rb.reactions)
+    xs = np.linspace(0, 12, 241)
+    for side in ("left", "right"):
+        assert np.allclose(ra.shear_at(xs, side), rb.shear_at(xs, side))
+        assert np.allclose(ra.moment_at(xs, side), rb.moment_at(xs, side))
+
+
+def test_bulk_matches_single_calls():
+    rng = np.random.default_rng(17)
+    pos = rng.uniform(0, 12, 40)
+    P = rng.uniform(1, 9, 40)
+    d = np.where(rng.random(40) < 0.3, "up", "down")
+    start = rng.uniform(0, 8, 10)
+    end = start + rng.uniform(0.5, 4, 10)
+    w = rng.uniform(1, 5, 10)
+    w_end = rng.uniform(1, 5, 10)
+    a_d = np.where(rng.random(10) < 0.5, "ascending", "descending")
+    direction = np.where(rng.random(10) < 0.5, "clockwise", "counterclockwise")
+
+    bulk = beam()
+    bulk.add_point_loads(pos, P, d)
+    bulk.add_distributed_loads(start, end, w, case="L")
+    bulk.add_triangular_loads(start, end, w, a_d)
+    bulk.add_trapezoidal_loads(start, end, w, w_end, "up")
+    bulk.add_moment_loads(pos[:10], w, direction)
+
+    single = beam()
+    for i in range(40):
+        single.add_point_load(pos[i], P[i], d[i])
+    for i in range(10):
+        single.add_distributed_load(start[i], end[i], w[i], case="L")
+    for i in range(10):
+        single.add_triangular_load(start[i], end[i], w[i], a_d[i])
+    for i in range(10):
+        single.add_trapezoidal_load(start[i], end[i], w[i], w_end[i], "up")
+    for i in range(10):
+        single.add_moment_load(pos[i], w[i], direction[i])
+    same(bulk, single)
+
+
+def test_invalid_positions_skipped(capsys):
+    # las cargas fuera de la viga (o con end < start) no se agregan: error e índices de las agregadas
+    viga = beam()
+    indices = viga.add_distributed_loads([-1, 2, 5, 9], [3, 4, 4, 13], 2)
+    assert "! Error" in capsys.readouterr().out
+    assert list(indices) == [0]
+    assert np.array_equal(viga.loads["start"], [2])
+    assert len(viga.node_table["pos"]) == 2 + 2
+
+
+def test_empty_arrays():
+    # arrays vacíos: ninguna carga nueva y la viga sigue igual
+    viga = beam()
+    viga.add_point_load(4, 3)
+    before = viga.solve()
+    assert len(viga.add_point_loads([], [])) == 0
+    assert len(viga.add_triangular_loads([], [], [], "ascending")) == 0
+    assert len(viga.loads["kind"]) == 1
+    assert viga.solve() is before
+
+
+def test_single_load_invalid_position(capsys):
+    # add_load hace la misma validación que add_loads: fuera de [0, L] o end < start no se agrega
+    viga = beam()
+    assert viga.add_point_load(13, 2) is None
+    assert viga.add_distributed_load(-1, 4, 2) is None
+    assert viga.add_trapezoidal_load(6, 3, 1, 2) is None
+    assert viga.add_moment_load(12.5, 1) is None
+    assert capsys.readouterr().out.count("! Error") == 4
+    assert len(viga.loads["kind"]) == 0 and len(viga.node_table["pos"]) == 2
+    assert viga.add_distributed_load(0, 12, 2) == 0
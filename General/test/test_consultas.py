@@ -0,0 +1,50 @@
+# V y M exactos en x arbitrarios (shear_at, moment_at): límites por la izquierda y por la derecha en los nodos
+# Ejecutar desde General: python -m pytest -q test
+
+import numpy as np
+
+from Beam import Beam
+
+
+def result():
+    # voladizo a la izquierda (apoyos en 2 y 10), carga puntual 6 en 5, momento horario 4 en 7 y uniforme 1 de 0 a 12
+    viga = Beam(12)
+    viga.add_support("pinned", 2)
+    viga.add_support("roller", 10)
+    viga.add_point_load(5, 6)
+    viga.add_moment_load(7, 4)
+    viga.add_distributed_load(0, 12, 1)
+    return viga.solve()
+
+
+def test_side_limits_at_nodes():
+    r = result()
+    A, B = r.reactions
+    # apoyo A: V salta en la reacción; la carga puntual baja V en 6; el momento horario sube M en 4
+    assert np.isclose(r.shear_at(2, "right") - r.shear_at(2, "left"), A)
+    assert np.isclose(r.shear_at(5, "left") - r.shear_at(5, "right"), 6)
+    assert np.isclose(r.shear_at(7, "left"), r.shear_at(7, "right"))
+    assert np.isclose(r.moment_at(7, "right") - r.moment_at(7, "left"), 4)
+    assert np.isclose(r.moment_at(5, "left"), r.moment_at(5, "right"))
+    assert np.isclose(r.shear_at(10, "right") - r.shear_at(10, "left"), B)
+
+
+def test_beam_ends_and_outside():
+    # V por la izquierda en 0 y por la derecha en L quedan fuera de la viga: 0, igual que fuera de [0, L]
+    r = result()
+    assert r.shear_at(0, "left") == 0 and r.shear_at(12, "right") == 0
+    assert np.isclose(r.shear_at(0, "right"), 0) and np.isclose(r.shear_at(12, "left"), 0)
+    assert np.isclose(r.moment_at(12, "left"), 0, atol=1e-9)
+    assert not r.shear_at([-1, 13]).any() and not r.moment_at([-1, 13], "left").any()
+
+
+def test_closed_form_and_shape():
+    # entre nodos: sumas de fuerzas a la izquierda; el resultado conserva el shape de xs
+    r = result()
+    A, B = r.reactions
+    xs = np.linspace(0.05, 11.95, 240).reshape(8, 30)
+    V = -xs + A * (xs > 2) - 6 * (xs > 5) + B * (xs > 10)
+    M = -xs**2 / 2 + A * np.clip(xs - 2, 0, None) - 6 * np.clip(xs - 5, 0, None) + 4 * (xs > 7) + B * np.clip(xs - 10, 0, None)
+    assert r.shear_at(xs).shape == xs.shape
+    assert np.allclose(r.shear_at(xs), V)
+    assert np.allclose(r.moment_at(xs, "left"), M)
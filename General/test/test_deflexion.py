@@ -0,0 +1,63 @@
+# Giro y deflexión por integración cerrada de M: casos de tablas en vigas simplemente apoyadas y con voladizo
+# Ejecutar desde General: python -m pytest -q test
+
+import numpy as np
+
+from Beam import Beam
+
+
+def beam(L, supports, EI):
+    viga = Beam(L, EI=EI)
+    viga.add_support("pinned", supports[0])
+    viga.add_support("roller", supports[1])
+    return viga
+
+
+def test_uniform_load_simply_supported():
+    # δ(L/2) = -5wL⁴/384EI y θ en los extremos ∓wL³/24EI
+    w, L, EI = 2.0, 8.0, 300.0
+    viga = beam(L, (0, L), EI)
+    viga.add_distributed_load(0, L, w)
+    r = viga.solve()
+    assert np.isclose(r.deflection_at(L / 2), -5 * w * L**4 / (384 * EI))
+    assert np.allclose(r.slope_at([0, L]), [-w * L**3 / (24 * EI), w * L**3 / (24 * EI)])
+    assert np.allclose(r.deflection_at([0, L]), 0, atol=1e-12)
+    x, d = viga.max_deflection()
+    assert np.isclose(x, L / 2) and np.isclose(d, -5 * w * L**4 / (384 * EI))
+
+
+def test_point_load_simply_supported():
+    # carga puntual P en a: δ(x ≤ a) = -Pbx(L² - b² - x²)/6EIL
+    P, L, a, EI = 10.0, 6.0, 2.0, 50.0
+    b = L - a
+    viga = beam(L, (0, L), EI)
+    viga.add_point_load(a, P)
+    r = viga.solve()
+    xs = np.linspace(0, a, 21)
+    assert np.allclose(r.deflection_at(xs), -P * b * xs * (L**2 - b**2 - xs**2) / (6 * EI * L))
+    # el diagrama muestreado coincide con la evaluación exacta
+    x, theta, delta = r.deflection_diagrams()
+    assert np.allclose(delta, r.deflection_at(x))
+    assert np.allclose(theta, r.slope_at(x))
+
+
+def test_overhang_tip_load():
+    # apoyos en 0 y a, carga P en el extremo del voladizo (largo c): δ(a + c) = -Pc²(a + c)/3EI, δ(a/√3) = +Pca²/9√3EI
+    P, a, c, EI = 4.0, 6.0, 2.0, 10.0
+    viga = beam(a + c, (0, a), EI)
+    viga.add_point_load(a + c, P)
+    r = viga.solve()
+    assert np.isclose(r.deflection_at(a + c), -P * c**2 * (a + c) / (3 * EI))
+    assert np.isclose(r.deflection_at(a / np.sqrt(3)), P * c * a**2 / (9 * np.sqrt(3) * EI))
+    assert np.isclose(r.slope_at(a / np.sqrt(3)), 0, atol=1e-12)
+    x, d = viga.max_deflection()
+    assert np.isclose(x, a + c) and np.isclose(d, -P * c**2 * (a + c) / (3 * EI))
+
+
+def test_unloaded_overhangs_are_straight():
+    # voladizos a ambos lados sin cargas: rectas tangentes a la deflexión en los apoyos
+    viga = beam(10, (2, 8), 1)
+    viga.add_distributed_load(2, 8, 3)
+    r = viga.solve()
+    for support, end in ((2, 0), (8, 10)):
+        assert np.isclose(r.deflection_at(end), r.slope_at(support) * (end - support))
@@ -0,0 +1,72 @@
+# Edición incremental de cargas (agregar, mover y quitar): mismos polinomios que una viga nueva
+# Ejecutar desde General: python -m pytest -q test
+
+import numpy as np
+
+from Beam import Beam
+
+
+def fresh(loads, L=20.0):
+    viga = Beam(L)
+    viga.add_support("pinned", 2)
+    viga.add_support("roller", 17)
+    for method, args in loads:
+        getattr(viga, method)(*args)
+    return viga
+
+
+def same(viga, loads):
+    xs = np.linspace(0, 20, 401)
+    a = viga.solve()
+    b = fresh(loads).solve()
+    assert np.allclose(a.reactions, b.reactions, atol=1e-9)
+    for side in ("left", "right"):
+        assert np.allclose(a.shear_at(xs, side), b.shear_at(xs, side), atol=1e-9)
+        assert np.allclose(a.moment_at(xs, side), b.moment_at(xs, side), atol=1e-9)
+
+
+def test_random_edits():
+    rng = np.random.default_rng(3)
+    viga = fresh([])
+    viga.solve()
+    loads = []
+    for step in range(150):
+        op = rng.integers(0, 4) if loads else 0
+        if op <= 1:
+            kind = rng.integers(0, 4)
+            a = float(rng.integers(0, 20))
+            b = float(min(20, a + rng.integers(1, 6)))
+            if kind == 0:
+                method, args = "add_point_load", (a, float(rng.integers(1, 9)))
+            elif kind == 1:
+                method, args = "add_distributed_load", (a, b, float(rng.integers(1, 9)))
+            elif kind == 2:
+                method, args = "add_moment_load", (a, float(rng.integers(1, 9)))
+            else:
+                method, args = "add_trapezoidal_load", (a, b, float(rng.integers(1, 9)), float(rng.integers(1, 9)))
+            getattr(viga, method)(*args)
+            loads.append((method, args))
+        elif op == 2:
+            i = int(rng.integers(len(loads)))
+            viga.remove_load(i)
+            loads.pop(i)
+        else:
+            i = int(rng.integers(len(loads)))
+            method, args = loads[i]
+            length = args[1] - args[0] if method in ("add_distributed_load", "add_trapezoidal_load") else 0
+            a = float(rng.integers(0, 21 - int(length)))
+            viga.move_load(i, a)
+            loads[i] = (method, (a, a + length) + args[2:] if length or method in ("add_distributed_load", "add_trapezoidal_load") else (a,) + args[1:])
+        if step % 5 == 0:
+            same(viga, loads)
+    same(viga, loads)
+
+
+def test_result_not_changed_by_edits():
+    viga = fresh([("add_point_load", (5.0, 10.0))])
+    result = viga.solve()
+    M = result.moment_at([5.0, 10.0]).copy()
+    viga.add_distributed_load(0, 20, 2)
+    viga.move_load(0, 12.0)
+    viga.solve()
+    assert np.allclose(result.moment_at([5.0, 10.0]), M)
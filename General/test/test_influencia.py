@@ -0,0 +1,53 @@
+# Líneas de influencia en forma cerrada contra una viga resuelta para cada posición de la carga unitaria
+# Ejecutar desde General: python -m pytest -q test
+
+import numpy as np
+import pytest
+
+from Beam import Beam
+
+
+def beam(L=10, xA=2, xB=8):
+    viga = Beam(L)
+    viga.add_support("pinned", xA)
+    viga.add_support("roller", xB)
+    return viga
+
+
+def direct(positions):
+    # una viga con voladizos para cada posición de la carga unitaria hacia abajo
+    results = []
+    for p in positions:
+        viga = beam()
+        viga.add_point_load(p, 1)
+        results.append(viga.solve())
+    return results
+
+
+positions = np.linspace(0, 10, 41)  # incluye los apoyos y las estaciones
+stations = np.array([0, 1, 2, 3.5, 5, 8, 9.5])
+
+
+@pytest.mark.parametrize("quantity", ["shear", "moment"])
+def test_lines_match_direct_solves(quantity):
+    lines = beam().influence_line(quantity, stations, positions)
+    assert lines.shape == (len(stations), len(positions))
+    at = "shear_at" if quantity == "shear" else "moment_at"
+    expected = np.array([getattr(r, at)(stations) for r in direct(positions)]).T
+    assert np.allclose(lines, expected)
+
+
+def test_reaction_lines():
+    viga = beam()
+    expected = np.array([r.reactions for r in direct(positions)]).T
+    assert np.allclose(viga.influence_line("reaction", [2, 8], positions), expected)
+    assert np.allclose(viga.influence_line("reaction", 8, positions), expected[1])
+
+
+def test_invalid_requests(capsys):
+    viga = beam()
+    assert viga.influence_line("reaction", 5, positions) is None
+    assert viga.influence_line("torsion", 5, positions) is None
+    viga.add_support("roller", 10)
+    assert viga.influence_line("moment", 5, positions) is None
+    assert capsys.readouterr().out.count("! Error") == 3
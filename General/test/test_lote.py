@@ -0,0 +1,64 @@
+# Solver por lotes (solve_batch): cada fila igual a resolver su viga con Beam, con tablas de cargas con relleno o por filas
+# Ejecutar desde General: python -m pytest -q test
+
+import numpy as np
+
+from Beam import Beam
+from analisis.lote import solve_batch
+
+
+def beams(seed, n=20):
+    rng = np.random.default_rng(seed)
+    L = rng.uniform(5, 15, n)
+    supports = np.stack([rng.uniform(0, 0.3, n) * L, rng.uniform(0.7, 1, n) * L], axis=1)
+    count = rng.integers(0, 4, n)  # cargas por viga (filas de distinto largo)
+    point = [rng.uniform(0, 1, k) * l for k, l in zip(count, L)], [rng.uniform(-3, 9, k) for k in count]
+    start = [rng.uniform(0, 0.5, k) * l for k, l in zip(count, L)]
+    end = [s + rng.uniform(0.1, 0.5, len(s)) * l for s, l in zip(start, L)]
+    distributed = start, end, [rng.uniform(1, 5, k) for k in count]
+    triangular = start, end, [rng.uniform(1, 5, k) for k in count], [np.where(rng.random(k) < 0.5, "ascending", "descending") for k in count]
+    trapezoidal = start, end, [rng.uniform(-2, 4, k) for k in count], [rng.uniform(-2, 4, k) for k in count]
+    return L, supports, dict(point_loads=point, distributed_loads=distributed, triangular_loads=triangular, trapezoidal_loads=trapezoidal)
+
+
+def beam(i, L, supports, loads):
+    viga = Beam(L[i])
+    viga.add_support("pinned", supports[i, 0])
+    viga.add_support("roller", supports[i, 1])
+    pos, P = [t[i] for t in loads["point_loads"]]
+    viga.add_point_loads(pos, P)
+    viga.add_distributed_loads(*[t[i] for t in loads["distributed_loads"]])
+    viga.add_triangular_loads(*[t[i] for t in loads["triangular_loads"]])
+    start, end, start_load, end_load = [t[i] for t in loads["trapezoidal_loads"]]
+    viga.add_trapezoidal_loads(start, end, start_load, end_load)
+    return viga
+
+
+def test_rows_match_beam():
+    L, supports, loads = beams(2)
+    reactions, x, V, M = solve_batch(L, supports, **loads)
+    assert V.shape == M.shape == x.shape == (len(L), 101)
+    for i in range(len(L)):
+        r = beam(i, L, supports, loads).solve()
+        assert np.allclose(reactions[i], r.reactions)
+        assert np.allclose(M[i], r.moment_at(x[i], "left"))
+        assert np.allclose(V[i, 1:-1], r.shear_at(x[i, 1:-1], "left"))
+
+
+def test_padded_tables_and_reactions_only():
+    # tablas (n, k) con relleno de carga 0 dan lo mismo que las filas de distinto largo; n_points=0: solo reacciones
+    L, supports, loads = beams(3)
+    pos, P = loads["point_loads"]
+    k = max(len(p) for p in pos)
+    padded = np.zeros((len(L), k)), np.zeros((len(L), k))
+    for i, (p, w) in enumerate(zip(pos, P)):
+        padded[0][i, :len(p)] = p
+        padded[1][i, :len(w)] = w
+    ragged = solve_batch(L, supports, point_loads=loads["point_loads"])
+    assert all(np.allclose(a, b) for a, b in zip(ragged, solve_batch(L, supports, point_loads=padded)))
+    assert np.allclose(solve_batch(L, supports, **loads, n_points=0), solve_batch(L, supports, **loads)[0])
+
+
+def test_no_loads():
+    reactions, x, V, M = solve_batch([10, 12], [[0, 10], [2, 12]])
+    assert not reactions.any() and not V.any() and not M.any()
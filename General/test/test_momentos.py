@@ -0,0 +1,47 @@
+# Momentos concentrados: saltos de M en su nodo, V sin cambios y reacciones (estática y método de rigidez)
+# Ejecutar desde General: python -m pytest -q test
+
+import numpy as np
+import pytest
+
+from Beam import Beam
+
+
+@pytest.mark.parametrize("direction, jump", [("clockwise", 5), ("counterclockwise", -5)])
+def test_jump_simply_supported(direction, jump):
+    # momento de 5 en x = 4: reacciones ∓M/L, V constante y M salta en el nodo (sube si es horario)
+    viga = Beam(10)
+    viga.add_support("pinned", 0)
+    viga.add_support("roller", 10)
+    viga.add_moment_load(4, 5, direction)
+    r = viga.solve()
+    assert np.allclose(r.reactions, [-jump / 10, jump / 10])
+    assert np.isclose(r.moment_at(4, "right") - r.moment_at(4, "left"), jump)
+    assert np.allclose(r.shear_at(np.linspace(0.5, 9.5, 19)), -jump / 10)
+    assert np.isclose(r.moment_at(10, "left"), 0, atol=1e-12)
+    pos, load = viga.equivalent_loads()
+    assert np.allclose(pos, [4]) and np.allclose(load, [0])
+
+
+def test_jump_with_point_load_at_same_node():
+    # momento y carga puntual en la misma posición: V salta por la carga y M por el momento
+    viga = Beam(8)
+    viga.add_support("pinned", 0)
+    viga.add_support("roller", 8)
+    viga.add_point_load(3, 4)
+    viga.add_moment_load(3, 2, "counterclockwise")
+    r = viga.solve()
+    assert np.isclose(r.shear_at(3, "left") - r.shear_at(3, "right"), 4)
+    assert np.isclose(r.moment_at(3, "right") - r.moment_at(3, "left"), -2)
+
+
+def test_cantilever_tip_moment():
+    # empotrada en 0 con momento horario de 5 en el extremo: M = -5 en toda la viga, reacción antihoraria de 5
+    viga = Beam(6)
+    viga.add_support("fixed", 0)
+    viga.add_moment_load(6, 5)
+    r = viga.solve()
+    assert np.allclose(r.reactions, [0], atol=1e-9)
+    assert np.isclose(viga.supports[0].mreaction, 5)
+    assert np.allclose(r.moment_at(np.linspace(0, 5.9, 30)), -5)
+    assert np.isclose(r.moment_at(6, "left"), -5) and r.moment_at(6, "right") == 0
@@ -0,0 +1,35 @@
+# Políticas de muestreo: puntos por elemento y rechazo de políticas incorrectas
+# Ejecutar desde General: python -m pytest -q test
+
+import numpy as np
+
+from Beam import Beam
+from analisis.muestreo import valid_sampling
+
+
+def beam():
+    viga = Beam(10)
+    viga.add_support("pinned", 0)
+    viga.add_support("roller", 10)
+    viga.add_point_load(3, 5)
+    return viga
+
+
+def test_valid_policies():
+    viga = beam()
+    V, x = viga.shear_force(sampling=2)
+    assert np.allclose(x, [0, 3, 3, 10])
+    V, x = viga.shear_force(sampling={"spacing": 0.5})
+    assert np.allclose(np.diff(x[:7]), 0.5) and x[-1] == 10
+
+
+def test_invalid_policies_rejected(capsys):
+    viga = beam()
+    for sampling in (1, 0, 2.5, 3.0, True, "10", {"spacing": 0}, {"spacing": -1}, {"tol": 0}, {"points": 10}):
+        assert not valid_sampling(sampling)
+        assert viga.shear_force(sampling=sampling) is None
+        assert viga.deflection(sampling=sampling) is None
+        assert viga.envelope(sampling) is None
+    assert "! Error" in capsys.readouterr().out
+    viga.sampling = 1
+    assert viga.bending_moment() is None
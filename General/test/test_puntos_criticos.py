@@ -0,0 +1,49 @@
+# Puntos críticos exactos de V y M (critical_points): extremos, puntos de inflexión y saltos contra formas cerradas
+# Ejecutar desde General: python -m pytest -q test
+
+import numpy as np
+
+from Beam import Beam
+
+
+def beam(L, xA, xB):
+    viga = Beam(L)
+    viga.add_support("pinned", xA)
+    viga.add_support("roller", xB)
+    return viga
+
+
+def test_triangular_peak_inside_span():
+    # carga triangular creciente w0 en toda la luz: M máximo w0L²/9√3 en x = L/√3 (entre dos muestras)
+    w0, L = 6.0, 9.0
+    viga = beam(L, 0, L)
+    viga.add_triangular_load(0, L, w0, "ascending")
+    cp = viga.critical_points()
+    assert np.allclose(cp.M_max, (L / np.sqrt(3), w0 * L**2 / (9 * np.sqrt(3))))
+    assert np.allclose(cp.M_abs_max, cp.M_max)
+    assert np.allclose(cp.extrema[0], [L / np.sqrt(3)])
+    assert np.allclose(cp.V_max, (0, w0 * L / 6)) and np.allclose(cp.V_min, (L, -w0 * L / 3))
+    # ninguna muestra del diagrama supera el máximo exacto
+    assert max(viga.bending_moment()) <= cp.M_max[1] + 1e-12
+
+
+def test_overhang_extrema_and_contraflexure():
+    # uniforme 2 en 0..10 con apoyos en 0 y 8: RA = 7.5, M = 7.5x - x² hasta el apoyo B
+    viga = beam(10, 0, 8)
+    viga.add_distributed_load(0, 10, 2)
+    cp = viga.critical_points()
+    assert np.allclose(cp.M_max, (3.75, 14.0625))
+    assert np.allclose(cp.M_min, (8, -4))
+    assert np.allclose(cp.contraflexure, [7.5])
+    # extremos locales: V = 0 en 3.75 y cambio de signo de V en el apoyo B
+    assert np.allclose(cp.extrema[0], [3.75, 8]) and np.allclose(cp.extrema[1], [14.0625, -4])
+    assert np.allclose(cp.jumps[0], [8]) and np.allclose(cp.jumps[1], [12.5]) and np.allclose(cp.jumps[2], [0])
+
+
+def test_jumps_at_point_and_moment_loads():
+    viga = beam(10, 0, 10)
+    viga.add_point_load(4, 3)
+    viga.add_moment_load(7, 2)
+    x, jump_V, jump_M = viga.critical_points().jumps
+    assert np.allclose(x, [4, 7])
+    assert np.allclose(jump_V, [-3, 0]) and np.allclose(jump_M, [0, 2])
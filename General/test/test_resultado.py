@@ -0,0 +1,61 @@
+# BeamResult es inmutable: puntos críticos, cargas y cache no se pueden modificar, y se conservan al hacer pickle
+# Ejecutar desde General: python -m pytest -q test
+
+import pickle
+import numpy as np
+import pytest
+
+from Beam import Beam
+
+
+def result():
+    viga = Beam(10)
+    viga.add_support("pinned", 0)
+    viga.add_support("roller", 10)
+    viga.add_distributed_load(0, 10, 2)
+    viga.add_point_load(3, 5)
+    return viga, viga.solve()
+
+
+def test_critical_points_frozen():
+    _, r = result()
+    cp = r.critical_points
+    with pytest.raises(ValueError):
+        cp.extrema[0][0] = 1
+    with pytest.raises(ValueError):
+        cp.contraflexure[...] = 1
+    with pytest.raises(AttributeError):
+        cp.M_max = (0, 0)
+    assert r.critical_points is cp
+
+
+def test_loads_and_cache_frozen():
+    _, r = result()
+    r.deflection_diagrams()
+    with pytest.raises(ValueError):
+        r.loads["start"][0] = 3
+    with pytest.raises(TypeError):
+        r.loads["x"] = 1
+    with pytest.raises(TypeError):
+        r.cache["a"] = 1
+    with pytest.raises(AttributeError):
+        r.cache = {}
+    with pytest.raises(ValueError):
+        r.polynomials[1][0, 0] = 1
+    with pytest.raises(ValueError):
+        r.x_nodes[0] = 1
+
+
+def test_result_survives_beam_edits_and_pickle():
+    viga, r = result()
+    M = r.moment_at(3)
+    viga.move_load(1, 6)
+    viga.solve()
+    assert np.isclose(r.moment_at(3), M)
+    r2 = pickle.loads(pickle.dumps(r))
+    assert not r2.x_nodes.flags.writeable and not r2.loads["start"].flags.writeable
+    assert np.allclose(r2.bending_moment(), r.bending_moment())
+    with pytest.raises(TypeError):
+        r2.loads["x"] = 1
+    cp = pickle.loads(pickle.dumps(r.critical_points))
+    assert cp.M_abs_max == r.critical_points.M_abs_max
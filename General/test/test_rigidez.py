@@ -0,0 +1,100 @@
+# Vigas hiperestáticas y en voladizo por el método de rigidez: casos de tablas y combinaciones
+# Ejecutar desde General: python -m pytest -q test
+
+import numpy as np
+import pytest
+
+from Beam import Beam
+
+
+def beam(L, supports, w=None):
+    viga = Beam(L)
+    for support_type, pos in supports:
+        viga.add_support(support_type, pos)
+    if w is not None:
+        viga.add_distributed_load(0, L, w)
+    return viga
+
+
+def reactions(viga):
+    viga.calculate()
+    return [support.yreaction for support in viga.supports], [support.mreaction for support in viga.supports]
+
+
+def test_propped_cantilever():
+    # empotrada-apoyada con carga uniforme: 5wL/8, 3wL/8 y momento wL²/8 en el empotramiento
+    R, R_M = reactions(beam(10, [("fixed", 0), ("roller", 10)], w=2))
+    assert np.allclose(R, [12.5, 7.5])
+    assert np.allclose(R_M, [25, 0])
+
+
+def test_fixed_fixed():
+    # empotrada en ambos extremos con carga uniforme: wL/2 y momentos wL²/12 (antihorario a la izquierda)
+    R, R_M = reactions(beam(6, [("fixed", 0), ("fixed", 6)], w=4))
+    assert np.allclose(R, [12, 12])
+    assert np.allclose(R_M, [12, -12])
+
+
+def test_cantilever():
+    viga = beam(4, [("fixed", 0)])
+    viga.add_point_load(4, 5)
+    R, R_M = reactions(viga)
+    assert np.allclose(R, [5])
+    assert np.allclose(R_M, [20])
+    assert np.isclose(viga.solve().deflection_at(4), -5 * 4**3 / 3)
+
+
+def test_combination_moment_reactions():
+    # combinaciones y envolventes incluyen los momentos de reacción
+    viga = beam(10, [("fixed", 0), ("roller", 10)])
+    viga.add_distributed_load(0, 10, 2, case="D")
+    viga.add_point_load(5, 4, case="L")
+    viga.add_combination("1.2D", {"D": 1.2})
+    viga.add_combination("1.2D+1.6L", {"D": 1.2, "L": 1.6})
+    names, R, R_M, V, M, x = viga.combination_results()
+    assert np.allclose(R[0], [15, 9])
+    assert np.allclose(R_M[0], [30, 0])
+    assert np.allclose(R_M[1], [30 + 1.6 * 3 * 4 * 10 / 16, 0])
+    assert np.allclose(M[:, 0], -R_M[:, 0])
+    x, R_env, R_M_env, V_env, M_env = viga.envelope()
+    assert np.allclose(R_M_env[0], R_M.max(axis=0))
+    assert np.allclose(R_M_env[1], R_M.min(axis=0))
+
+
+@pytest.mark.parametrize("supports", [[], [("roller", 4)], [("pinned", 3), ("roller", 3)], [("fixed", 0), ("roller", 0)]])
+def test_invalid_supports(supports, capsys):
+    # sin apoyos, un solo apoyo simple o dos apoyos en la misma posición: mensaje de error y None
+    viga = beam(10, supports, w=2)
+    assert viga.solve() is None
+    assert viga.shear_force() is None
+    assert viga.combination_results() is None
+    assert "! Error" in capsys.readouterr().out
+
+
+def test_combination_simply_supported():
+    # casos resueltos como filas del solver por lotes: igual que resolver cada caso por separado
+    cargas = {"D": lambda v, case: v.add_distributed_load(0, 10, 2, case=case),
+              "L": lambda v, case: (v.add_point_load(3, 4, case=case), v.add_triangular_load(2, 6, 3, "ascending", case=case)),
+              "W": lambda v, case: v.add_moment_load(9, 5, case=case)}
+    viga = beam(10, [("pinned", 0), ("roller", 8)])
+    for name, add in cargas.items():
+        add(viga, name)
+    names, R, R_M, V, M, x = viga.combination_results()
+    assert names == list(cargas)
+    assert not R_M.any()
+    for i, add in enumerate(cargas.values()):
+        caso = beam(10, [("pinned", 0), ("roller", 8)])
+        add(caso, "default")
+        assert np.allclose(R[i], reactions(caso)[0])
+        assert np.allclose([caso.solve().shear_at(s) for s in (1, 4, 9)], [np.interp(s, x, V[i]) for s in (1, 4, 9)])
+
+
+@pytest.mark.parametrize("supports", [[("pinned", 0), ("roller", 10)], [("fixed", 0), ("roller", 10)]])
+def test_combination_without_loads(supports):
+    # sin cargas: V y M con una fila por caso (ninguna) y una columna por estación
+    viga = beam(10, supports)
+    viga.add_combination("1.2D", {"D": 1.2})
+    names, R, R_M, V, M, x = viga.combination_results()
+    assert V.shape == M.shape == (1, len(x))
+    assert not V.any() and not M.any()
+    assert np.allclose(R, 0)
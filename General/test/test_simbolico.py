@@ -0,0 +1,52 @@
+# Cálculo con sympy (referencia) contra el cálculo numérico, también con nodos coincidentes
+# Ejecutar desde General: python -m pytest -q test
+
+import numpy as np
+import pytest
+
+from Beam import Beam
+
+pytest.importorskip("sympy")
+
+
+def check(viga):
+    V, x = viga.shear_force(symbolic=True)
+    M = viga.bending_moment(symbolic=True)
+    nodes, elements, tramosX, tramosX_ex = viga.symbolic_layout()
+    x_M = np.concatenate(viga.symbolic_stations(elements, tramosX_ex)[1])
+    r = viga.solve()
+    # en los nodos V de sympy es el límite por la izquierda o por la derecha
+    assert (np.isclose(V, r.shear_at(x, side="left")) | np.isclose(V, r.shear_at(x, side="right"))).all()
+    assert np.allclose(M, r.moment_at(x_M))
+
+
+@pytest.mark.parametrize("build", [
+    lambda viga: (viga.add_point_load(10, 5), viga.add_point_load(4, 3)),  # carga puntual sobre un apoyo
+    lambda viga: (viga.add_point_load(4, 5), viga.add_point_load(4, 3)),  # cargas puntuales coincidentes
+    lambda viga: (viga.add_point_load(3, 5), viga.add_distributed_load(3, 7, 2), viga.add_point_load(7, 1)),
+    lambda viga: (viga.add_distributed_load(5, 9, 1), viga.add_distributed_load(1, 5, 2)),
+    lambda viga: (viga.add_point_load(6, 1), viga.add_triangular_load(2, 6, 3, "ascending"), viga.add_triangular_load(6, 10, 3, "descending")),
+])
+def test_coincident_nodes(build):
+    viga = Beam(10)
+    viga.add_support("pinned", 0)
+    viga.add_support("roller", 10)
+    build(viga)
+    check(viga)
+
+
+def test_sampling_passed_through():
+    viga = Beam(10)
+    viga.add_support("pinned", 0)
+    viga.add_support("roller", 10)
+    viga.add_point_load(10, 5)
+    viga.add_distributed_load(2, 6, 2)
+    for sampling in (5, {"spacing": 0.25}, {"tol": 1e-3}):
+        M = viga.bending_moment(symbolic=True, sampling=sampling)
+        nodes, elements, tramosX, tramosX_ex = viga.symbolic_layout(sampling)
+        x_M = np.concatenate(viga.symbolic_stations(elements, tramosX_ex)[1])
+        assert len(M) == len(x_M) and np.allclose(M, viga.solve().moment_at(x_M))
+    assert len(viga.bending_moment(symbolic=True, sampling=5)) == 3 * 5
+    # {"tol"}: los mismos puntos que el cálculo numérico
+    assert len(viga.bending_moment(symbolic=True, sampling={"tol": 1e-3})) == len(viga.bending_moment(sampling={"tol": 1e-3}))
+    assert viga.shear_force(symbolic=True, sampling=1) is None
@@ -0,0 +1,55 @@
+# Cargas superpuestas y coincidentes: cada carga se suma por separado sobre los elementos que cubre
+# Ejecutar desde General: python -m pytest -q test
+
+import numpy as np
+
+from Beam import Beam
+
+
+def beam(loads, L=10.0):
+    viga = Beam(L)
+    viga.add_support("pinned", 0)
+    viga.add_support("roller", L)
+    for method, args in loads:
+        getattr(viga, method)(*args)
+    return viga
+
+
+def test_partial_live_load_over_dead_load():
+    # carga muerta uniforme 2 en toda la viga y carga viva 3 entre 2 y 6: RA = 10 + 12·6/10
+    viga = beam([("add_distributed_load", (0, 10, 2)), ("add_distributed_load", (2, 6, 3))])
+    r = viga.solve()
+    assert np.allclose(r.reactions, [17.2, 14.8])
+    xs = np.linspace(0, 10, 41)
+    u = np.clip(xs - 2, 0, 4)  # largo de carga viva a la izquierda de x
+    assert np.allclose(r.shear_at(xs[1:-1]), (17.2 - 2 * xs - 3 * u)[1:-1])
+    assert np.allclose(r.moment_at(xs), 17.2 * xs - xs**2 - 3 * u * (xs - 2 - u / 2))
+
+
+def test_overlapping_loads_superpose():
+    # cargas distribuidas, triangulares y trapezoidales que se cruzan, y cargas puntuales en la misma posición:
+    # la viga con todas las cargas es la suma de las vigas con una carga cada una
+    loads = [("add_distributed_load", (1, 7, 2)),
+             ("add_triangular_load", (3, 9, 4, "ascending")),
+             ("add_trapezoidal_load", (0, 5, 1, 3)),
+             ("add_triangular_load", (4, 6, 2, "descending")),
+             ("add_point_load", (5, 6)),
+             ("add_point_load", (5, 3, "up")),
+             ("add_point_load", (6, 4))]
+    xs = np.linspace(0, 10, 401)
+    r = beam(loads).solve()
+    parts = [beam([load]).solve() for load in loads]
+    assert np.allclose(r.reactions, sum(np.asarray(p.reactions) for p in parts))
+    for side in ("left", "right"):
+        assert np.allclose(r.shear_at(xs, side), sum(p.shear_at(xs, side) for p in parts))
+        assert np.allclose(r.moment_at(xs, side), sum(p.moment_at(xs, side) for p in parts))
+
+
+def test_coincident_point_loads():
+    # dos cargas puntuales en la misma posición equivalen a una con la suma (salto de V en un solo nodo)
+    r = beam([("add_point_load", (4, 5)), ("add_point_load", (4, 3))]).solve()
+    single = beam([("add_point_load", (4, 8))]).solve()
+    assert np.allclose(r.reactions, single.reactions)
+    assert np.isclose(r.shear_at(4, "left") - r.shear_at(4, "right"), 8)
+    xs = np.linspace(0, 10, 101)
+    assert np.allclose(r.moment_at(xs), single.moment_at(xs))
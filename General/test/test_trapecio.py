@@ -0,0 +1,35 @@
+# Cargas trapezoidales: posición de la resultante, también con resultante nula (de +w a -w)
+# Ejecutar desde General: python -m pytest -q test
+
+import numpy as np
+import pytest
+
+from Beam import Beam
+
+
+def test_resultant_position():
+    viga = Beam(10)
+    viga.add_support("pinned", 0)
+    viga.add_support("roller", 10)
+    viga.add_trapezoidal_load(2, 6, 1, 3)
+    viga.add_trapezoidal_load(2, 6, 5, -5)  # autoequilibrada: resultante nula, posición en el punto medio
+    trapecio, equilibrada = viga.cargas
+    assert np.isclose(trapecio.pos, 2 + 4 * (1 + 2 * 3) / (3 * (1 + 3)))
+    assert equilibrada.pos == 4
+    pos, load = viga.equivalent_loads()
+    assert np.allclose(pos, [trapecio.pos, equilibrada.pos]) and np.allclose(load, [-8, 0])
+
+
+def test_draw_zero_loads():
+    # cargas con intensidad nula: sin flechas (antes dividía por la carga máxima, 0)
+    matplotlib = pytest.importorskip("matplotlib")
+    matplotlib.use("Agg")
+    viga = Beam(10)
+    viga.add_support("pinned", 0)
+    viga.add_support("roller", 10)
+    viga.add_distributed_load(0, 4, 0)
+    viga.add_trapezoidal_load(2, 6, 0, 0)
+    viga.add_moment_load(5, 0)
+    with np.errstate(all="raise"):
+        viga.draw_loads()
+    assert not viga.axes().patches
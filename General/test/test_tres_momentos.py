@@ -0,0 +1,55 @@
+# Vigas continuas por la ecuación de los tres momentos: comparación con el método de rigidez
+# Ejecutar desde General: python -m pytest -q test
+
+import numpy as np
+
+from Beam import Beam
+from analisis.tres_momentos import solve_continuous
+
+
+# reacciones y momentos en los apoyos de cada caso con el método de rigidez (Beam con apoyos simples en cada apoyo)
+def stiffness_case(spans, point, distributed):
+    x_supports = np.concatenate([[0], np.cumsum(spans)])
+    beam = Beam(x_supports[-1])
+    beam.add_support("pinned", 0)
+    for pos in x_supports[1:]:
+        beam.add_support("roller", pos)
+    for pos, load in zip(*point):
+        beam.add_point_load(pos, load)
+    for start, end, load in zip(*distributed):
+        beam.add_distributed_load(start, end, load)
+    beam.calculate()
+    result = beam.solve()
+    return np.array([support.yreaction for support in beam.supports]), result.moment_at(x_supports)
+
+
+def check_spans(spans, cases=3, seed=0):
+    rng = np.random.default_rng(seed)
+    L = np.sum(spans)
+    point = (rng.uniform(0, L, (cases, 4)), rng.uniform(1, 10, (cases, 4)))
+    start = rng.uniform(0, L / 2, (cases, 2))
+    distributed = (start, start + rng.uniform(0, L / 2, (cases, 2)), rng.uniform(1, 5, (cases, 2)))
+    moments, reactions, x, V, M = solve_continuous(spans, point_loads=point, distributed_loads=distributed)
+    for c in range(cases):
+        R, M_supports = stiffness_case(spans, [t[c] for t in point], [t[c] for t in distributed])
+        assert np.allclose(reactions[c], R, atol=1e-8)
+        assert np.allclose(moments[c], M_supports, atol=1e-8)
+
+
+def test_two_spans():
+    check_spans([4.0, 6.0])
+
+
+def test_three_spans():
+    check_spans([3.0, 5.0, 4.0])
+
+
+def test_many_spans():
+    check_spans(np.random.default_rng(1).uniform(2, 6, 12))
+
+
+def test_two_equal_spans_uniform_load():
+    # carga uniforme w en dos tramos iguales: M = -w L² / 8 en el apoyo central, reacciones 3wL/8, 10wL/8, 3wL/8
+    moments, reactions = solve_continuous([5.0, 5.0], distributed_loads=([[0.0]], [[10.0]], [[2.0]]), n_points=0)
+    assert np.allclose(moments, [[0, -2 * 25 / 8, 0]])
+    assert np.allclose(reactions, [[3 * 10 / 8, 10 * 10 / 8, 3 * 10 / 8]])